@@ -5,7 +5,9 @@ from decouple import config
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from starlette.responses import StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette import status
+from starlette.responses import Response, StreamingResponse, JSONResponse
 
 from chalicelib.utils import helper
 from chalicelib.utils import pg_client
@@ -31,6 +33,13 @@ async def or_middleware(request: Request, call_next):
     return response
 
 
+@app.exception_handler(pg_client.PoolTimeoutError)
+async def pg_pool_timeout_handler(request: Request, exc: pg_client.PoolTimeoutError):
+    logging.warning(f"{request.method} {request.url.path}: {exc}")
+    return JSONResponse(content={"errors": ["database busy, please retry"]},
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
 origins = [
     "*",
 ]
@@ -81,6 +90,11 @@ async def shutdown():
     await pg_client.terminate()
 
 
+@app.get('/private/metrics', tags=["private"])
+async def get_metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get('/private/shutdown', tags=["private"])
 async def stop_server():
     logging.info("Requested shutdown")
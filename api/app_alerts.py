@@ -3,6 +3,8 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from decouple import config
 from fastapi import FastAPI
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.responses import Response
 from chalicelib.utils import pg_client
 
 from chalicelib.core import alerts_processor
@@ -47,6 +49,11 @@ async def shutdown():
     await pg_client.terminate()
 
 
+@app.get('/private/metrics', tags=["private"])
+async def get_metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get('/private/shutdown', tags=["private"])
 async def stop_server():
     logging.info("Requested shutdown")
@@ -19,11 +19,12 @@ class JWTAuth(HTTPBearer):
             if not credentials.scheme == "Bearer":
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid authentication scheme.")
             jwt_payload = authorizers.jwt_authorizer(credentials.scheme + " " + credentials.credentials)
-            auth_exists = jwt_payload is not None \
-                          and users.auth_exists(user_id=jwt_payload.get("userId", -1),
-                                                tenant_id=jwt_payload.get("tenantId", -1),
-                                                jwt_iat=jwt_payload.get("iat", 100),
-                                                jwt_aud=jwt_payload.get("aud", ""))
+            auth_key = None if jwt_payload is None \
+                else {"user_id": jwt_payload.get("userId", -1), "tenant_id": jwt_payload.get("tenantId", -1),
+                      "jwt_iat": jwt_payload.get("iat", 100), "jwt_aud": jwt_payload.get("aud", "")}
+            # a token seen in the last AUTH_CACHE_TTL seconds needs neither auth_exists nor users.get
+            user = None if auth_key is None else users.get_cached_auth(**auth_key)
+            auth_exists = user is not None or auth_key is not None and users.auth_exists(**auth_key)
             if jwt_payload is None \
                     or jwt_payload.get("iat") is None or jwt_payload.get("aud") is None \
                     or not auth_exists:
@@ -42,10 +43,12 @@ class JWTAuth(HTTPBearer):
                     print("JWTAuth: not users.auth_exists")
 
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token or expired token.")
-            user = users.get(user_id=jwt_payload.get("userId", -1), tenant_id=jwt_payload.get("tenantId", -1))
             if user is None:
-                print("JWTAuth: User not found.")
-                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User not found.")
+                user = users.get(user_id=jwt_payload.get("userId", -1), tenant_id=jwt_payload.get("tenantId", -1))
+                if user is None:
+                    print("JWTAuth: User not found.")
+                    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User not found.")
+                users.cache_auth(**auth_key, user=user)
             jwt_payload["authorizer_identity"] = "jwt"
             print(jwt_payload)
             request.state.authorizer_identity = "jwt"
@@ -18,9 +18,9 @@ class ProjectAuthorizer:
         value = request.path_params[self.project_identifier]
         if (self.project_identifier == "projectId" \
             and (not (isinstance(value, int) or isinstance(value, str) and value.isnumeric())
-                 or projects.get_project(project_id=value, tenant_id=current_user.tenant_id) is None)) \
+                 or projects.get_lookup(project_id=value) is None)) \
                 or (self.project_identifier == "projectKey" \
-                    and projects.get_internal_project_id(project_key=value) is None):
+                    and projects.get_lookup(project_key=value) is None):
             print("project not found")
             print(value)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="project not found.")
@@ -34,20 +34,12 @@ def __exists_by_name(project_id: int, name: str, exclude_index: Optional[int]) -
 
 
 def get(project_id):
-    with pg_client.PostgresClient() as cur:
-        query = cur.mogrify(f"""SELECT {",".join(column_names())}
-                                FROM public.projects
-                                WHERE project_id = %(project_id)s 
-                                    AND deleted_at ISNULL
-                                LIMIT 1;""", {"project_id": project_id})
-        cur.execute(query=query)
-        metas = cur.fetchone()
-        results = []
-        if metas is not None:
-            for i, k in enumerate(metas.keys()):
-                if metas[k] is not None:
-                    results.append({"key": metas[k], "index": i + 1})
-        return results
+    # from the projects lookup cache: the functions writing the metadata columns invalidate it
+    # before reading them, so that their checks are not made against another worker's stale entry
+    lookup = projects.get_lookup(project_id=project_id)
+    if lookup is None:
+        return []
+    return [{"key": key, "index": index} for index, key in lookup["metadata"].items()]
 
 
 def get_batch(project_ids):
@@ -94,6 +86,7 @@ def __get_available_index(project_id):
 def __edit(project_id, col_index, colname, new_name):
     if new_name is None or len(new_name) == 0:
         return {"errors": ["key value invalid"]}
+    projects.invalidate_lookup(project_id)
     old_metas = get(project_id)
     old_metas = {k["index"]: k for k in old_metas}
     if col_index not in list(old_metas.keys()):
@@ -110,6 +103,7 @@ def __edit(project_id, col_index, colname, new_name):
             cur.execute(query=query)
             new_name = cur.fetchone()[colname]
             old_metas[col_index]["key"] = new_name
+    projects.invalidate_lookup(project_id)
     return {"data": old_metas[col_index]}
 
 
@@ -121,6 +115,7 @@ def edit(tenant_id, project_id, index: int, new_name: str):
 
 def delete(tenant_id, project_id, index: int):
     index = int(index)
+    projects.invalidate_lookup(project_id)
     old_segments = get(project_id)
     old_segments = [k["index"] for k in old_segments]
     if index not in old_segments:
@@ -140,11 +135,12 @@ def delete(tenant_id, project_id, index: int):
                                 """,
                             {"project_id": project_id})
         cur.execute(query=query)
-
+    projects.invalidate_lookup(project_id)
     return {"data": get(project_id)}
 
 
 def add(tenant_id, project_id, new_name):
+    projects.invalidate_lookup(project_id)
     index = __get_available_index(project_id=project_id)
     if index < 1:
         return {"errors": ["maximum allowed metadata reached"]}
@@ -159,6 +155,7 @@ def add(tenant_id, project_id, new_name):
                             {"key": new_name, "project_id": project_id})
         cur.execute(query=query)
         col_val = cur.fetchone()[colname]
+    projects.invalidate_lookup(project_id)
     return {"data": {"key": col_val, "index": index}}
 
 
@@ -245,6 +242,7 @@ def get_keys_by_projects(project_ids):
 
 
 def add_edit_delete(tenant_id, project_id, new_metas):
+    projects.invalidate_lookup(project_id)
     old_metas = get(project_id)
     old_indexes = [k["index"] for k in old_metas]
     new_indexes = [k["index"] for k in new_metas if "index" in k]
@@ -281,7 +279,7 @@ def add_edit_delete(tenant_id, project_id, new_metas):
         for k in new_metas.keys():
             if new_metas[k]["key"].lower() != old_metas[k]["key"]:
                 edit(tenant_id=tenant_id, project_id=project_id, index=k, new_name=new_metas[k]["key"])
-
+    projects.invalidate_lookup(project_id)
     return {"data": get(project_id)}
 
 
@@ -10,9 +10,14 @@ from chalicelib.core import tenants, assist
 from chalicelib.utils import email_helper
 from chalicelib.utils import helper
 from chalicelib.utils import pg_client
+from chalicelib.utils.ttl_cache import TTLCache
 from chalicelib.utils.TimeUTC import TimeUTC
 
 
+# the users resolved by JWTAuth, by (user_id, tenant_id, jwt_iat, jwt_aud) of the token: a hit saves the
+# auth_exists and get queries of an authenticated request
+__auth_cache = TTLCache("auth", ttl=config("AUTH_CACHE_TTL", cast=int, default=30))
+
 def __generate_invitation_token():
     return secrets.token_urlsafe(64)
 
@@ -167,6 +172,7 @@ def update(tenant_id, user_id, changes):
                                 (CASE WHEN users.role = 'member' THEN TRUE ELSE FALSE END) AS member;""",
                             {"user_id": user_id, **changes})
             )
+    invalidate_auth(user_id=user_id)
 
     return get(user_id=user_id, tenant_id=tenant_id)
 
@@ -465,6 +471,7 @@ def delete_member(user_id, tenant_id, id_to_delete):
                            SET password= NULL
                            WHERE user_id=%(user_id)s;""",
                         {"user_id": id_to_delete}))
+    invalidate_auth(user_id=id_to_delete)
     return {"data": get_members(tenant_id=tenant_id)}
 
 
@@ -593,7 +600,23 @@ def change_jwt_iat(user_id):
                        RETURNING jwt_iat;""",
             {"user_id": user_id})
         cur.execute(query)
-        return cur.fetchone().get("jwt_iat")
+        jwt_iat = cur.fetchone().get("jwt_iat")
+    invalidate_auth(user_id=user_id)
+    return jwt_iat
+
+
+def get_cached_auth(user_id, tenant_id, jwt_iat, jwt_aud):
+    return __auth_cache.get((user_id, tenant_id, jwt_iat, jwt_aud))
+
+
+def cache_auth(user_id, tenant_id, jwt_iat, jwt_aud, user):
+    __auth_cache.set((user_id, tenant_id, jwt_iat, jwt_aud), user)
+
+
+def invalidate_auth(user_id=None, tenant_id=None):
+    # called when a user, its password, role or jwt_iat change, and on logout
+    __auth_cache.delete_where(lambda key, user: (user_id is None or key[0] == user_id)
+                                                and (tenant_id is None or key[1] == tenant_id))
 
 
 def authenticate(email, password, for_change_password=False):
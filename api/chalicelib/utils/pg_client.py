@@ -1,12 +1,19 @@
 import logging
+import math
 import time
 from threading import Semaphore
 
+import psycopg
 import psycopg2
 import psycopg2.extras
+import psycopg_pool
 from decouple import config
+from psycopg.rows import dict_row
+from psycopg.types.string import TextLoader
 from psycopg2 import pool
 
+from chalicelib.utils import pg_metrics
+
 logging.basicConfig(level=config("LOGLEVEL", default=logging.INFO))
 logging.getLogger('apscheduler').setLevel(config("LOGLEVEL", default=logging.INFO))
 
@@ -21,19 +28,43 @@ if config("PG_TIMEOUT", cast=int, default=0) > 0:
     PG_CONFIG["options"] = f"-c statement_timeout={config('PG_TIMEOUT', cast=int) * 1000}"
 
 
+# seconds to wait for a pooled connection before giving up, 0 waits forever
+ACQUIRE_TIMEOUT = config("PG_POOL_ACQUIRE_TIMEOUT", cast=float, default=30)
+
+
+class PoolTimeoutError(psycopg2.pool.PoolError):
+    """
+    No connection of the pool was available within PG_POOL_ACQUIRE_TIMEOUT,
+    the API answers 503 instead of waiting for one
+    """
+
+    def __init__(self, name):
+        super().__init__(f"no connection available in the {name} pool after {ACQUIRE_TIMEOUT}s")
+
+
 class ORThreadedConnectionPool(psycopg2.pool.ThreadedConnectionPool):
-    def __init__(self, minconn, maxconn, *args, **kwargs):
+    def __init__(self, minconn, maxconn, *args, name="default", **kwargs):
+        self.name = name
         self._semaphore = Semaphore(maxconn)
         super().__init__(minconn, maxconn, *args, **kwargs)
+        pg_metrics.observe_pool(name, in_use=lambda: len(self._used), idle=lambda: len(self._pool), maxconn=maxconn)
 
     def getconn(self, *args, **kwargs):
-        self._semaphore.acquire()
+        start = time.perf_counter()
+        if not self._semaphore.acquire(timeout=ACQUIRE_TIMEOUT if ACQUIRE_TIMEOUT > 0 else None):
+            pg_metrics.pool_timeouts.labels(self.name).inc()
+            raise PoolTimeoutError(self.name)
         try:
-            return super().getconn(*args, **kwargs)
-        except psycopg2.pool.PoolError as e:
-            if str(e) == "connection pool is closed":
+            connection = super().getconn(*args, **kwargs)
+        except Exception as e:
+            # no connection was checked out: give the slot back
+            self._semaphore.release()
+            if isinstance(e, psycopg2.pool.PoolError) and str(e) == "connection pool is closed":
                 make_pool()
             raise e
+        pg_metrics.pool_wait_seconds.labels(self.name).observe(time.perf_counter() - start)
+        pg_metrics.pool_checkouts.labels(self.name).inc()
+        return connection
 
     def putconn(self, *args, **kwargs):
         try:
@@ -48,26 +79,60 @@ class ORThreadedConnectionPool(psycopg2.pool.ThreadedConnectionPool):
 
 
 postgreSQL_pool: ORThreadedConnectionPool = None
+# long_query and unlimited_query connections, opened with their own statement_timeout
+long_pool: ORThreadedConnectionPool = None
+unlimited_pool: ORThreadedConnectionPool = None
 
 RETRY_MAX = config("PG_RETRY_MAX", cast=int, default=50)
 RETRY_INTERVAL = config("PG_RETRY_INTERVAL", cast=int, default=2)
 RETRY = 0
 
+LONG_TIMEOUT = config('pg_long_timeout', cast=int, default=5 * 60) * 1000
+
+
+def _suffixed_config(suffix):
+    suffixed_config = dict(_PG_CONFIG)
+    suffixed_config["application_name"] += suffix
+    return suffixed_config
+
+
+def _long_config():
+    # the timeout is a setting of the connection: it outlives the commits made inside a `with` block
+    long_config = _suffixed_config("-LONG")
+    long_config["options"] = f"-c statement_timeout={LONG_TIMEOUT}"
+    return long_config
+
+
+def _unlimited_config():
+    unlimited_config = _suffixed_config("-UNLIMITED")
+    unlimited_config["options"] = "-c statement_timeout=0"
+    return unlimited_config
+
 
 def make_pool():
     if not config('PG_POOL', cast=bool, default=True):
         return
     global postgreSQL_pool
+    global long_pool
+    global unlimited_pool
     global RETRY
-    if postgreSQL_pool is not None:
-        try:
-            postgreSQL_pool.closeall()
-        except (Exception, psycopg2.DatabaseError) as error:
-            logging.error("Error while closing all connexions to PostgreSQL", error)
+    for p in (postgreSQL_pool, long_pool, unlimited_pool):
+        if p is not None:
+            pg_metrics.pool_recreated.labels(p.name).inc()
+            try:
+                p.closeall()
+            except (Exception, psycopg2.DatabaseError) as error:
+                logging.error("Error while closing all connexions to PostgreSQL", error)
     try:
         postgreSQL_pool = ORThreadedConnectionPool(config("PG_MINCONN", cast=int, default=20),
                                                    config("PG_MAXCONN", cast=int, default=80),
                                                    **PG_CONFIG)
+        long_pool = ORThreadedConnectionPool(config("PG_LONG_MINCONN", cast=int, default=1),
+                                             config("PG_LONG_MAXCONN", cast=int, default=5),
+                                             name="long", **_long_config())
+        unlimited_pool = ORThreadedConnectionPool(config("PG_UNLIMITED_MINCONN", cast=int, default=1),
+                                                  config("PG_UNLIMITED_MAXCONN", cast=int, default=3),
+                                                  name="unlimited", **_unlimited_config())
         if (postgreSQL_pool):
             logging.info("Connection pool created successfully")
     except (Exception, psycopg2.DatabaseError) as error:
@@ -81,6 +146,14 @@ def make_pool():
             raise error
 
 
+def get_pool(long_query=False, unlimited_query=False) -> ORThreadedConnectionPool:
+    if unlimited_query:
+        return unlimited_pool
+    if long_query:
+        return long_pool
+    return postgreSQL_pool
+
+
 class PostgresClient:
     connection = None
     cursor = None
@@ -90,23 +163,19 @@ class PostgresClient:
     def __init__(self, long_query=False, unlimited_query=False):
         self.long_query = long_query
         self.unlimited_query = unlimited_query
-        if unlimited_query:
-            long_config = dict(_PG_CONFIG)
-            long_config["application_name"] += "-UNLIMITED"
-            self.connection = psycopg2.connect(**long_config)
+        # the pools are created by init(), a process that does not call it (the crons) connects directly
+        self.pooled = config('PG_POOL', cast=bool, default=True) \
+                      and get_pool(long_query=long_query, unlimited_query=unlimited_query) is not None
+        if self.pooled:
+            self.connection = get_pool(long_query=long_query, unlimited_query=unlimited_query).getconn()
+        elif unlimited_query:
+            self.connection = psycopg2.connect(**_unlimited_config())
         elif long_query:
-            long_config = dict(_PG_CONFIG)
-            long_config["application_name"] += "-LONG"
-            long_config["options"] = f"-c statement_timeout=" \
-                                     f"{config('pg_long_timeout', cast=int, default=5 * 60) * 1000}"
-            self.connection = psycopg2.connect(**long_config)
-        elif not config('PG_POOL', cast=bool, default=True):
-            single_config = dict(_PG_CONFIG)
-            single_config["application_name"] += "-NOPOOL"
+            self.connection = psycopg2.connect(**_long_config())
+        else:
+            single_config = _suffixed_config("-NOPOOL")
             single_config["options"] = f"-c statement_timeout={config('PG_TIMEOUT', cast=int, default=30) * 1000}"
             self.connection = psycopg2.connect(**single_config)
-        else:
-            self.connection = postgreSQL_pool.getconn()
 
     def __enter__(self):
         if self.cursor is None:
@@ -118,23 +187,18 @@ class PostgresClient:
         try:
             self.connection.commit()
             self.cursor.close()
-            if self.long_query or self.unlimited_query:
+            if not self.pooled:
                 self.connection.close()
         except Exception as error:
             logging.error("Error while committing/closing PG-connection", error)
-            if str(error) == "connection already closed" \
-                    and not self.long_query \
-                    and not self.unlimited_query \
-                    and config('PG_POOL', cast=bool, default=True):
+            if str(error) == "connection already closed" and self.pooled:
                 logging.info("Recreating the connexion pool")
                 make_pool()
             else:
                 raise error
         finally:
-            if config('PG_POOL', cast=bool, default=True) \
-                    and not self.long_query \
-                    and not self.unlimited_query:
-                postgreSQL_pool.putconn(self.connection)
+            if self.pooled:
+                get_pool(long_query=self.long_query, unlimited_query=self.unlimited_query).putconn(self.connection)
 
     def recreate_cursor(self, rollback=False):
         if rollback:
@@ -150,17 +214,146 @@ class PostgresClient:
         return self.__enter__()
 
 
+def _async_config(pg_config):
+    # psycopg2 accepts the "database" alias, psycopg (3) only the libpq "dbname" keyword
+    pg_config = dict(pg_config)
+    pg_config["dbname"] = pg_config.pop("database")
+    return pg_config
+
+
+class AsyncRealDictCursor(psycopg.AsyncClientCursor):
+    # psycopg cursors have __slots__, a subclass accepts the recreate attribute
+    pass
+
+
+async def _configure_async_connection(connection):
+    # uuid values are read as str, like psycopg2 does
+    connection.adapters.register_loader("uuid", TextLoader)
+
+
+async_pool: psycopg_pool.AsyncConnectionPool = None
+
+
+async def make_async_pool():
+    global async_pool
+    if async_pool is not None:
+        try:
+            await async_pool.close()
+        except Exception as error:
+            logging.error("Error while closing all async connexions to PostgreSQL", error)
+    async_pool = psycopg_pool.AsyncConnectionPool(kwargs={**_async_config(PG_CONFIG),
+                                                          "cursor_factory": AsyncRealDictCursor,
+                                                          "row_factory": dict_row},
+                                                  configure=_configure_async_connection,
+                                                  min_size=config("PG_AIO_MINCONN", cast=int, default=5),
+                                                  max_size=config("PG_AIO_MAXCONN", cast=int, default=20),
+                                                  timeout=ACQUIRE_TIMEOUT if ACQUIRE_TIMEOUT > 0 else math.inf,
+                                                  name="async-pool", open=False)
+    await async_pool.open()
+    stats = async_pool.get_stats
+    pg_metrics.observe_pool("async", in_use=lambda: stats()["pool_size"] - stats()["pool_available"],
+                            idle=lambda: stats()["pool_available"], maxconn=async_pool.max_size)
+    logging.info("Async connection pool created successfully")
+
+
+class AsyncPostgresClient:
+    """
+    asyncio counterpart of PostgresClient for the async handlers, the query does not block the event loop:
+        async with pg_client.AsyncPostgresClient() as cur:
+            await cur.execute(cur.mogrify(query, params))
+            row = await cur.fetchone()
+    Rows are dicts like RealDictCursor's, mogrify is client-side (it returns a str instead of bytes),
+    long_query and unlimited_query open their own connection as PostgresClient does.
+    """
+    connection = None
+    cursor = None
+    long_query = False
+    unlimited_query = False
+
+    def __init__(self, long_query=False, unlimited_query=False):
+        self.long_query = long_query
+        self.unlimited_query = unlimited_query
+        self.pooled = not long_query and not unlimited_query and config('PG_POOL', cast=bool, default=True) \
+                      and async_pool is not None
+
+    async def __connect(self):
+        if self.pooled:
+            start = time.perf_counter()
+            try:
+                connection = await async_pool.getconn()
+            except psycopg_pool.PoolTimeout:
+                pg_metrics.pool_timeouts.labels("async").inc()
+                raise PoolTimeoutError("async")
+            pg_metrics.pool_wait_seconds.labels("async").observe(time.perf_counter() - start)
+            pg_metrics.pool_checkouts.labels("async").inc()
+            return connection
+        if self.unlimited_query:
+            single_config = _async_config(_unlimited_config())
+        elif self.long_query:
+            single_config = _async_config(_long_config())
+        else:
+            single_config = _async_config(_suffixed_config("-NOPOOL"))
+            single_config["options"] = f"-c statement_timeout={config('PG_TIMEOUT', cast=int, default=30) * 1000}"
+        connection = await psycopg.AsyncConnection.connect(**single_config, cursor_factory=AsyncRealDictCursor,
+                                                           row_factory=dict_row)
+        await _configure_async_connection(connection)
+        return connection
+
+    async def __aenter__(self):
+        if self.connection is None:
+            self.connection = await self.__connect()
+        if self.cursor is None:
+            self.cursor = self.connection.cursor()
+            self.cursor.recreate = self.recreate_cursor
+        return self.cursor
+
+    async def __aexit__(self, *args):
+        try:
+            await self.connection.commit()
+            await self.cursor.close()
+            if not self.pooled:
+                await self.connection.close()
+        except Exception as error:
+            logging.error("Error while committing/closing async PG-connection", error)
+            if not self.pooled:
+                raise error
+        finally:
+            if self.pooled:
+                # a broken connection is discarded and replaced by the pool
+                await async_pool.putconn(self.connection)
+
+    async def recreate_cursor(self, rollback=False):
+        if rollback:
+            try:
+                await self.connection.rollback()
+            except Exception as error:
+                logging.error("Error while rollbacking async connection for recreation", error)
+        try:
+            await self.cursor.close()
+        except Exception as error:
+            logging.error("Error while closing async cursor for recreation", error)
+        self.cursor = None
+        return await self.__aenter__()
+
+
 async def init():
     logging.info(f">PG_POOL:{config('PG_POOL', default=None)}")
     if config('PG_POOL', cast=bool, default=True):
         make_pool()
+        await make_async_pool()
 
 
 async def terminate():
-    global postgreSQL_pool
-    if postgreSQL_pool is not None:
+    for p in (postgreSQL_pool, long_pool, unlimited_pool):
+        if p is not None:
+            try:
+                p.closeall()
+                logging.info(f"Closed all connexions of the {p.name} pool to PostgreSQL")
+            except (Exception, psycopg2.DatabaseError) as error:
+                logging.error("Error while closing all connexions to PostgreSQL", error)
+    if async_pool is not None:
         try:
-            postgreSQL_pool.closeall()
-            logging.info("Closed all connexions to PostgreSQL")
-        except (Exception, psycopg2.DatabaseError) as error:
-            logging.error("Error while closing all connexions to PostgreSQL", error)
+            await async_pool.close()
+            logging.info("Closed all async connexions to PostgreSQL")
+        except Exception as error:
+            logging.error("Error while closing all async connexions to PostgreSQL", error)
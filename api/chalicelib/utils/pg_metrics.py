@@ -0,0 +1,19 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# pools: "default", "long" (long_query=True), "unlimited" (unlimited_query=True) and "async" (AsyncPostgresClient)
+pool_checkouts = Counter('pg_pool_checkouts_total', 'Connections taken from a pool', ['pool'])
+pool_wait_seconds = Histogram('pg_pool_wait_seconds', 'Time waited for a connection of a pool', ['pool'],
+                              buckets=(.0005, .001, .005, .01, .05, .1, .25, .5, 1, 2.5, 5, 10, 30))
+pool_timeouts = Counter('pg_pool_timeouts_total', 'Connections not obtained within PG_POOL_ACQUIRE_TIMEOUT',
+                        ['pool'])
+pool_recreated = Counter('pg_pool_recreated_total', 'Pools closed and recreated by make_pool', ['pool'])
+pool_in_use = Gauge('pg_pool_connections_in_use', 'Connections of a pool checked out', ['pool'])
+pool_idle = Gauge('pg_pool_connections_idle', 'Open connections of a pool waiting for a checkout', ['pool'])
+pool_max = Gauge('pg_pool_connections_max', 'Maximum connections of a pool', ['pool'])
+
+
+def observe_pool(name, in_use, idle, maxconn) -> None:
+    # in_use and idle are read when the metrics are collected
+    pool_in_use.labels(name).set_function(in_use)
+    pool_idle.labels(name).set_function(idle)
+    pool_max.labels(name).set(maxconn)
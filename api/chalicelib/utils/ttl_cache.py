@@ -0,0 +1,55 @@
+import threading
+import time
+
+from prometheus_client import Counter
+
+cache_lookups = Counter('api_cache_lookups_total', 'TTLCache lookups, per cache and result (hit or miss)',
+                        ['cache', 'result'])
+
+
+class TTLCache:
+    """
+    Process-local cache shared by the threads of the API: an entry expires `ttl` seconds after it is set,
+    the oldest entry is dropped when `max_size` entries are cached. A ttl of 0 disables the cache.
+    None is not a cacheable value, get returns None for a missing or expired entry.
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int = 10_000):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # key: (expires_at, value), in insertion order
+        self._entries = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+        cache_lookups.labels(self.name, "miss" if entry is None else "hit").inc()
+        return None if entry is None else entry[1]
+
+    def set(self, key, value) -> None:
+        if self.ttl <= 0 or value is None:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_size:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate) -> None:
+        # predicate(key, value)
+        with self._lock:
+            for key in [k for k, (_, v) in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -57,6 +57,7 @@ async def login(data: schemas.UserLoginSchema = Body(...)):
 
 @app.get('/logout', tags=["login", "logout"])
 async def logout_user(response: Response, context: schemas.CurrentContext = Depends(OR_context)):
+    users.invalidate_auth(user_id=context.user_id)
     response.delete_cookie("jwt")
     return {"data": "success"}
 
@@ -64,14 +65,15 @@ async def logout_user(response: Response, context: schemas.CurrentContext = Depe
 @app.post('/{projectId}/sessions/search', tags=["sessions"])
 async def sessions_search(projectId: int, data: schemas.FlatSessionsSearchPayloadSchema = Body(...),
                           context: schemas.CurrentContext = Depends(OR_context)):
-    data = sessions.search_sessions(data=data, project_id=projectId, user_id=context.user_id)
+    data = await sessions.search_sessions_async(data=data, project_id=projectId, user_id=context.user_id)
     return {'data': data}
 
 
 @app.post('/{projectId}/sessions/search/ids', tags=["sessions"])
 async def session_ids_search(projectId: int, data: schemas.FlatSessionsSearchPayloadSchema = Body(...),
                              context: schemas.CurrentContext = Depends(OR_context)):
-    data = sessions.search_sessions(data=data, project_id=projectId, user_id=context.user_id, ids_only=True)
+    data = await sessions.search_sessions_async(data=data, project_id=projectId, user_id=context.user_id,
+                                                ids_only=True)
     return {'data': data}
 
 
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# chalicelib reads its settings with decouple when it is imported
+os.environ.setdefault("pg_host", "localhost")
+os.environ.setdefault("pg_dbname", "postgres")
+os.environ.setdefault("pg_user", "postgres")
+os.environ.setdefault("pg_password", "")
+os.environ.setdefault("pg_port", "5432")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
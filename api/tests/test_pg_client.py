@@ -0,0 +1,70 @@
+import psycopg2
+import pytest
+
+from chalicelib.utils import pg_client
+
+
+class FakeConnection:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor()
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    opened = []
+
+    def connect(**kwargs):
+        opened.append(FakeConnection(**kwargs))
+        return opened[-1]
+
+    monkeypatch.setenv("PG_POOL", "true")
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    for name in ("postgreSQL_pool", "long_pool", "unlimited_pool"):
+        monkeypatch.setattr(pg_client, name, None)
+    return opened
+
+
+@pytest.mark.parametrize("kwargs,timeout", [({"long_query": True}, pg_client.LONG_TIMEOUT),
+                                            ({"unlimited_query": True}, 0),
+                                            ({}, 30_000)])
+def test_client_without_init_connects_directly(connections, kwargs, timeout):
+    # a process that never called pg_client.init() (app_crons) has no pools
+    with pg_client.PostgresClient(**kwargs) as cur:
+        assert cur is not None
+    assert len(connections) == 1
+    assert connections[0].kwargs["options"] == f"-c statement_timeout={timeout}"
+    assert connections[0].closed
+
+
+def test_pooled_connections_keep_their_timeout():
+    # set when connecting, a commit inside the `with` block does not reset it
+    assert pg_client._long_config()["options"] == f"-c statement_timeout={pg_client.LONG_TIMEOUT}"
+    assert pg_client._unlimited_config()["options"] == "-c statement_timeout=0"
+
+
+def test_failed_getconn_releases_its_slot(monkeypatch):
+    def connect(**kwargs):
+        raise psycopg2.OperationalError("could not connect to server")
+
+    monkeypatch.setattr(psycopg2.pool.ThreadedConnectionPool, "_connect", lambda self, key=None: connect())
+    monkeypatch.setattr(pg_client, "ACQUIRE_TIMEOUT", 0.1)
+    pool = pg_client.ORThreadedConnectionPool(0, 2, name="test")
+    for _ in range(3):
+        with pytest.raises(psycopg2.OperationalError):
+            pool.getconn()
+    assert pool._semaphore._value == 2
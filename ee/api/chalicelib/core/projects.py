@@ -1,13 +1,22 @@
 import json
 from typing import Optional
 
+from decouple import config
 from fastapi import HTTPException
 from starlette import status
 
 import schemas
-from chalicelib.core import users
+from chalicelib.core import users, metadata
 from chalicelib.utils import pg_client, helper
 from chalicelib.utils.TimeUTC import TimeUTC
+from chalicelib.utils.ttl_cache import TTLCache
+
+# project_id: the lookup of a project, see get_lookup
+__lookup_cache = TTLCache("projects", ttl=config("PROJECT_CACHE_TTL", cast=int, default=60))
+# project_key: project_id, counted with the lookups
+__key_cache = TTLCache("projects", ttl=config("PROJECT_CACHE_TTL", cast=int, default=60))
+# (tenant_id, user_id, project_id): whether the role of the user gives access to the project
+__role_cache = TTLCache("project_roles", ttl=config("PROJECT_CACHE_TTL", cast=int, default=60))
 
 
 def __exists_by_name(tenant_id: int, name: str, exclude_id: Optional[int]) -> bool:
@@ -188,8 +197,9 @@ def edit(tenant_id, user_id, project_id, data: schemas.CreateProjectSchema):
     admin = users.get(user_id=user_id, tenant_id=tenant_id)
     if not admin["admin"] and not admin["superAdmin"]:
         return {"errors": ["unauthorized"]}
-    return {"data": __update(tenant_id=tenant_id, project_id=project_id,
-                             changes={"name": data.name})}
+    project = __update(tenant_id=tenant_id, project_id=project_id, changes={"name": data.name})
+    invalidate_lookup(project_id)
+    return {"data": project}
 
 
 def delete(tenant_id, user_id, project_id):
@@ -204,6 +214,7 @@ def delete(tenant_id, user_id, project_id):
                                WHERE project_id = %(project_id)s;""",
                             {"project_id": project_id})
         cur.execute(query=query)
+    invalidate_lookup(project_id)
     return {"data": {"state": "success"}}
 
 
@@ -237,28 +248,65 @@ def edit_gdpr(project_id, gdpr):
         return row
 
 
-def get_internal_project_id(project_key):
+def __get_lookup(where, params):
     with pg_client.PostgresClient() as cur:
-        query = cur.mogrify("""SELECT project_id
-                               FROM public.projects
-                               WHERE project_key =%(project_key)s
-                                    AND deleted_at ISNULL;""",
-                            {"project_key": project_key})
+        query = cur.mogrify(f"""SELECT project_id,
+                                       project_key,
+                                       tenant_id,
+                                       active,
+                                       {",".join(metadata.column_names())}
+                                FROM public.projects
+                                WHERE {where}
+                                    AND deleted_at ISNULL
+                                LIMIT 1;""", params)
         cur.execute(query=query)
         row = cur.fetchone()
-        return row["project_id"] if row else None
+    if row is None:
+        return None
+    lookup = {"projectId": row["project_id"],
+              "projectKey": row["project_key"],
+              "tenantId": row["tenant_id"],
+              "active": row["active"],
+              # index: key of the metadata columns in use
+              "metadata": {i + 1: row[c] for i, c in enumerate(metadata.column_names()) if row[c] is not None}}
+    __lookup_cache.set(lookup["projectId"], lookup)
+    __key_cache.set(lookup["projectKey"], lookup["projectId"])
+    return lookup
+
+
+def get_lookup(project_id=None, project_key=None):
+    """
+    id, key, tenant, active flag and metadata columns of a project that is not deleted, or None.
+    Cached for PROJECT_CACHE_TTL seconds: the caller must not modify it.
+    """
+    if project_key is not None:
+        project_id = __key_cache.get(project_key)
+        if project_id is None:
+            return __get_lookup("project_key = %(project_key)s", {"project_key": project_key})
+    if project_id is None or not str(project_id).isdigit():
+        return None
+    project_id = int(project_id)
+    lookup = __lookup_cache.get(project_id)
+    if lookup is None:
+        lookup = __get_lookup("project_id = %(project_id)s", {"project_id": project_id})
+    return lookup
+
+
+def invalidate_lookup(project_id):
+    # called when a project is edited or deleted, and when its metadata change
+    project_id = int(project_id)
+    __lookup_cache.delete(project_id)
+    __key_cache.delete_where(lambda key, value: value == project_id)
+
+
+def get_internal_project_id(project_key):
+    lookup = get_lookup(project_key=project_key)
+    return lookup["projectId"] if lookup is not None else None
 
 
 def get_project_key(project_id):
-    with pg_client.PostgresClient() as cur:
-        query = cur.mogrify("""SELECT project_key
-                               FROM public.projects
-                               WHERE project_id =%(project_id)s
-                                    AND deleted_at ISNULL;""",
-                            {"project_id": project_id})
-        cur.execute(query=query)
-        project = cur.fetchone()
-        return project["project_key"] if project is not None else None
+    lookup = get_lookup(project_id=project_id)
+    return lookup["projectKey"] if lookup is not None else None
 
 
 def get_capture_status(project_id):
@@ -330,8 +378,25 @@ def get_project_by_key(tenant_id, project_key, include_last_session=False, inclu
 
 
 def is_authorized(project_id, tenant_id, user_id=None):
-    if project_id is None or not str(project_id).isdigit():
+    lookup = get_lookup(project_id=project_id)
+    if lookup is None or lookup["tenantId"] != tenant_id:
         return False
+    if user_id is None:
+        return True
+    authorized = __role_cache.get((tenant_id, user_id, lookup["projectId"]))
+    if authorized is None:
+        authorized = __is_role_authorized(project_id=lookup["projectId"], tenant_id=tenant_id, user_id=user_id)
+        __role_cache.set((tenant_id, user_id, lookup["projectId"]), authorized)
+    return authorized
+
+
+def invalidate_authorized(user_id=None, tenant_id=None):
+    # called by users.invalidate_auth: when a user or its role change
+    __role_cache.delete_where(lambda key, authorized: (tenant_id is None or key[0] == tenant_id)
+                                                      and (user_id is None or key[1] == user_id))
+
+
+def __is_role_authorized(project_id, tenant_id, user_id):
     with pg_client.PostgresClient() as cur:
         role_query = """INNER JOIN LATERAL (SELECT 1
                                             FROM users
@@ -345,7 +410,7 @@ def is_authorized(project_id, tenant_id, user_id=None):
 
         query = cur.mogrify(f"""SELECT project_id
                                 FROM public.projects AS s
-                                    {role_query if user_id is not None else ""}
+                                    {role_query}
                                 WHERE s.tenant_id =%(tenant_id)s 
                                     AND s.project_id =%(project_id)s
                                     AND s.deleted_at IS NULL
@@ -77,6 +77,8 @@ def update(tenant_id, user_id, role_id, data: schemas_ee.RolePayloadSchema):
                                     {"role_id": role_id, **{f"project_id_{i}": p for i, p in enumerate(n_projects)}})
                 cur.execute(query=query)
             row["projects"] = data.projects
+    # the permissions of the role are cached with its users
+    users.invalidate_auth(tenant_id=tenant_id)
 
     return helper.dict_to_camel_case(row)
 
@@ -1,5 +1,7 @@
 from typing import List
 
+from starlette.concurrency import run_in_threadpool
+
 import schemas
 import schemas_ee
 from chalicelib.core import events, metadata, events_ios, \
@@ -43,85 +45,103 @@ def __group_metadata(session, project_metadata):
     return meta
 
 
-def get_by_id2_pg(project_id, session_id, context: schemas_ee.CurrentContext, full_data=False,
-                  include_fav_viewed=False, group_metadata=False, live=True):
-    with pg_client.PostgresClient() as cur:
-        extra_query = []
-        if include_fav_viewed:
-            extra_query.append("""COALESCE((SELECT TRUE
-                                 FROM public.user_favorite_sessions AS fs
-                                 WHERE s.session_id = fs.session_id
-                                   AND fs.user_id = %(userId)s), FALSE) AS favorite""")
-            extra_query.append("""COALESCE((SELECT TRUE
-                                 FROM public.user_viewed_sessions AS fs
-                                 WHERE s.session_id = fs.session_id
-                                   AND fs.user_id = %(userId)s), FALSE) AS viewed""")
-        query = cur.mogrify(
-            f"""\
-            SELECT
-                s.*,
-                s.session_id::text AS session_id,
-                (SELECT project_key FROM public.projects WHERE project_id = %(project_id)s LIMIT 1) AS project_key,
-                encode(file_key,'hex') AS file_key
-                {"," if len(extra_query) > 0 else ""}{",".join(extra_query)}
-                {(",json_build_object(" + ",".join([f"'{m}',p.{m}" for m in metadata.column_names()]) + ") AS project_metadata") if group_metadata else ''}
-            FROM public.sessions AS s {"INNER JOIN public.projects AS p USING (project_id)" if group_metadata else ""}
-            WHERE s.project_id = %(project_id)s
-                AND s.session_id = %(session_id)s;""",
-            {"project_id": project_id, "session_id": session_id, "userId": context.user_id}
-        )
-        # print("===============")
-        # print(query)
-        cur.execute(query=query)
+def __get_session_query(cur, project_id, session_id, context: schemas_ee.CurrentContext, include_fav_viewed=False,
+                        group_metadata=False):
+    extra_query = []
+    if include_fav_viewed:
+        extra_query.append("""COALESCE((SELECT TRUE
+                             FROM public.user_favorite_sessions AS fs
+                             WHERE s.session_id = fs.session_id
+                               AND fs.user_id = %(userId)s), FALSE) AS favorite""")
+        extra_query.append("""COALESCE((SELECT TRUE
+                             FROM public.user_viewed_sessions AS fs
+                             WHERE s.session_id = fs.session_id
+                               AND fs.user_id = %(userId)s), FALSE) AS viewed""")
+    return cur.mogrify(
+        f"""\
+        SELECT
+            s.*,
+            s.session_id::text AS session_id,
+            (SELECT project_key FROM public.projects WHERE project_id = %(project_id)s LIMIT 1) AS project_key,
+            encode(file_key,'hex') AS file_key
+            {"," if len(extra_query) > 0 else ""}{",".join(extra_query)}
+            {(",json_build_object(" + ",".join([f"'{m}',p.{m}" for m in metadata.column_names()]) + ") AS project_metadata") if group_metadata else ''}
+        FROM public.sessions AS s {"INNER JOIN public.projects AS p USING (project_id)" if group_metadata else ""}
+        WHERE s.project_id = %(project_id)s
+            AND s.session_id = %(session_id)s;""",
+        {"project_id": project_id, "session_id": session_id, "userId": context.user_id}
+    )
+
+
+def __get_session_data(data, project_id, session_id, context: schemas_ee.CurrentContext, full_data=False, live=True):
+    if data is not None:
+        data = helper.dict_to_camel_case(data)
+        if full_data:
+            if data["platform"] == 'ios':
+                data['events'] = events_ios.get_by_sessionId(project_id=project_id, session_id=session_id)
+                for e in data['events']:
+                    if e["type"].endswith("_IOS"):
+                        e["type"] = e["type"][:-len("_IOS")]
+                data['crashes'] = events_ios.get_crashes_by_session_id(session_id=session_id)
+                data['userEvents'] = events_ios.get_customs_by_sessionId(project_id=project_id,
+                                                                         session_id=session_id)
+                data['mobsUrl'] = sessions_mobs.get_ios(session_id=session_id)
+            else:
+                data['events'] = events.get_by_session_id(project_id=project_id, session_id=session_id,
+                                                          group_clickrage=True)
+                all_errors = events.get_errors_by_session_id(session_id=session_id, project_id=project_id)
+                data['stackEvents'] = [e for e in all_errors if e['source'] != "js_exception"]
+                # to keep only the first stack
+                # limit the number of errors to reduce the response-body size
+                data['errors'] = [errors_helper.format_first_stack_frame(e) for e in all_errors
+                                  if e['source'] == "js_exception"][:500]
+                data['userEvents'] = events.get_customs_by_session_id(project_id=project_id,
+                                                                      session_id=session_id)
+                data['domURL'] = sessions_mobs.get_urls(session_id=session_id, project_id=project_id)
+                data['mobsUrl'] = sessions_mobs.get_urls_depercated(session_id=session_id)
+                data['devtoolsURL'] = sessions_devtool.get_urls(session_id=session_id, project_id=project_id,
+                                                                context=context)
+                data['resources'] = resources.get_by_session_id(session_id=session_id, project_id=project_id,
+                                                                start_ts=data["startTs"], duration=data["duration"])
+
+            data['notes'] = sessions_notes.get_session_notes(tenant_id=context.tenant_id, project_id=project_id,
+                                                             session_id=session_id, user_id=context.user_id)
+            data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
+            data['issues'] = issues.get_by_session_id(session_id=session_id, project_id=project_id)
+            data['live'] = live and assist.is_live(project_id=project_id, session_id=session_id,
+                                                   project_key=data["projectKey"])
+        data["inDB"] = True
+        return data
+    elif live:
+        return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
+    else:
+        return None
 
+
+def get_by_id2_pg(project_id, session_id, context: schemas_ee.CurrentContext, full_data=False, include_fav_viewed=False,
+                  group_metadata=False, live=True):
+    with pg_client.PostgresClient() as cur:
+        cur.execute(query=__get_session_query(cur, project_id=project_id, session_id=session_id, context=context,
+                                              include_fav_viewed=include_fav_viewed,
+                                              group_metadata=group_metadata))
         data = cur.fetchone()
-        if data is not None:
-            data = helper.dict_to_camel_case(data)
-            if full_data:
-                if data["platform"] == 'ios':
-                    data['events'] = events_ios.get_by_sessionId(project_id=project_id, session_id=session_id)
-                    for e in data['events']:
-                        if e["type"].endswith("_IOS"):
-                            e["type"] = e["type"][:-len("_IOS")]
-                    data['crashes'] = events_ios.get_crashes_by_session_id(session_id=session_id)
-                    data['userEvents'] = events_ios.get_customs_by_sessionId(project_id=project_id,
-                                                                             session_id=session_id)
-                    data['mobsUrl'] = sessions_mobs.get_ios(session_id=session_id)
-                else:
-                    data['events'] = events.get_by_session_id(project_id=project_id, session_id=session_id,
-                                                              group_clickrage=True)
-                    all_errors = events.get_errors_by_session_id(session_id=session_id, project_id=project_id)
-                    data['stackEvents'] = [e for e in all_errors if e['source'] != "js_exception"]
-                    # to keep only the first stack
-                    # limit the number of errors to reduce the response-body size
-                    data['errors'] = [errors_helper.format_first_stack_frame(e) for e in all_errors
-                                      if e['source'] == "js_exception"][:500]
-                    data['userEvents'] = events.get_customs_by_session_id(project_id=project_id,
-                                                                          session_id=session_id)
-                    data['domURL'] = sessions_mobs.get_urls(session_id=session_id, project_id=project_id)
-                    data['mobsUrl'] = sessions_mobs.get_urls_depercated(session_id=session_id)
-                    data['devtoolsURL'] = sessions_devtool.get_urls(session_id=session_id, project_id=project_id,
-                                                                    context=context)
-                    data['resources'] = resources.get_by_session_id(session_id=session_id, project_id=project_id,
-                                                                    start_ts=data["startTs"], duration=data["duration"])
-
-                data['notes'] = sessions_notes.get_session_notes(tenant_id=context.tenant_id, project_id=project_id,
-                                                                 session_id=session_id, user_id=context.user_id)
-                data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
-                data['issues'] = issues.get_by_session_id(session_id=session_id, project_id=project_id)
-                data['live'] = live and assist.is_live(project_id=project_id, session_id=session_id,
-                                                       project_key=data["projectKey"])
-            data["inDB"] = True
-            return data
-        elif live:
-            return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
-        else:
-            return None
+    return __get_session_data(data, project_id=project_id, session_id=session_id, context=context,
+                              full_data=full_data, live=live)
 
 
-# This function executes the query and return result
-def search_sessions(data: schemas.SessionsSearchPayloadSchema, project_id, user_id, errors_only=False,
-                    error_status=schemas.ErrorStatus.all, count_only=False, issue=None, ids_only=False):
+async def get_by_id2_pg_async(project_id, session_id, context: schemas_ee.CurrentContext, full_data=False,
+                              include_fav_viewed=False, group_metadata=False, live=True):
+    async with pg_client.AsyncPostgresClient() as cur:
+        await cur.execute(query=__get_session_query(cur, project_id=project_id, session_id=session_id,
+                                                    context=context, include_fav_viewed=include_fav_viewed,
+                                                    group_metadata=group_metadata))
+        data = await cur.fetchone()
+    # events, errors, resources... are still read with the blocking client, out of the event loop
+    return await run_in_threadpool(__get_session_data, data, project_id=project_id, session_id=session_id,
+                                   context=context, full_data=full_data, live=live)
+
+
+def __search_args(data: schemas.SessionsSearchPayloadSchema, project_id, user_id, errors_only, error_status, issue):
     if data.bookmarked:
         data.startDate, data.endDate = sessions_favorite.get_start_end_timestamp(project_id, user_id)
 
@@ -136,98 +156,98 @@ def search_sessions(data: schemas.SessionsSearchPayloadSchema, project_id, user_
         full_args["sessions_limit"] = 200
         full_args["sessions_limit_s"] = 1
         full_args["sessions_limit_e"] = 200
+    return full_args, query_part
 
-    meta_keys = []
-    with pg_client.PostgresClient() as cur:
-        if errors_only:
-            main_query = cur.mogrify(f"""SELECT DISTINCT er.error_id,
-                                         COALESCE((SELECT TRUE
-                                                     FROM public.user_viewed_errors AS ve
-                                                     WHERE er.error_id = ve.error_id
-                                                       AND ve.user_id = %(userId)s LIMIT 1), FALSE) AS viewed
-                                        {query_part};""", full_args)
-
-        elif count_only:
-            main_query = cur.mogrify(f"""SELECT COUNT(DISTINCT s.session_id) AS count_sessions, 
-                                                COUNT(DISTINCT s.user_uuid) AS count_users
-                                        {query_part};""", full_args)
-        elif data.group_by_user:
-            g_sort = "count(full_sessions)"
-            if data.order is None:
-                data.order = schemas.SortOrderType.desc.value
-            else:
-                data.order = data.order.value
-            if data.sort is not None and data.sort != 'sessionsCount':
-                sort = helper.key_to_snake_case(data.sort)
-                g_sort = f"{'MIN' if data.order == schemas.SortOrderType.desc else 'MAX'}({sort})"
-            else:
-                sort = 'start_ts'
-
-            meta_keys = metadata.get(project_id=project_id)
-            main_query = cur.mogrify(f"""SELECT COUNT(*) AS count,
-                                                COALESCE(JSONB_AGG(users_sessions) 
-                                                    FILTER (WHERE rn>%(sessions_limit_s)s AND rn<=%(sessions_limit_e)s), '[]'::JSONB) AS sessions
-                                        FROM (SELECT user_id,
-                                                 count(full_sessions)                                   AS user_sessions_count,
-                                                 jsonb_agg(full_sessions) FILTER (WHERE rn <= 1)        AS last_session,
-                                                 MIN(full_sessions.start_ts)                            AS first_session_ts,
-                                                 ROW_NUMBER() OVER (ORDER BY {g_sort} {data.order}) AS rn
-                                            FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY {sort} {data.order}) AS rn 
-                                                FROM (SELECT DISTINCT ON(s.session_id) {SESSION_PROJECTION_COLS} 
-                                                                    {"," if len(meta_keys) > 0 else ""}{",".join([f'metadata_{m["index"]}' for m in meta_keys])}
-                                                    {query_part}
-                                                    ) AS filtred_sessions
-                                                ) AS full_sessions
-                                                GROUP BY user_id
-                                            ) AS users_sessions;""",
-                                     full_args)
-        elif ids_only:
-            main_query = cur.mogrify(f"""SELECT DISTINCT ON(s.session_id) s.session_id
-                                             {query_part}
-                                             ORDER BY s.session_id desc
-                                             LIMIT %(sessions_limit)s OFFSET %(sessions_limit_s)s;""",
-                                     full_args)
-        else:
-            if data.order is None:
-                data.order = schemas.SortOrderType.desc.value
-            else:
-                data.order = data.order.value
-            sort = 'session_id'
-            if data.sort is not None and data.sort != "session_id":
-                # sort += " " + data.order + "," + helper.key_to_snake_case(data.sort)
-                sort = helper.key_to_snake_case(data.sort)
-            meta_keys = metadata.get(project_id=project_id)
-            main_query = cur.mogrify(f"""SELECT COUNT(full_sessions) AS count, 
-                                                COALESCE(JSONB_AGG(full_sessions) 
-                                                    FILTER (WHERE rn>%(sessions_limit_s)s AND rn<=%(sessions_limit_e)s), '[]'::JSONB) AS sessions
-                                            FROM (SELECT *, ROW_NUMBER() OVER (ORDER BY {sort} {data.order}, issue_score DESC) AS rn
-                                            FROM (SELECT DISTINCT ON(s.session_id) {SESSION_PROJECTION_COLS}
-                                                                {"," if len(meta_keys) > 0 else ""}{",".join([f'metadata_{m["index"]}' for m in meta_keys])}
-                                            {query_part}
-                                            ORDER BY s.session_id desc) AS filtred_sessions
-                                            ORDER BY {sort} {data.order}, issue_score DESC) AS full_sessions;""",
-                                     full_args)
-        # print("--------------------")
-        # print(main_query)
-        # print("--------------------")
-        try:
-            cur.execute(main_query)
-        except Exception as err:
-            print("--------- SESSIONS SEARCH QUERY EXCEPTION -----------")
-            print(main_query.decode('UTF-8'))
-            print("--------- PAYLOAD -----------")
-            print(data.json())
-            print("--------------------")
-            raise err
-        if errors_only or ids_only:
-            return helper.list_to_camel_case(cur.fetchall())
 
-        sessions = cur.fetchone()
-        if count_only:
-            return helper.dict_to_camel_case(sessions)
+def __search_meta_keys(data: schemas.SessionsSearchPayloadSchema, project_id, errors_only, count_only, ids_only):
+    # the metadata columns are only projected when the sessions are returned
+    if errors_only or count_only or (ids_only and not data.group_by_user):
+        return []
+    return metadata.get(project_id=project_id)
 
-        total = sessions["count"]
-        sessions = sessions["sessions"]
+
+def __search_query(cur, data: schemas.SessionsSearchPayloadSchema, full_args, query_part, meta_keys, errors_only,
+                   count_only, ids_only):
+    if errors_only:
+        main_query = cur.mogrify(f"""SELECT DISTINCT er.error_id,
+                                     COALESCE((SELECT TRUE
+                                                 FROM public.user_viewed_errors AS ve
+                                                 WHERE er.error_id = ve.error_id
+                                                   AND ve.user_id = %(userId)s LIMIT 1), FALSE) AS viewed
+                                    {query_part};""", full_args)
+
+    elif count_only:
+        main_query = cur.mogrify(f"""SELECT COUNT(DISTINCT s.session_id) AS count_sessions, 
+                                            COUNT(DISTINCT s.user_uuid) AS count_users
+                                    {query_part};""", full_args)
+    elif data.group_by_user:
+        g_sort = "count(full_sessions)"
+        if data.order is None:
+            data.order = schemas.SortOrderType.desc.value
+        else:
+            data.order = data.order.value
+        if data.sort is not None and data.sort != 'sessionsCount':
+            sort = helper.key_to_snake_case(data.sort)
+            g_sort = f"{'MIN' if data.order == schemas.SortOrderType.desc else 'MAX'}({sort})"
+        else:
+            sort = 'start_ts'
+
+        main_query = cur.mogrify(f"""SELECT COUNT(*) AS count,
+                                            COALESCE(JSONB_AGG(users_sessions) 
+                                                FILTER (WHERE rn>%(sessions_limit_s)s AND rn<=%(sessions_limit_e)s), '[]'::JSONB) AS sessions
+                                    FROM (SELECT user_id,
+                                             count(full_sessions)                                   AS user_sessions_count,
+                                             jsonb_agg(full_sessions) FILTER (WHERE rn <= 1)        AS last_session,
+                                             MIN(full_sessions.start_ts)                            AS first_session_ts,
+                                             ROW_NUMBER() OVER (ORDER BY {g_sort} {data.order}) AS rn
+                                        FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY {sort} {data.order}) AS rn 
+                                            FROM (SELECT DISTINCT ON(s.session_id) {SESSION_PROJECTION_COLS} 
+                                                                {"," if len(meta_keys) > 0 else ""}{",".join([f'metadata_{m["index"]}' for m in meta_keys])}
+                                                {query_part}
+                                                ) AS filtred_sessions
+                                            ) AS full_sessions
+                                            GROUP BY user_id
+                                        ) AS users_sessions;""",
+                                 full_args)
+    elif ids_only:
+        main_query = cur.mogrify(f"""SELECT DISTINCT ON(s.session_id) s.session_id
+                                         {query_part}
+                                         ORDER BY s.session_id desc
+                                         LIMIT %(sessions_limit)s OFFSET %(sessions_limit_s)s;""",
+                                 full_args)
+    else:
+        if data.order is None:
+            data.order = schemas.SortOrderType.desc.value
+        else:
+            data.order = data.order.value
+        sort = 'session_id'
+        if data.sort is not None and data.sort != "session_id":
+            # sort += " " + data.order + "," + helper.key_to_snake_case(data.sort)
+            sort = helper.key_to_snake_case(data.sort)
+        main_query = cur.mogrify(f"""SELECT COUNT(full_sessions) AS count, 
+                                            COALESCE(JSONB_AGG(full_sessions) 
+                                                FILTER (WHERE rn>%(sessions_limit_s)s AND rn<=%(sessions_limit_e)s), '[]'::JSONB) AS sessions
+                                        FROM (SELECT *, ROW_NUMBER() OVER (ORDER BY {sort} {data.order}, issue_score DESC) AS rn
+                                        FROM (SELECT DISTINCT ON(s.session_id) {SESSION_PROJECTION_COLS}
+                                                            {"," if len(meta_keys) > 0 else ""}{",".join([f'metadata_{m["index"]}' for m in meta_keys])}
+                                        {query_part}
+                                        ORDER BY s.session_id desc) AS filtred_sessions
+                                        ORDER BY {sort} {data.order}, issue_score DESC) AS full_sessions;""",
+                                 full_args)
+    return main_query
+
+
+def __print_search_error(main_query, data: schemas.SessionsSearchPayloadSchema):
+    print("--------- SESSIONS SEARCH QUERY EXCEPTION -----------")
+    print(main_query.decode('UTF-8') if isinstance(main_query, bytes) else main_query)
+    print("--------- PAYLOAD -----------")
+    print(data.json())
+    print("--------------------")
+
+
+def __search_result(data: schemas.SessionsSearchPayloadSchema, sessions, meta_keys):
+    total = sessions["count"]
+    sessions = sessions["sessions"]
 
     if data.group_by_user:
         for i, s in enumerate(sessions):
@@ -248,6 +268,58 @@ def search_sessions(data: schemas.SessionsSearchPayloadSchema, project_id, user_
     }
 
 
+# This function executes the query and return result
+def search_sessions(data: schemas.SessionsSearchPayloadSchema, project_id, user_id, errors_only=False,
+                    error_status=schemas.ErrorStatus.all, count_only=False, issue=None, ids_only=False):
+    full_args, query_part = __search_args(data=data, project_id=project_id, user_id=user_id, errors_only=errors_only,
+                                          error_status=error_status, issue=issue)
+    meta_keys = __search_meta_keys(data=data, project_id=project_id, errors_only=errors_only,
+                                   count_only=count_only, ids_only=ids_only)
+    with pg_client.PostgresClient() as cur:
+        main_query = __search_query(cur, data=data, full_args=full_args, query_part=query_part, meta_keys=meta_keys,
+                                    errors_only=errors_only, count_only=count_only, ids_only=ids_only)
+        # print("--------------------")
+        # print(main_query)
+        # print("--------------------")
+        try:
+            cur.execute(main_query)
+        except Exception as err:
+            __print_search_error(main_query, data)
+            raise err
+        if errors_only or ids_only:
+            return helper.list_to_camel_case(cur.fetchall())
+
+        sessions = cur.fetchone()
+    if count_only:
+        return helper.dict_to_camel_case(sessions)
+    return __search_result(data, sessions, meta_keys)
+
+
+async def search_sessions_async(data: schemas.SessionsSearchPayloadSchema, project_id, user_id, errors_only=False,
+                                error_status=schemas.ErrorStatus.all, count_only=False, issue=None, ids_only=False):
+    # the filters and metadata lookups are short and blocking, only the search query runs on the event loop
+    full_args, query_part = await run_in_threadpool(__search_args, data=data, project_id=project_id,
+                                                    user_id=user_id, errors_only=errors_only,
+                                                    error_status=error_status, issue=issue)
+    meta_keys = await run_in_threadpool(__search_meta_keys, data=data, project_id=project_id,
+                                        errors_only=errors_only, count_only=count_only, ids_only=ids_only)
+    async with pg_client.AsyncPostgresClient() as cur:
+        main_query = __search_query(cur, data=data, full_args=full_args, query_part=query_part, meta_keys=meta_keys,
+                                    errors_only=errors_only, count_only=count_only, ids_only=ids_only)
+        try:
+            await cur.execute(main_query)
+        except Exception as err:
+            __print_search_error(main_query, data)
+            raise err
+        if errors_only or ids_only:
+            return helper.list_to_camel_case(await cur.fetchall())
+
+        sessions = await cur.fetchone()
+    if count_only:
+        return helper.dict_to_camel_case(sessions)
+    return __search_result(data, sessions, meta_keys)
+
+
 def search2_series(data: schemas.SessionsSearchPayloadSchema, project_id: int, density: int,
                    view_type: schemas.MetricTimeseriesViewType, metric_type: schemas.MetricType,
                    metric_of: schemas.MetricOfTable, metric_value: List):
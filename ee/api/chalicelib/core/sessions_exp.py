@@ -1,5 +1,7 @@
 from typing import List, Union
 
+from starlette.concurrency import run_in_threadpool
+
 import schemas
 import schemas_ee
 from chalicelib.core import events, metadata, events_ios, \
@@ -139,6 +141,13 @@ def get_by_id2_pg(project_id, session_id, context: schemas_ee.CurrentContext, fu
             return None
 
 
+async def get_by_id2_pg_async(project_id, session_id, context: schemas_ee.CurrentContext, full_data=False,
+                              include_fav_viewed=False, group_metadata=False, live=True):
+    return await run_in_threadpool(get_by_id2_pg, project_id=project_id, session_id=session_id, context=context,
+                                   full_data=full_data, include_fav_viewed=include_fav_viewed,
+                                   group_metadata=group_metadata, live=live)
+
+
 def __get_sql_operator(op: schemas.SearchEventOperator):
     return {
         schemas.SearchEventOperator._is: "=",
@@ -342,6 +351,14 @@ def search_sessions(data: schemas.SessionsSearchPayloadSchema, project_id, user_
     }
 
 
+async def search_sessions_async(data: schemas.SessionsSearchPayloadSchema, project_id, user_id, errors_only=False,
+                                error_status=schemas.ErrorStatus.all, count_only=False, issue=None, ids_only=False):
+    # the search runs on ClickHouse, its client has no asyncio API: the query runs out of the event loop
+    return await run_in_threadpool(search_sessions, data=data, project_id=project_id, user_id=user_id,
+                                   errors_only=errors_only, error_status=error_status, count_only=count_only,
+                                   issue=issue, ids_only=ids_only)
+
+
 def search2_series(data: schemas.SessionsSearchPayloadSchema, project_id: int, density: int,
                    view_type: schemas.MetricTimeseriesViewType, metric_type: schemas.MetricType,
                    metric_of: schemas.MetricOfTable, metric_value: List):
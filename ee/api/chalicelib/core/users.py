@@ -9,9 +9,14 @@ from chalicelib.core import authorizers, metadata, projects, roles
 from chalicelib.core import tenants, assist
 from chalicelib.utils import helper, email_helper
 from chalicelib.utils import pg_client
+from chalicelib.utils.ttl_cache import TTLCache
 from chalicelib.utils.TimeUTC import TimeUTC
 
 
+# the users resolved by JWTAuth, by (user_id, tenant_id, jwt_iat, jwt_aud) of the token: a hit saves the
+# auth_exists and get queries of an authenticated request
+__auth_cache = TTLCache("auth", ttl=config("AUTH_CACHE_TTL", cast=int, default=30))
+
 def __generate_invitation_token():
     return secrets.token_urlsafe(64)
 
@@ -197,6 +202,7 @@ def update(tenant_id, user_id, changes):
                                         AND roles.role_id=users.role_id) AS role_name;""",
                             {"tenant_id": tenant_id, "user_id": user_id, **changes})
             )
+    invalidate_auth(user_id=user_id)
 
     return get(user_id=user_id, tenant_id=tenant_id)
 
@@ -537,6 +543,7 @@ def delete_member(user_id, tenant_id, id_to_delete):
                            SET password=NULL 
                            WHERE user_id=%(user_id)s;""",
                         {"user_id": id_to_delete, "tenant_id": tenant_id}))
+    invalidate_auth(user_id=id_to_delete)
     return {"data": get_members(tenant_id=tenant_id)}
 
 
@@ -670,7 +677,24 @@ def change_jwt_iat(user_id):
                        RETURNING jwt_iat;""",
             {"user_id": user_id})
         cur.execute(query)
-        return cur.fetchone().get("jwt_iat")
+        jwt_iat = cur.fetchone().get("jwt_iat")
+    invalidate_auth(user_id=user_id)
+    return jwt_iat
+
+
+def get_cached_auth(user_id, tenant_id, jwt_iat, jwt_aud):
+    return __auth_cache.get((user_id, tenant_id, jwt_iat, jwt_aud))
+
+
+def cache_auth(user_id, tenant_id, jwt_iat, jwt_aud, user):
+    __auth_cache.set((user_id, tenant_id, jwt_iat, jwt_aud), user)
+
+
+def invalidate_auth(user_id=None, tenant_id=None):
+    # called when a user, its password, role or jwt_iat change, and on logout
+    __auth_cache.delete_where(lambda key, user: (user_id is None or key[0] == user_id)
+                                                and (tenant_id is None or key[1] == tenant_id))
+    projects.invalidate_authorized(user_id=user_id, tenant_id=tenant_id)
 
 
 def authenticate(email, password, for_change_password=False):
@@ -843,7 +867,9 @@ def restore_sso_user(user_id, tenant_id, email, admin, name, origin, role_id, in
         cur.execute(
             query
         )
-        return helper.dict_to_camel_case(cur.fetchone())
+        user = helper.dict_to_camel_case(cur.fetchone())
+    invalidate_auth(user_id=user_id)
+    return user
 
 
 def __hard_delete_user(user_id):
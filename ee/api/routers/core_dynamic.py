@@ -160,8 +160,8 @@ async def get_session(projectId: int, sessionId: Union[int, str], background_tas
                       context: schemas.CurrentContext = Depends(OR_context)):
     if isinstance(sessionId, str):
         return {"errors": ["session not found"]}
-    data = sessions.get_by_id2_pg(project_id=projectId, session_id=sessionId, full_data=True,
-                                  include_fav_viewed=True, group_metadata=True, context=context)
+    data = await sessions.get_by_id2_pg_async(project_id=projectId, session_id=sessionId, full_data=True,
+                                              include_fav_viewed=True, group_metadata=True, context=context)
     if data is None:
         return {"errors": ["session not found"]}
     if data.get("inDB"):
@@ -250,8 +250,9 @@ async def get_live_session(projectId: int, sessionId: str, background_tasks: Bac
                            context: schemas_ee.CurrentContext = Depends(OR_context)):
     data = assist.get_live_session_by_id(project_id=projectId, session_id=sessionId)
     if data is None:
-        data = sessions.get_by_id2_pg(context=context, project_id=projectId, session_id=sessionId,
-                                      full_data=True, include_fav_viewed=True, group_metadata=True, live=False)
+        data = await sessions.get_by_id2_pg_async(context=context, project_id=projectId, session_id=sessionId,
+                                                  full_data=True, include_fav_viewed=True, group_metadata=True,
+                                                  live=False)
         if data is None:
             return {"errors": ["session not found"]}
         if data.get("inDB"):
@@ -0,0 +1,71 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+Offsets = Dict[Tuple[str, int], int]
+
+
+class BackgroundWriter:
+    """
+    Inserts batches from a background thread, so that the poll loop keeps consuming
+    while a batch is being written to the warehouse.
+    At most `max_pending` batches wait in the queue, `submit` blocks while it is full (back-pressure).
+    Batches are written one at a time in submission order. The Kafka offsets given with a batch
+    are handed back by `done()` once that batch, and so every batch before it, has been written,
+    for the consumer to commit them from its own thread.
+    A write still failing after `retries` attempts stops the writer: the error is raised by the next
+    call to `submit` or `done`, so that the connector restarts from the last committed offsets.
+    """
+
+    def __init__(self, max_pending: int = 2, retries: int = 3, retry_delay: float = 1.0):
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.error = None
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._done = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='batch-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, write: Callable, batch, offsets: Optional[Offsets] = None) -> None:
+        item = (write, batch, offsets)
+        while True:
+            self._raise_error()
+            try:
+                self._pending.put(item, timeout=1.0)
+                return
+            except queue.Full:
+                continue
+
+    def done(self) -> Offsets:
+        """
+        Returns the next offset to commit for each partition written since the last call
+        """
+        self._raise_error()
+        offsets = dict()
+        while True:
+            try:
+                offsets.update(self._done.get_nowait())
+            except queue.Empty:
+                return offsets
+
+    def _raise_error(self) -> None:
+        if self.error is not None:
+            raise RuntimeError("Background batch writer stopped") from self.error
+
+    def _run(self) -> None:
+        while True:
+            write, batch, offsets = self._pending.get()
+            for attempt in range(1, self.retries + 1):
+                try:
+                    write(batch)
+                    break
+                except Exception as e:
+                    print(f"Batch write failed (attempt {attempt}/{self.retries})")
+                    print(repr(e))
+                    if attempt == self.retries:
+                        self.error = e
+                        return
+                    time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            if offsets:
+                self._done.put(offsets)
@@ -0,0 +1,80 @@
+"""
+Cost of db.utils.get_df_from_batch on a detailed events batch, next to the former
+implementation (DataFrame of objects, astype, then str.slice / str.replace per string column).
+The events are built from recorded batches, as the connector would at the `detailed` level.
+Needs the same environment as the connector (db.models reads DATABASE_NAME etc.).
+    python -m benchmarks.dataframe [--rows 4000] <recording> [<recording> ...]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.recording import load_records
+from db.batch import ColumnarBatch
+from db.utils import detailed_events_col, dtypes_detailed_events, get_df_from_batch
+from handler import detailed_level_message_ids, handle_message
+from msgcodec.msgcodec import MessageCodec
+
+
+def detailed_batch(paths, rows) -> ColumnarBatch:
+    codec = MessageCodec()
+    batch = ColumnarBatch(detailed_events_col)
+    while len(batch) < rows:
+        for key, value in load_records(paths):
+            session_id = codec.decode_key(key)
+            for message in codec.decode_buffer(value, wanted=detailed_level_message_ids):
+                n = handle_message(message)
+                if n:
+                    n['sessionid'] = session_id
+                    n['received_at'] = int(time.time() * 1000)
+                    n['batch_order_number'] = len(batch)
+                    batch.append(n)
+                    if len(batch) >= rows:
+                        return batch
+    return batch
+
+
+def former_df_from_batch(batch):
+    df = pd.DataFrame(batch.to_columns(), columns=batch.columns)
+    df['inputevent_value'] = None
+    df['customevent_payload'] = None
+    df = df.astype(dtypes_detailed_events)
+    for x in df.columns:
+        if df[x].dtype == 'string':
+            df[x] = df[x].str.slice(0, 255)
+            df[x] = df[x].str.replace("|", "", regex=False)
+    return df
+
+
+def run(name, f, batch, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f(batch)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<20} {best * 1000:>10.1f} ms")
+    return best
+
+
+def main(paths, rows):
+    batch = detailed_batch(paths, rows)
+    print(f"{len(batch)} rows x {len(batch.columns)} columns, "
+          f"{sum(batch.is_null(c) for c in batch.columns)} columns entirely null")
+    try:
+        pd.testing.assert_frame_equal(former_df_from_batch(batch), get_df_from_batch(batch, level='detailed'))
+    except AssertionError as e:
+        print(f"WARNING: the frames differ\n{e}")
+
+    former = run("former", former_df_from_batch, batch)
+    current = run("get_df_from_batch", lambda b: get_df_from_batch(b, level='detailed'), batch)
+    print(f"speedup: x{former / current:.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('recordings', nargs='+')
+    parser.add_argument('--rows', type=int, default=4000)
+    args = parser.parse_args()
+    main(args.recordings, args.rows)
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the MessageCodec decoding paths over recorded batches.
+    python -m benchmarks.decoder [--wanted 0,1,31,...] <recording> [<recording> ...]
+"""
+import argparse
+import time
+
+from benchmarks.recording import load_records
+from msgcodec.msgcodec import MessageCodec
+
+
+def same_messages(a, b) -> bool:
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if type(x) is not type(y) or x.to_dict() != y.to_dict():
+            return False
+    return True
+
+
+def run(name, decode, values, repeat=5):
+    best = None
+    n_messages = 0
+    for _ in range(repeat):
+        n_messages = 0
+        start = time.perf_counter()
+        for value in values:
+            n_messages += len(decode(value))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<20} {len(values) / best:>12.0f} batches/s {n_messages / best:>12.0f} messages/s")
+    return best
+
+
+def main(paths, wanted=None):
+    codec = MessageCodec()
+    values = [value for _, value in load_records(paths)]
+    print(f"{len(values)} batches, {sum(len(v) for v in values)} bytes")
+
+    mismatches = sum(not same_messages(codec.decode_detailed(v, wanted), codec.decode_buffer(v, wanted))
+                     for v in values)
+    if mismatches:
+        print(f"WARNING: {mismatches} batches decoded differently")
+
+    stream = run("decode_detailed", codec.decode_detailed, values)
+    buffer = run("decode_buffer", codec.decode_buffer, values)
+    print(f"speedup: x{stream / buffer:.2f}")
+    if wanted is not None:
+        selective = run("decode_buffer wanted", lambda v: codec.decode_buffer(v, wanted), values)
+        print(f"speedup: x{stream / selective:.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('recordings', nargs='+')
+    parser.add_argument('--wanted', help="comma separated message ids to decode, the rest is skipped")
+    args = parser.parse_args()
+    main(args.recordings, wanted={int(i) for i in args.wanted.split(',')} if args.wanted else None)
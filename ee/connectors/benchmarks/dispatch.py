@@ -0,0 +1,74 @@
+"""
+Benchmark of the message dispatch in MessageCodec: table lookup (DECODERS_FROM) against
+the linear `if message_id == N` chain it replaced, over the message id distribution
+found in recorded batches.
+    python -m benchmarks.dispatch <recording> [<recording> ...]
+"""
+import sys
+import time
+from collections import Counter
+
+from benchmarks.recording import load_records
+from msgcodec import msgcodec
+from msgcodec.msgcodec import DECODERS_FROM, MESSAGES_WITHOUT_SIZE, MessageCodec
+
+
+def build_chain():
+    """
+    Rebuilds the old if-chain, in the same order, on top of the generated decode functions
+    """
+    lines = ["def chain(buf, pos, message_id):"]
+    for message_id, decode in DECODERS_FROM.items():
+        lines.append(f"    if message_id == {message_id}:")
+        lines.append(f"        return {decode.__name__}(buf, pos)")
+    lines.append("    return None, pos")
+    namespace = dict(vars(msgcodec))
+    exec("\n".join(lines), namespace)
+    return namespace['chain']
+
+
+def message_offsets(codec, values):
+    """
+    (buffer, position, message id) of every message in BatchMetadata batches
+    """
+    offsets = list()
+    for value in values:
+        buf = memoryview(value)
+        message, pos = codec.handler_from(buf, 0, 0)
+        if not isinstance(message, msgcodec.BatchMetadata):
+            continue
+        while pos < len(buf):
+            message_id, pos = codec.read_uint_from(buf, pos)
+            if message_id not in MESSAGES_WITHOUT_SIZE:
+                pos += 3
+            offsets.append((buf, pos, message_id))
+            _, pos = DECODERS_FROM[message_id](buf, pos)
+    return offsets
+
+
+def run(name, offsets, dispatch, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for buf, pos, message_id in offsets:
+            dispatch(buf, pos, message_id)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<10} {len(offsets) / best:>12.0f} messages/s")
+    return best
+
+
+def main(paths):
+    codec = MessageCodec()
+    offsets = message_offsets(codec, [value for _, value in load_records(paths)])
+    distribution = Counter(message_id for _, _, message_id in offsets)
+    print(f"{len(offsets)} messages, most common ids:",
+          ", ".join(f"{i}: {n / len(offsets):.1%}" for i, n in distribution.most_common(10)))
+
+    chain = run("if-chain", offsets, build_chain())
+    table = run("table", offsets, codec.read_head_message_from)
+    print(f"speedup: x{chain / table:.2f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,56 @@
+"""
+Per message type cost of the connector handlers (handle_message, handle_normal_message,
+handle_session), to check it stays flat whatever the position of the type in the registry.
+An isinstance chain in the registry order is timed next to it for comparison.
+Needs the same environment as the connector (db.models reads DATABASE_NAME etc.).
+    python -m benchmarks.handlers
+"""
+import time
+
+from handler import detailed_handlers, normal_handlers, session_handlers
+from handler import handle_message, handle_normal_message, handle_session
+from msgcodec.messages import SessionStart
+
+
+def sample(message_class):
+    fields = getattr(message_class, '_fields', None) or message_class.__slots__
+    return message_class(*[1] * len(fields))
+
+
+def isinstance_chain(handlers, *args):
+    chain = list(handlers.items())
+
+    def handle(message):
+        for message_class, handler in chain:
+            if isinstance(message, message_class):
+                return handler(*args, message)
+    return handle
+
+
+def per_message(handle, message, n=20000):
+    start = time.perf_counter()
+    for _ in range(n):
+        handle(message)
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def report(name, handle, handlers, *args):
+    chain = isinstance_chain(handlers, *args)
+    print(f"{name}: ns/message, registry vs isinstance chain")
+    registry_costs = list()
+    for message_class in handlers:
+        message = sample(message_class)
+        registry_costs.append(per_message(handle, message))
+        print(f"  {message_class.__name__:<28} {registry_costs[-1]:>8.0f} {per_message(chain, message):>8.0f}")
+    print(f"  min {min(registry_costs):.0f} / max {max(registry_costs):.0f}")
+
+
+def main():
+    report("handle_message", handle_message, detailed_handlers)
+    report("handle_normal_message", handle_normal_message, normal_handlers)
+    session = handle_session(None, sample(SessionStart))
+    report("handle_session", lambda message: handle_session(session, message), session_handlers, session)
+
+
+if __name__ == '__main__':
+    main()
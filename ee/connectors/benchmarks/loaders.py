@@ -0,0 +1,79 @@
+"""
+Insert throughput of the db.loaders modes (to_sql vs bulk) for the configured DATABASE_NAME.
+Meant to run against a local stand-in (postgres / clickhouse container), with the same
+environment as the connector: the rows are really appended to the events table.
+The events are built from recorded batches, as the connector would at the `normal` level.
+    python -m benchmarks.loaders [--rows 4000] [--repeat 3] <recording> [<recording> ...]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.recording import load_records
+from db.api import DBConnection
+from db.batch import ColumnarBatch
+from db.models import events_table_name
+from db.utils import events_col, get_df_from_batch
+from handler import handle_normal_message, normal_level_message_ids
+from msgcodec.msgcodec import MessageCodec
+
+DATABASE = os.environ['DATABASE_NAME']
+
+if DATABASE == 'pg':
+    from db.loaders.postgres_loader import copy_to_postgres as bulk_insert
+elif DATABASE == 'clickhouse':
+    from db.loaders.clickhouse_loader import native_insert_to_clickhouse as bulk_insert
+elif DATABASE == 'snowflake':
+    from db.loaders.snowflake_loader import stage_insert_to_snowflake as bulk_insert
+else:
+    raise Exception(f"{DATABASE}-database has no bulk load mode")
+
+
+def events_df(paths, rows):
+    codec = MessageCodec()
+    batch = ColumnarBatch(events_col)
+    for key, value in load_records(paths):
+        session_id = codec.decode_key(key)
+        for message in codec.decode_buffer(value, wanted=normal_level_message_ids):
+            n = handle_normal_message(message)
+            if n:
+                n['sessionid'] = session_id
+                n['received_at'] = int(time.time() * 1000)
+                n['batch_order_number'] = len(batch)
+                batch.append(n)
+                if len(batch) >= rows:
+                    return get_df_from_batch(batch, level='normal')
+    return get_df_from_batch(batch, level='normal')
+
+
+def run(name, insert, db, df, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        insert(db, df, events_table_name)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{name:<8} {len(df) / best:>12.0f} rows/s")
+    return best
+
+
+def to_sql_insert(db, df, table):
+    df.to_sql(table, db.engine, if_exists='append', index=False)
+
+
+def main(paths, rows, repeat):
+    db = DBConnection(DATABASE)
+    df = events_df(paths, rows)
+    print(f"{DATABASE}: {len(df)} rows x {len(df.columns)} columns into {events_table_name}")
+    to_sql = run("to_sql", to_sql_insert, db, df, repeat)
+    bulk = run("bulk", bulk_insert, db, df, repeat)
+    print(f"speedup: x{to_sql / bulk:.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('recordings', nargs='+')
+    parser.add_argument('--rows', type=int, default=4000, help="rows per insert, the connector batch size")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    main(args.recordings, args.rows, args.repeat)
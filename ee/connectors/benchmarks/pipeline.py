@@ -0,0 +1,158 @@
+"""
+End to end throughput of the connector pipeline over recorded batches, without Kafka:
+decode (MessageCodec), handlers (events and sessions), get_df_from_batch and a sink, each stage timed.
+The batches are cut and flushed as the consumer does, `--rows` events / `--session-rows` ended sessions.
+Sinks: `null` (nothing written), `pg` or `clickhouse` (a local stand-in, with DATABASE_NAME set to it:
+the rows are really appended to the tables, through the loader selected by load_mode).
+Needs the same environment as the connector (db.models reads DATABASE_NAME etc.).
+    python -m benchmarks.pipeline [--level detailed] [--sink null] [--decoder buffer] [--loops 1] <recording> [...]
+"""
+import argparse
+import os
+import resource
+import time
+from collections import defaultdict
+
+from benchmarks.recording import load_records
+from db.batch import ColumnarBatch
+from db.models import events_detailed_table_name, events_table_name, sessions_table_name
+from db.utils import detailed_events_col, events_col, get_df_from_batch
+from handler import detailed_level_message_ids, normal_level_message_ids
+from handler import handle_message, handle_normal_message, handle_session
+from msgcodec.messages import SessionEnd
+from msgcodec.msgcodec import MessageCodec
+
+STAGES = ('decode', 'handle', 'dataframe', 'sink')
+
+
+def null_sink():
+    return lambda df, table: None
+
+
+def database_sink(database):
+    if os.environ['DATABASE_NAME'] != database:
+        raise Exception(f"the {database} sink needs DATABASE_NAME={database}")
+    from db.api import DBConnection
+    from db import tables
+    db = DBConnection(database)
+    if database == 'pg':
+        from db.loaders.postgres_loader import insert_to_postgres as insert
+        tables.create_tables_postgres(db)
+    else:
+        from db.loaders.clickhouse_loader import insert_to_clickhouse as insert
+        tables.create_tables_clickhouse(db)
+    return lambda df, table: insert(db, df, table)
+
+
+sinks = {'null': null_sink,
+         'pg': lambda: database_sink('pg'),
+         'clickhouse': lambda: database_sink('clickhouse')}
+
+
+class Pipeline:
+
+    def __init__(self, level, sink, decoder, rows, session_rows):
+        self.codec = MessageCodec()
+        self.level = level
+        self.sink = sink
+        self.decode = getattr(self.codec, f'decode_{decoder}')
+        if level == 'detailed':
+            self.handle, self.columns, self.table = handle_message, detailed_events_col, events_detailed_table_name
+            self.wanted = detailed_level_message_ids
+        else:
+            self.handle, self.columns, self.table = handle_normal_message, events_col, events_table_name
+            self.wanted = normal_level_message_ids
+        self.rows = rows
+        self.session_rows = session_rows
+        self.batch = ColumnarBatch(self.columns)
+        self.sessions = dict()
+        self.sessions_batch = list()
+        self.times = defaultdict(float)
+        self.messages = 0
+        self.events = 0
+        self.ended_sessions = 0
+
+    def write(self, batch, table, level):
+        start = time.perf_counter()
+        df = get_df_from_batch(batch, level=level)
+        middle = time.perf_counter()
+        self.sink(df, table)
+        self.times['dataframe'] += middle - start
+        self.times['sink'] += time.perf_counter() - middle
+
+    def flush(self, force=False):
+        if self.sessions_batch and (force or len(self.sessions_batch) >= self.session_rows):
+            for s in self.sessions_batch:
+                self.sessions.pop(s.sessionid, None)
+            self.write(self.sessions_batch, sessions_table_name, 'sessions')
+            self.ended_sessions += len(self.sessions_batch)
+            self.sessions_batch = list()
+        if len(self.batch) and (force or len(self.batch) >= self.rows):
+            self.write(self.batch, self.table, self.level)
+            self.events += len(self.batch)
+            self.batch = ColumnarBatch(self.columns)
+
+    def feed(self, key, value):
+        start = time.perf_counter()
+        session_id = self.codec.decode_key(key)
+        messages = self.decode(value, self.wanted) or ()
+        middle = time.perf_counter()
+        for message in messages:
+            n = self.handle(message)
+            session = handle_session(self.sessions.get(session_id), message)
+            if session:
+                session.sessionid = session_id
+                self.sessions[session_id] = session
+                if isinstance(message, SessionEnd):
+                    self.sessions_batch.append(session)
+            if n:
+                n['sessionid'] = session_id
+                n['received_at'] = int(time.time() * 1000)
+                n['batch_order_number'] = len(self.batch)
+                self.batch.append(n)
+        self.times['decode'] += middle - start
+        self.times['handle'] += time.perf_counter() - middle
+        self.messages += len(messages)
+        self.flush()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(paths, level, sink, decoder, rows, session_rows, loops):
+    records = load_records(paths)
+    print(f"{len(records)} batches, {sum(len(v) for _, v in records)} bytes, "
+          f"{loops} loop(s), level {level}, sink {sink}, decode_{decoder}")
+    pipeline = Pipeline(level, sinks[sink](), decoder, rows, session_rows)
+
+    start = time.perf_counter()
+    for _ in range(loops):
+        for key, value in records:
+            pipeline.feed(key, value)
+    pipeline.flush(force=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"{pipeline.messages / elapsed:>12.0f} messages/s")
+    print(f"{(pipeline.events + pipeline.ended_sessions) / elapsed:>12.0f} rows/s "
+          f"({pipeline.events} events, {pipeline.ended_sessions} sessions)")
+    print(f"{peak_rss_mb():>12.1f} MB peak RSS")
+    for stage in STAGES:
+        print(f"  {stage:<10} {pipeline.times[stage]:>8.3f} s {pipeline.times[stage] / elapsed:>7.1%}")
+    other = elapsed - sum(pipeline.times.values())
+    print(f"  {'other':<10} {other:>8.3f} s {other / elapsed:>7.1%}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('recordings', nargs='+')
+    parser.add_argument('--level', choices=('normal', 'detailed'), default='detailed')
+    parser.add_argument('--sink', choices=sorted(sinks), default='null')
+    parser.add_argument('--decoder', choices=('buffer', 'detailed'), default='buffer',
+                        help="MessageCodec.decode_buffer (the connector's) or decode_detailed")
+    parser.add_argument('--rows', type=int, default=4000, help="events per batch")
+    parser.add_argument('--session-rows', type=int, default=400, help="ended sessions per batch")
+    parser.add_argument('--loops', type=int, default=1, help="times the recordings are replayed")
+    args = parser.parse_args()
+    main(args.recordings, args.level, args.sink, args.decoder, args.rows, args.session_rows, args.loops)
@@ -0,0 +1,78 @@
+"""
+Recorded Kafka payloads used by the benchmarks.
+A recording is a flat binary file of (key, value) records, each one written as
+a little endian uint32 length followed by the raw bytes.
+
+To record batches from the `raw` topics:
+    python -m benchmarks.recording <output file> [number of records]
+"""
+import os
+import struct
+import sys
+from typing import Iterator, Iterable, List, Tuple
+
+_length = struct.Struct('<I')
+
+
+def write_records(path, records: Iterable[Tuple[bytes, bytes]]) -> int:
+    n = 0
+    with open(path, 'ab') as f:
+        for key, value in records:
+            f.write(_length.pack(len(key)))
+            f.write(key)
+            f.write(_length.pack(len(value)))
+            f.write(value)
+            n += 1
+    return n
+
+
+def iter_records(path) -> Iterator[Tuple[bytes, bytes]]:
+    with open(path, 'rb') as f:
+        data = f.read()
+    pos = 0
+    while pos < len(data):
+        (key_length,) = _length.unpack_from(data, pos)
+        pos += 4
+        key = data[pos:pos + key_length]
+        pos += key_length
+        (value_length,) = _length.unpack_from(data, pos)
+        pos += 4
+        value = data[pos:pos + value_length]
+        pos += value_length
+        yield key, value
+
+
+def load_records(paths: List[str]) -> List[Tuple[bytes, bytes]]:
+    records = list()
+    for path in paths:
+        records.extend(iter_records(path))
+    return records
+
+
+def record_from_kafka(path, limit: int) -> int:
+    from confluent_kafka import Consumer
+
+    consumer = Consumer({
+        "security.protocol": "SSL",
+        "bootstrap.servers": ",".join([os.environ['KAFKA_SERVER_1'],
+                                       os.environ['KAFKA_SERVER_2']]),
+        "group.id": "connector_recorder",
+        "auto.offset.reset": "earliest",
+        "enable.auto.commit": False
+    })
+    consumer.subscribe(["raw", "raw_ios"])
+    records = list()
+    try:
+        while len(records) < limit:
+            msg = consumer.poll(1.0)
+            if msg is None or msg.error():
+                continue
+            records.append((msg.key(), msg.value()))
+    finally:
+        consumer.close()
+    return write_records(path, records)
+
+
+if __name__ == '__main__':
+    n = record_from_kafka(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+    print(f"{n} records written to {sys.argv[1]}")
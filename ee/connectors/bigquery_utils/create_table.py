@@ -2,6 +2,7 @@ import os
 from google.cloud import bigquery
 
 from db.loaders.bigquery_loader import creds_file
+from db.message_tables import message_columns, message_table_name
 
 
 def create_tables_bigquery():
@@ -595,3 +596,22 @@ def create_table_negatives(creds_file, table_id):
     print(
         "Created table {}.{}.{}".format(table.project, table.dataset_id, table.table_id)
     )
+
+
+def create_message_tables_bigquery(message_ids):
+    """
+    Tables of the per-message-type mode (events_mode=tables), one per message type
+    """
+    for message_id in message_ids:
+        table_name = message_table_name(message_id)
+        create_message_table(creds_file=creds_file,
+                             table_id=f"{os.environ['project_id']}.{os.environ['dataset']}.{table_name}",
+                             message_id=message_id)
+        print(f"`{table_name}` table created succesfully.")
+
+
+def create_message_table(creds_file, table_id, message_id):
+    types = {'int': 'INT64', 'uint': 'INT64', 'boolean': 'BOOL', 'string': 'STRING'}
+    schema = [bigquery.SchemaField(column, types[type_], mode="REQUIRED" if column == 'sessionid' else "NULLABLE")
+              for column, type_ in message_columns(message_id)]
+    create_table(creds_file, table_id, schema)
@@ -1,34 +1,201 @@
+import multiprocessing
 import os
-from confluent_kafka import Consumer
+import queue
+import time
+from confluent_kafka import Consumer, TopicPartition
 from datetime import datetime
-from collections import defaultdict
 
 from msgcodec.msgcodec import MessageCodec
 from msgcodec.messages import SessionEnd
 from db.api import DBConnection
 from db.models import events_detailed_table_name, events_table_name, sessions_table_name
-from db.writer import insert_batch
-from handler import handle_message, handle_normal_message, handle_session
+from db.batch import ColumnarBatch, MessageTablesBatch
+from db.message_tables import EVENTS_MODE, message_columns
+from db.utils import detailed_events_col, events_col
+from db.writer import insert_batch, insert_message_batch, prepare_message_tables, prepare_tables, start_spill_drainer
+from handler import handle_message, handle_message_row, handle_normal_message, handle_session
+from handler import detailed_level_message_ids, message_table_ids, normal_level_message_ids
+from session_cache import SessionCache
+from background_writer import BackgroundWriter
+from flush_policy import FlushPolicy, row_size
+import metrics
 
 DATABASE = os.environ['DATABASE_NAME']
 LEVEL = os.environ['level']
 
+SESSIONS_CACHE_SIZE = int(os.getenv('sessions_cache_size', 100000))
+SESSIONS_TTL = int(os.getenv('sessions_ttl', 3600))
+WRITER_QUEUE_SIZE = int(os.getenv('writer_queue_size', 2))
+# a batch is flushed at the first limit reached, 0 disables a limit (ages in seconds)
+EVENTS_BATCH_ROWS = int(os.getenv('events_batch_rows', 4000))
+EVENTS_BATCH_BYTES = int(os.getenv('events_batch_bytes', 0))
+EVENTS_BATCH_AGE = int(os.getenv('events_batch_age', 60))
+SESSIONS_BATCH_ROWS = int(os.getenv('sessions_batch_rows', 400))
+SESSIONS_BATCH_BYTES = int(os.getenv('sessions_batch_bytes', 0))
+SESSIONS_BATCH_AGE = int(os.getenv('sessions_batch_age', 60))
+# decode processes of the worker-pool mode (1: decode in the consumer process) and messages queued for each
+WORKERS = int(os.getenv('workers', 1))
+WORKER_QUEUE_SIZE = int(os.getenv('worker_queue_size', 1000))
+
 db = DBConnection(DATABASE)
 
 if LEVEL == 'detailed':
     table_name = events_detailed_table_name
+    table_columns = detailed_events_col
+    wanted_messages = detailed_level_message_ids
 elif LEVEL == 'normal':
     table_name = events_table_name
+    table_columns = events_col
+    wanted_messages = normal_level_message_ids
+# detailed level only: the events are written to one table per message type
+MESSAGE_TABLES = LEVEL == 'detailed' and EVENTS_MODE == 'tables'
 
 
-def main():
-    batch_size = 4000
-    sessions_batch_size = 400
-    batch = []
-    sessions = defaultdict(lambda: None)
-    sessions_batch = []
+def new_events_batch():
+    if MESSAGE_TABLES:
+        return MessageTablesBatch(lambda message_id: [column for column, _ in message_columns(message_id)])
+    return ColumnarBatch(table_columns)
 
-    codec = MessageCodec()
+
+class Worker:
+    """
+    Decodes Kafka messages into the events and sessions batches, which are flushed by a BackgroundWriter
+    as set by the flush policies. Runs in the consumer process, or in each decode process of the pool mode.
+    """
+
+    def __init__(self):
+        self.codec = MessageCodec()
+        self.writer = BackgroundWriter(max_pending=WRITER_QUEUE_SIZE)
+        self.batch = new_events_batch()
+        self.sessions = SessionCache(max_size=SESSIONS_CACHE_SIZE, ttl=SESSIONS_TTL)
+        self.sessions_batch = []
+        self.events_policy = FlushPolicy(max_rows=EVENTS_BATCH_ROWS, max_bytes=EVENTS_BATCH_BYTES,
+                                         max_age=EVENTS_BATCH_AGE)
+        self.sessions_policy = FlushPolicy(max_rows=SESSIONS_BATCH_ROWS, max_bytes=SESSIONS_BATCH_BYTES,
+                                           max_age=SESSIONS_BATCH_AGE)
+        # next offset to read of every partition, for the messages fully added to the batches
+        self.offsets = dict()
+        self.submitted_offsets = dict()
+
+    def flush(self, now):
+        """
+        Submits the batches due to the writer, meant to be called on every poll, empty ones included
+        """
+        self.evict(now)
+        metrics.observe_sessions(self.sessions)
+        events_due = self.events_policy.due(now)
+        # the offsets also cover the sessions waiting in sessions_batch: these are submitted
+        # before any batch carrying offsets, the writer commits them once both are written
+        if self.sessions_policy.due(now) or events_due and self.sessions_batch:
+            for s in self.sessions_batch:
+                self.sessions.discard(s.sessionid, s)
+            self.writer.submit(attempt_session_insert, self.sessions_batch)
+            self.sessions_batch = []
+            self.sessions_policy.reset()
+        if events_due:
+            self.writer.submit(attempt_batch_insert, self.batch, dict(self.offsets))
+            self.batch = new_events_batch()
+            self.events_policy.reset()
+            self.submitted_offsets = dict(self.offsets)
+            print("sessions in cache:", self.sessions.stats())
+        elif self.events_policy.rows == 0 and not self.sessions_batch and self.offsets != self.submitted_offsets:
+            # messages without any row: their offsets still go through the writer, after the pending batches.
+            # Held back while sessions wait in sessions_batch, until the sessions policy submits them
+            self.writer.submit(lambda batch: None, None, dict(self.offsets))
+            self.submitted_offsets = dict(self.offsets)
+
+    def evict(self, now):
+        # run from flush, so that the sessions of idle partitions expire too.
+        # Sessions that never sent a SessionEnd are inserted as partial rows once evicted,
+        # the ended ones are already waiting in sessions_batch
+        for s in self.sessions.evict(now):
+            if s.session_end_timestamp is None:
+                self.sessions_batch.append(s)
+                self.sessions_policy.add(row_size(s.__dict__), now)
+
+    def handle(self, value, session_id, topic, partition, offset):
+        start = time.perf_counter()
+        messages = self.codec.decode_buffer(value, wanted=wanted_messages)
+        metrics.decode_seconds.observe(time.perf_counter() - start)
+        if messages is None:
+            print('-')
+            metrics.errors.labels('decode', 'undecodable').inc()
+            messages = ()
+        metrics.count_messages(messages)
+
+        now = time.time()
+        sessions = self.sessions
+        for message in messages:
+            if MESSAGE_TABLES:
+                n = handle_message_row(message)
+            elif LEVEL == 'detailed':
+                n = handle_message(message)
+            elif LEVEL == 'normal':
+                n = handle_normal_message(message)
+
+            session = handle_session(sessions.get(session_id), message)
+            if session:
+                session.sessionid = session_id
+                sessions.put(session_id, session, now)
+
+            # put in a batch for insertion if received a SessionEnd
+            if isinstance(message, SessionEnd):
+                if session:
+                    self.sessions_batch.append(session)
+                    self.sessions_policy.add(row_size(session.__dict__), now)
+
+            if n:
+                n['sessionid'] = session_id
+                n['received_at'] = int(datetime.now().timestamp() * 1000)
+                n['batch_order_number'] = len(self.batch)
+                if MESSAGE_TABLES:
+                    self.batch.append(message.__id__, n)
+                else:
+                    self.batch.append(n)
+                self.events_policy.add(row_size(n), now)
+        self.offsets[(topic, partition)] = offset + 1
+
+
+class OffsetTracker:
+    """
+    Commit points of the partitions whose messages are split between the pool workers.
+    The offset of a partition can be committed once every worker has flushed
+    all the messages of that partition it was sent below that offset.
+    """
+
+    def __init__(self, workers: int):
+        self.dispatched = [dict() for _ in range(workers)]
+        self.flushed = [dict() for _ in range(workers)]
+        self.committed = dict()
+
+    def dispatch(self, worker: int, partition, offset: int):
+        # everything before the first message sent to a worker is flushed as far as it is concerned
+        self.flushed[worker].setdefault(partition, offset)
+        self.dispatched[worker][partition] = offset + 1
+
+    def flush(self, worker: int, offsets: dict):
+        self.flushed[worker].update(offsets)
+
+    def committable(self) -> dict:
+        """
+        Returns the commit points that moved since the last call
+        """
+        offsets = dict()
+        for partition in set().union(*self.dispatched):
+            done, pending = 0, None
+            for dispatched, flushed in zip(self.dispatched, self.flushed):
+                if partition not in dispatched:
+                    continue
+                done = max(done, dispatched[partition])
+                if flushed[partition] < dispatched[partition]:
+                    pending = flushed[partition] if pending is None else min(pending, flushed[partition])
+            offset = done if pending is None else pending
+            if offset > self.committed.get(partition, 0):
+                offsets[partition] = self.committed[partition] = offset
+        return offsets
+
+
+def create_consumer():
     consumer = Consumer({
         "security.protocol": "SSL",
         "bootstrap.servers": ",".join([os.environ['KAFKA_SERVER_1'],
@@ -37,61 +204,119 @@ def main():
         "auto.offset.reset": "earliest",
         "enable.auto.commit": False
         })
-
     consumer.subscribe(["raw", "raw_ios"])
     print("Kafka consumer subscribed")
+    return consumer
+
+
+def main():
+    prepare_tables()
+    if MESSAGE_TABLES:
+        # before the pool mode forks its workers, which inherit the registered tables
+        prepare_message_tables(message_table_ids)
+    if WORKERS > 1:
+        return main_pool(WORKERS)
+
+    metrics.serve()
+    start_spill_drainer()
+    worker = Worker()
+    consumer = create_consumer()
     while True:
-        msg.consumer.poll(1.0)
+        commit(consumer, worker.writer.done())
+        worker.flush(time.time())
+
+        msg = consumer.poll(1.0)
         if msg is None:
             continue
-        messages = codec.decode_detailed(msg.value)
-        session_id = codec.decode_key(msg.key)
-        if messages is None:
-            print('-')
+        observe_lag(consumer, msg)
+        session_id = worker.codec.decode_key(msg.key())
+        worker.handle(msg.value(), session_id, msg.topic(), msg.partition(), msg.offset())
+
+
+def main_pool(workers):
+    """
+    Worker-pool mode: the messages are sent to `workers` decode processes by session id,
+    so each session is handled by one process, in order, with its own sessions map and batches.
+    This process only polls Kafka and commits the offsets flushed by every worker.
+    """
+    reports = multiprocessing.Queue()
+    inboxes = [multiprocessing.Queue(maxsize=WORKER_QUEUE_SIZE) for _ in range(workers)]
+    processes = [multiprocessing.Process(target=run_worker, args=(i, inboxes[i], reports),
+                                         name=f"connector-worker-{i}", daemon=True)
+                 for i in range(workers)]
+    for process in processes:
+        process.start()
+
+    metrics.serve()
+    codec = MessageCodec()
+    tracker = OffsetTracker(workers)
+    consumer = create_consumer()
+    while True:
+        check_workers(processes)
+        while True:
+            try:
+                tracker.flush(*reports.get_nowait())
+            except queue.Empty:
+                break
+        commit(consumer, tracker.committable())
+
+        msg = consumer.poll(1.0)
+        if msg is None:
             continue
+        observe_lag(consumer, msg)
+        session_id = codec.decode_key(msg.key())
+        i = session_id % workers
+        item = (msg.value(), session_id, msg.topic(), msg.partition(), msg.offset())
+        while True:
+            try:
+                inboxes[i].put(item, timeout=1.0)
+                break
+            except queue.Full:
+                check_workers(processes)
+        tracker.dispatch(i, (msg.topic(), msg.partition()), msg.offset())
 
-        for message in messages:
-            if LEVEL == 'detailed':
-                n = handle_message(message)
-            elif LEVEL == 'normal':
-                n = handle_normal_message(message)
 
-            #session_id = codec.decode_key(msg.key)
-            sessions[session_id] = handle_session(sessions[session_id], message)
-            if sessions[session_id]:
-                sessions[session_id].sessionid = session_id
+def check_workers(processes):
+    for process in processes:
+        if not process.is_alive():
+            raise RuntimeError(f"{process.name} stopped (exit code {process.exitcode})")
 
-            # put in a batch for insertion if received a SessionEnd
-            if isinstance(message, SessionEnd):
-                if sessions[session_id]:
-                    sessions_batch.append(sessions[session_id])
-
-            # try to insert sessions
-            if len(sessions_batch) >= sessions_batch_size:
-                attempt_session_insert(sessions_batch)
-                for s in sessions_batch:
-                    try:
-                        del sessions[s.sessionid]
-                    except KeyError  as e:
-                        print(repr(e))
-                sessions_batch = []
 
-            if n:
-                n.sessionid = session_id
-                n.received_at = int(datetime.now().timestamp() * 1000)
-                n.batch_order_number = len(batch)
-                batch.append(n)
-            else:
-                continue
+def run_worker(index, inbox, reports):
+    global db
+    # own connections, not the ones inherited from the parent process
+    db = DBConnection(DATABASE)
+    metrics.serve(index)
+    start_spill_drainer()
+    worker = Worker()
+    while True:
+        offsets = worker.writer.done()
+        if offsets:
+            reports.put((index, offsets))
+        worker.flush(time.time())
+        try:
+            item = inbox.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        worker.handle(*item)
+
+
+def observe_lag(consumer, msg):
+    # cached: the high watermark known from the last fetch, no request to the broker
+    _, high = consumer.get_watermark_offsets(TopicPartition(msg.topic(), msg.partition()), cached=True)
+    metrics.observe_lag(msg.topic(), msg.partition(), msg.offset(), high)
 
-            # insert a batch of events
-            if len(batch) >= batch_size:
-                attempt_batch_insert(batch)
-                batch = []
-                consumer.commit()
-                print("sessions in cache:", len(sessions))
 
+def commit(consumer, offsets):
+    if offsets:
+        consumer.commit(offsets=[TopicPartition(topic, partition, offset)
+                                 for (topic, partition), offset in offsets.items()],
+                        asynchronous=False)
 
+
+# Conversion errors are logged and the batch dropped, as retrying would not help.
+# Failed writes are spilled to disk by db.writer and written back by the spill drainer,
+# any other error is raised to the BackgroundWriter, which retries the batch.
 def attempt_session_insert(sess_batch):
     if sess_batch:
         try:
@@ -104,15 +329,19 @@ def attempt_session_insert(sess_batch):
         except ValueError as e:
             print("Message value could not be processed or inserted correctly")
             print(repr(e))
-        except Exception as e:
-            print(repr(e))
 
 
 def attempt_batch_insert(batch):
     # insert a batch
     try:
         print("inserting...")
-        insert_batch(db=db, batch=batch, table=table_name, level=LEVEL)
+        if isinstance(batch, MessageTablesBatch):
+            # the tables written are dropped from the batch, a retry only writes the others
+            for message_id in list(batch.batches):
+                insert_message_batch(db, batch.batches[message_id], message_id)
+                del batch.batches[message_id]
+        else:
+            insert_batch(db=db, batch=batch, table=table_name, level=LEVEL)
         print("inserted succesfully")
     except TypeError as e:
         print("Type conversion error")
@@ -120,8 +349,6 @@ def attempt_batch_insert(batch):
     except ValueError as e:
         print("Message value could not be processed or inserted correctly")
         print(repr(e))
-    except Exception as e:
-        print(repr(e))
 
 def decode_key(b) -> int:
     """
@@ -9,6 +9,8 @@ from pathlib import Path
 DATABASE = os.environ['DATABASE_NAME']
 if DATABASE == 'redshift':
     import pandas_redshift as pr
+elif DATABASE == 'clickhouse':
+    from clickhouse_driver import Client
 
 base_path = Path(__file__).parent.parent
 
@@ -70,6 +72,9 @@ class DBConnection:
                 database=os.environ['database']
             )
             self.engine = create_engine(self.connect_str)
+            # native protocol client, used by the bulk load mode
+            host, _, port = os.environ['address'].partition(':')
+            self.client = Client(host=host, port=int(port or 9000), database=os.environ['database'])
         elif config == 'pg':
             self.connect_str = os.environ['connect_str'].format(
                 user=os.environ['user'],
@@ -0,0 +1,83 @@
+from typing import Callable, Dict, List, Tuple
+
+
+class ColumnarBatch:
+    """
+    Accumulates event rows straight into per-column arrays.
+    A row is a dict {column: value} holding only the columns set by the handler,
+    keys that are not a column of the table and None values are ignored.
+    Columns are kept sparse (row numbers + values) while appending and
+    are filled with None only once, when the batch is flushed.
+    """
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+        self._rows = {column: list() for column in columns}
+        self._values = {column: list() for column in columns}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, row: dict) -> None:
+        i = self.size
+        rows, values = self._rows, self._values
+        for column, value in row.items():
+            if value is None:
+                continue
+            try:
+                rows[column].append(i)
+            except KeyError:
+                continue
+            values[column].append(value)
+        self.size = i + 1
+
+    def is_null(self, column: str) -> bool:
+        return not self._values[column]
+
+    def sparse(self, column: str) -> Tuple[List[int], list]:
+        """
+        Returns the row numbers holding a value in a column, and those values
+        """
+        return self._rows[column], self._values[column]
+
+    def column(self, column: str) -> list:
+        """
+        Returns the dense list of `size` values of a column
+        """
+        values = self._values[column]
+        if len(values) == self.size:
+            return values
+        dense = [None] * self.size
+        for i, value in zip(self._rows[column], values):
+            dense[i] = value
+        return dense
+
+    def to_columns(self) -> Dict[str, list]:
+        """
+        Returns one dense list of `size` values per column
+        """
+        return {column: self.column(column) for column in self.columns}
+
+
+class MessageTablesBatch:
+    """
+    Event rows of the per-message-type tables (events_mode=tables): one ColumnarBatch per message type,
+    created with the columns given by `columns_of(message_id)` on its first row.
+    The length is the number of rows of all the types.
+    """
+
+    def __init__(self, columns_of: Callable[[int], List[str]]):
+        self.columns_of = columns_of
+        self.batches: Dict[int, ColumnarBatch] = dict()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, message_id: int, row: dict) -> None:
+        batch = self.batches.get(message_id)
+        if batch is None:
+            batch = self.batches[message_id] = ColumnarBatch(self.columns_of(message_id))
+        batch.append(row)
+        self.size += 1
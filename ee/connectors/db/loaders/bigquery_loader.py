@@ -1,8 +1,14 @@
 import os
 from pathlib import Path
 
+from google.cloud import bigquery
 from google.oauth2.service_account import Credentials
 
+from db.staging import ParquetStager, staging_directory
+
+# 'to_sql' (pandas_gbq) or 'bulk' (local Parquet file loaded with a load job)
+LOAD_MODE = os.getenv('load_mode', 'to_sql')
+
 # obtain the JSON file:
 # In the Cloud Console, go to the Create service account key page.
 #
@@ -22,13 +28,33 @@ credentials = Credentials.from_service_account_file(
     creds_file)
 
 
+if LOAD_MODE == 'bulk':
+    stager = ParquetStager(staging_directory())
+
+
 def insert_to_bigquery(df, table):
+    if LOAD_MODE == 'bulk':
+        staged_insert_to_bigquery(df, table)
+        return
     df.to_gbq(destination_table=f"{os.environ['dataset']}.{table}",
               project_id=os.environ['project_id'],
               if_exists='append',
               credentials=credentials)
 
 
+def staged_insert_to_bigquery(df, table):
+    path = stager.write(df, table)
+    try:
+        client = bigquery.Client(project=os.environ['project_id'], credentials=credentials)
+        job_config = bigquery.LoadJobConfig(source_format=bigquery.SourceFormat.PARQUET,
+                                            write_disposition=bigquery.WriteDisposition.WRITE_APPEND)
+        with open(path, 'rb') as f:
+            client.load_table_from_file(f, f"{os.environ['project_id']}.{os.environ['dataset']}.{table}",
+                                        job_config=job_config).result()
+    finally:
+        stager.remove(path)
+
+
 def transit_insert_to_bigquery(db, batch):
     ...
 
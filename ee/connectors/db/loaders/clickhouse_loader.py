@@ -1,4 +1,17 @@
+import os
+
+# 'to_sql' (pandas INSERTs) or 'bulk' (native columnar INSERT)
+LOAD_MODE = os.getenv('load_mode', 'to_sql')
+
 
 def insert_to_clickhouse(db, df, table: str):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
+    if LOAD_MODE == 'bulk':
+        native_insert_to_clickhouse(db, df, table)
+    else:
+        df.to_sql(table, db.engine, if_exists='append', index=False)
+
 
+def native_insert_to_clickhouse(db, df, table: str):
+    # one block per batch, sent column by column over the native protocol
+    columns = [df[column].astype(object).where(df[column].notna(), None).tolist() for column in df.columns]
+    db.client.execute(f"INSERT INTO {table} ({', '.join(df.columns)}) VALUES", columns, columnar=True)
@@ -1,3 +1,27 @@
+import io
+import os
+
+# 'to_sql' (pandas INSERTs) or 'bulk' (COPY FROM STDIN)
+LOAD_MODE = os.getenv('load_mode', 'to_sql')
+
 
 def insert_to_postgres(db, df, table: str):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
+    if LOAD_MODE == 'bulk':
+        copy_to_postgres(db, df, table)
+    else:
+        df.to_sql(table, db.engine, if_exists='append', index=False)
+
+
+def copy_to_postgres(db, df, table: str):
+    # \N marks the NULLs, so that empty strings are kept as such
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+    buffer.seek(0)
+    columns = ', '.join(f'"{column}"' for column in df.columns)
+    connection = db.engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+        connection.commit()
+    finally:
+        connection.close()
@@ -1,11 +1,29 @@
-from db.models import DetailedEvent
+import os
+
+from db.models import Base, DetailedEvent
+from db.staging import ParquetStager, staging_directory
 from psycopg2.errors import InternalError_
 
+# 'to_sql' (pandas_redshift '|' delimited CSV) or 'bulk' (Parquet staged on S3, then COPY)
+LOAD_MODE = os.getenv('load_mode', 'to_sql')
+
+if LOAD_MODE == 'bulk':
+    stager = ParquetStager(staging_directory(),
+                           bucket=os.environ['bucket'],
+                           prefix=os.environ['subdirectory'],
+                           endpoint_url=os.getenv('s3_endpoint'),
+                           aws_access_key_id=os.environ['aws_access_key_id'],
+                           aws_secret_access_key=os.environ['aws_secret_access_key'],
+                           region_name=os.getenv('region_name'))
+
 
 def transit_insert_to_redshift(db, df, table):
 
     try:
-        insert_df(db.pdredshift, df, table)
+        if LOAD_MODE == 'bulk':
+            staged_insert_df(db.pdredshift, df, table)
+        else:
+            insert_df(db.pdredshift, df, table)
     except InternalError_ as e:
         print(repr(e))
         print("loading failed. check stl_load_errors")
@@ -17,3 +35,18 @@ def insert_df(pr, df, table):
                           redshift_table_name=table,
                           append=True,
                           delimiter='|')
+
+
+def staged_insert_df(pr, df, table):
+    # Write the DataFrame as Parquet to S3 and COPY it. Redshift maps the Parquet columns by position:
+    # the file holds the columns of the table in their order, the missing ones as nulls
+    df = df.reindex(columns=[column.name for column in Base.metadata.tables[table].columns])
+    path = stager.write(df, table)
+    try:
+        url = stager.upload(path)
+        pr.exec_commit(f"COPY {table} FROM '{url}' "
+                       f"ACCESS_KEY_ID '{os.environ['aws_access_key_id']}' "
+                       f"SECRET_ACCESS_KEY '{os.environ['aws_secret_access_key']}' "
+                       "FORMAT AS PARQUET")
+    finally:
+        stager.remove(path)
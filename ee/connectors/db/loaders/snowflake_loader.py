@@ -1,5 +1,28 @@
+import os
+import tempfile
+from pathlib import Path
+
+# 'to_sql' (pandas INSERTs) or 'bulk' (Parquet file PUT to the table stage, then COPY INTO)
+LOAD_MODE = os.getenv('load_mode', 'to_sql')
+
 
 def insert_to_snowflake(db, df, table):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
+    if LOAD_MODE == 'bulk':
+        stage_insert_to_snowflake(db, df, table)
+    else:
+        df.to_sql(table, db.engine, if_exists='append', index=False)
 
 
+def stage_insert_to_snowflake(db, df, table):
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{table}.parquet"
+        df.to_parquet(path, index=False)
+        connection = db.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"PUT 'file://{path.as_posix()}' @%{table} AUTO_COMPRESS = FALSE OVERWRITE = TRUE")
+            cursor.execute(f"COPY INTO {table} FROM @%{table} FILES = ('{path.name}') "
+                           "FILE_FORMAT = (TYPE = PARQUET) MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE")
+            connection.commit()
+        finally:
+            connection.close()
@@ -0,0 +1,53 @@
+import os
+from typing import Dict, List, Tuple
+
+from sqlalchemy import BigInteger, Boolean, Column, Table, VARCHAR
+
+from db.models import events_detailed_table_name, metadata
+from msgcodec.schema import message_schemas
+
+# 'wide': the detailed level writes every event to events_detailed_table_name, one column per message attribute.
+# 'tables': each message type is written to its own narrow table, <events_detailed_table_name>_<message type>
+EVENTS_MODE = os.getenv('events_mode', 'wide')
+
+# columns set by the connector on every row, before the attributes of the message
+row_columns = (('sessionid', 'uint'), ('received_at', 'uint'), ('batch_order_number', 'uint'))
+
+_column_types = {'int': BigInteger, 'uint': BigInteger, 'boolean': Boolean, 'string': lambda: VARCHAR(5000)}
+_dtypes = {'int': 'Int64', 'uint': 'Int64', 'boolean': 'boolean', 'string': 'string'}
+
+def message_table_name(message_id: int) -> str:
+    name, _ = message_schemas[message_id]
+    return f"{events_detailed_table_name}_{name.lower()}"
+
+
+def message_columns(message_id: int) -> List[Tuple[str, str]]:
+    """
+    (column, type) of the table of a message type: the connector columns, then the message attributes
+    as defined in mobs/messages.rb (binary `data` attributes are left out)
+    """
+    _, attributes = message_schemas[message_id]
+    return list(row_columns) + [(name, type_) for name, type_ in attributes if type_ in _column_types]
+
+
+def message_dtypes(message_id: int) -> Dict[str, str]:
+    return {column: _dtypes[type_] for column, type_ in message_columns(message_id)}
+
+
+def message_table(message_id: int) -> Table:
+    """
+    The table of a message type, registered in db.models metadata
+    """
+    name = message_table_name(message_id)
+    if name in metadata.tables:
+        return metadata.tables[name]
+    return Table(name, metadata, *[Column(column, _column_types[type_](), primary_key=column == 'sessionid')
+                                   for column, type_ in message_columns(message_id)])
+
+
+def register_message_tables(message_ids) -> Dict[int, Table]:
+    """
+    The tables of the given message types, registered in db.models metadata.
+    The message types with a table are chosen by the caller: handler.message_table_ids for the consumers
+    """
+    return {message_id: message_table(message_id) for message_id in message_ids}
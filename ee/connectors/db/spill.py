@@ -0,0 +1,107 @@
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import metrics
+
+
+class SpillStore:
+    """
+    Append-only directory of the batches that could not be written to the warehouse, one Parquet file
+    per batch named <sequence>-<table>.parquet, so that they are drained in the order they failed.
+    Files are written under a temporary name and renamed, a crash never leaves a partial file.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / 'rejected').mkdir(exist_ok=True)
+
+    def put(self, table: str, df: pd.DataFrame) -> Path:
+        path = self.directory / f"{time.time_ns():020d}-{os.getpid()}-{table}.parquet"
+        tmp = path.with_suffix('.tmp')
+        df.to_parquet(tmp, index=False, compression='snappy')
+        os.replace(tmp, path)
+        return path
+
+    def pending(self) -> List[Path]:
+        return sorted(self.directory.glob('*.parquet'))
+
+    @staticmethod
+    def load(path: Path) -> Tuple[str, pd.DataFrame]:
+        table = path.stem.split('-', 2)[2]
+        df = pd.read_parquet(path)
+        # list columns (sessions issues, urls) are read back as arrays
+        for column in df.columns:
+            if df[column].dtype == object:
+                df[column] = df[column].map(lambda v: v.tolist() if isinstance(v, np.ndarray) else v)
+        return table, df
+
+    def remove(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def reject(self, path: Path) -> Path:
+        rejected = self.directory / 'rejected' / path.name
+        os.replace(path, rejected)
+        return rejected
+
+
+class SpillDrainer(threading.Thread):
+    """
+    Writes the spilled batches back, oldest first, with `write(table, df)`. After a failure the drain waits
+    `base_delay` seconds, doubled on every consecutive failure up to `max_delay`. A file failing
+    `max_attempts` times is moved to the rejected/ directory, to be looked at and loaded by hand.
+    Only one process drains a directory: the worker processes of the pool mode share it.
+    """
+
+    def __init__(self, store: SpillStore, write: Callable[[str, pd.DataFrame], None],
+                 base_delay=1.0, max_delay=300.0, max_attempts=10, poll_interval=5.0):
+        super().__init__(name='spill-drainer', daemon=True)
+        self.store = store
+        self.write = write
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.attempts = dict()
+
+    def run(self):
+        with open(self.store.directory / 'drain.lock', 'w') as lock:
+            # blocks while another process drains, takes over when it exits
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            delay = self.base_delay
+            while True:
+                pending = self.store.pending()
+                metrics.spill_pending.set(len(pending))
+                if not pending:
+                    time.sleep(self.poll_interval)
+                    continue
+                if self.drain(pending[0]):
+                    delay = self.base_delay
+                else:
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.max_delay)
+
+    def drain(self, path: Path) -> bool:
+        try:
+            table, df = self.store.load(path)
+            self.write(table, df)
+        except Exception as e:
+            metrics.count_error('spill_drain', e)
+            self.attempts[path] = self.attempts.get(path, 0) + 1
+            print(f"[SPILL] {path.name}: attempt {self.attempts[path]}/{self.max_attempts} failed: {e!r}")
+            if self.attempts[path] >= self.max_attempts:
+                del self.attempts[path]
+                print(f"[SPILL] {path.name} rejected, moved to {self.store.reject(path)}")
+            return False
+        self.store.remove(path)
+        self.attempts.pop(path, None)
+        metrics.spill_drained_rows.labels(table).inc(len(df))
+        print(f"[SPILL] {len(df)} rows of {path.name} written to {table}")
+        return True
@@ -0,0 +1,81 @@
+import os
+import uuid
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import BigInteger, Boolean, Integer, VARCHAR
+
+from db.models import Base
+
+_arrow_types = {BigInteger: pa.int64(),
+                Integer: pa.int32(),
+                Boolean: pa.bool_(),
+                VARCHAR: pa.string()}
+
+
+def arrow_schema(table: str, columns) -> pa.Schema:
+    """
+    Arrow schema of a batch of `table`, with the column types of its db.models model.
+    Attributes of the model that are not columns (issues, urls) are loaded as text.
+    """
+    table_columns = Base.metadata.tables[table].columns
+    fields = list()
+    for column in columns:
+        if column in table_columns:
+            fields.append(pa.field(column, _arrow_types[type(table_columns[column].type)]))
+        else:
+            fields.append(pa.field(column, pa.string()))
+    return pa.schema(fields)
+
+
+class ParquetStager:
+    """
+    Stages the connector batches as Parquet files (columnar, snappy-compressed), written to a local
+    directory and, for the loaders reading from S3, uploaded to a bucket. `endpoint_url` points
+    the uploads to an S3-compatible store (e.g. a MinIO container) instead of AWS.
+    """
+
+    def __init__(self, directory, bucket=None, prefix='', endpoint_url=None,
+                 aws_access_key_id=None, aws_secret_access_key=None, region_name=None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+        self._s3 = None
+        if bucket is not None:
+            import boto3
+            self._s3 = boto3.client('s3', endpoint_url=endpoint_url,
+                                    aws_access_key_id=aws_access_key_id,
+                                    aws_secret_access_key=aws_secret_access_key,
+                                    region_name=region_name)
+
+    def write(self, df, table: str) -> Path:
+        schema = arrow_schema(table, df.columns)
+        # lists (issues, urls) are staged as their text
+        as_text = {field.name: df[field.name].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+                   for field in schema if field.type == pa.string() and df[field.name].dtype == object}
+        if as_text:
+            df = df.assign(**as_text)
+        path = self.directory / f"{table}_{uuid.uuid4().hex}.parquet"
+        pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), path, compression='snappy')
+        return path
+
+    def key(self, path: Path) -> str:
+        return f"{self.prefix}/{path.name}" if self.prefix else path.name
+
+    def upload(self, path: Path) -> str:
+        """
+        Uploads a staged file, returns its s3:// url
+        """
+        self._s3.upload_file(str(path), self.bucket, self.key(path))
+        return f"s3://{self.bucket}/{self.key(path)}"
+
+    def remove(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        if self._s3 is not None:
+            self._s3.delete_object(Bucket=self.bucket, Key=self.key(path))
+
+
+def staging_directory() -> Path:
+    return Path(os.getenv('staging_dir', '/tmp/connector_staging'))
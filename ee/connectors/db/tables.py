@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from db.message_tables import message_columns, message_table_name, row_columns
+
 base_path = Path(__file__).parent.parent
 
 
@@ -84,3 +86,39 @@ def create_tables_redshift(db):
     #    q = f.read()
     #db.engine.execute(q)
     #print(f"`connector_user_events_detailed` table created succesfully.")
+
+
+# column types of the per-message-type tables (events_mode=tables), per attribute type of mobs/messages.rb
+_message_column_types = {
+    'clickhouse': {'int': 'Nullable(Int64)', 'uint': 'Nullable(UInt64)', 'boolean': 'Nullable(Bool)',
+                   'string': 'Nullable(String)'},
+    'pg': {'int': 'bigint', 'uint': 'bigint', 'boolean': 'boolean', 'string': 'text'},
+    'redshift': {'int': 'BIGINT', 'uint': 'BIGINT', 'boolean': 'BOOLEAN', 'string': 'VARCHAR(5000)'},
+    'snowflake': {'int': 'BIGINT', 'uint': 'BIGINT', 'boolean': 'BOOLEAN', 'string': 'VARCHAR(5000)'},
+}
+_quote = {'clickhouse': '`{}`', 'pg': '"{}"', 'redshift': '"{}"', 'snowflake': '{}'}
+row_column_names = {column for column, _ in row_columns}
+
+
+def message_table_ddl(database, message_id):
+    types, quote = _message_column_types[database], _quote[database]
+    columns = list()
+    for column, type_ in message_columns(message_id):
+        if column in row_column_names:
+            # set on every row
+            type_ = 'UInt64' if database == 'clickhouse' else f"{types[type_]} NOT NULL"
+        else:
+            type_ = types[type_]
+        columns.append(f"\t{quote.format(column):<40}{type_}")
+    q = f"CREATE TABLE IF NOT EXISTS {message_table_name(message_id)}\n(\n" + ",\n".join(columns) + "\n)"
+    if database == 'clickhouse':
+        q += ("\nENGINE = MergeTree()"
+              "\nPARTITION BY intDiv(received_at, 100000)"
+              "\nORDER BY (received_at, batch_order_number, sessionid)")
+    return q + ";"
+
+
+def create_message_tables(db, message_ids):
+    for message_id in message_ids:
+        db.engine.execute(message_table_ddl(db.config, message_id))
+    print(f"{len(message_ids)} message tables created succesfully.")
@@ -1,5 +1,13 @@
+import os
+
+import numpy as np
 import pandas as pd
+from db.batch import ColumnarBatch
 from db.models import DetailedEvent, Event, Session, DATABASE
+from db.message_tables import message_dtypes
+
+# the bulk load modes (COPY, native insert, Parquet) do not go through a '|' delimited CSV
+STRIP_DELIMITER = os.getenv('load_mode', 'to_sql') != 'bulk'
 
 dtypes_events = {'sessionid': "Int64",
                  'connectioninformation_downlink': "Int64",
@@ -346,40 +354,86 @@ for col in Session.__dict__:
         sessions_col.append(col)
 
 
+def _null_array(dtype, size):
+    """
+    Column of `size` nulls of the given dtype, built without converting any value
+    """
+    if dtype == 'Int64':
+        return pd.arrays.IntegerArray(np.zeros(size, dtype='int64'), np.ones(size, dtype=bool))
+    if dtype == 'boolean':
+        return pd.arrays.BooleanArray(np.zeros(size, dtype=bool), np.ones(size, dtype=bool))
+    if dtype == 'string':
+        return pd.arrays.StringArray(np.full(size, pd.NA, dtype=object))
+    return np.full(size, None, dtype=object)
+
+
+def _masked_array(dtype, size, rows, values):
+    """
+    Int64 / boolean column filled from its sparse values, without the per value checks of pd.array
+    """
+    mask = np.ones(size, dtype=bool)
+    mask[rows] = False
+    if dtype == 'Int64':
+        data = np.zeros(size, dtype='int64')
+        data[rows] = np.array(values, dtype='int64')
+        return pd.arrays.IntegerArray(data, mask)
+    data = np.zeros(size, dtype=bool)
+    data[rows] = np.array(values, dtype=bool)
+    return pd.arrays.BooleanArray(data, mask)
+
+
+def _sanitize(values):
+    # cut to 255 characters and without '|', the delimiter of the redshift loads
+    if STRIP_DELIMITER:
+        return [value if value is None else str(value)[:255].replace("|", "") for value in values]
+    return [value if value is None else str(value)[:255] for value in values]
+
+
 def get_df_from_batch(batch, level):
     if level == 'normal':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=events_col)
-    if level == 'detailed':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=detailed_events_col)
-    if level == 'sessions':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=sessions_col)
+        columns, dtypes = events_col, dtypes_events
+    elif level == 'detailed':
+        columns, dtypes = detailed_events_col, dtypes_detailed_events
+    elif level == 'sessions':
+        columns, dtypes = sessions_col, dtypes_sessions
 
-    try:
-        df = df.drop('_sa_instance_state', axis=1)
-    except KeyError:
-        pass
+    if not isinstance(batch, ColumnarBatch):
+        rows, batch = batch, ColumnarBatch(columns)
+        for row in rows:
+            batch.append(row.__dict__)
 
-    if level == 'normal':
-        df = df.astype(dtypes_events)
-    if level == 'detailed':
-        df['inputevent_value'] = None
-        df['customevent_payload'] = None
-        df = df.astype(dtypes_detailed_events)
-    if level == 'sessions':
-        df = df.astype(dtypes_sessions)
+    null_columns = {'inputevent_value', 'customevent_payload'} if level == 'detailed' else set()
+    df = _df_from_columnar_batch(batch, dtypes, null_columns)
 
     if DATABASE == 'clickhouse' and level == 'sessions':
         df['issues'] = df['issues'].fillna('')
         df['urls'] = df['urls'].fillna('')
-
-    for x in df.columns:
-        try:
-            if df[x].dtype == 'string':
-                df[x] = df[x].str.slice(0, 255)
-                df[x] = df[x].str.replace("|", "")
-        except TypeError as e:
-            print(repr(e))
-            if df[x].dtype == 'str':
-                df[x] = df[x].str.slice(0, 255)
-                df[x] = df[x].str.replace("|", "")
     return df
+
+
+def get_df_from_message_batch(batch: ColumnarBatch, message_id: int):
+    """
+    DataFrame of a batch of the table of one message type (events_mode=tables)
+    """
+    return _df_from_columnar_batch(batch, message_dtypes(message_id))
+
+
+def _df_from_columnar_batch(batch: ColumnarBatch, dtypes: dict, null_columns=frozenset()):
+    # every column is built once, straight with its dtype
+    data = dict()
+    for column in batch.columns:
+        dtype = dtypes.get(column)
+        if column in null_columns or batch.is_null(column):
+            data[column] = _null_array(dtype, len(batch))
+        elif dtype in ('Int64', 'boolean'):
+            try:
+                data[column] = _masked_array(dtype, len(batch), *batch.sparse(column))
+            except (TypeError, ValueError, OverflowError):
+                data[column] = pd.Series(batch.column(column), dtype=dtype)
+        elif dtype == 'string':
+            data[column] = pd.Series(_sanitize(batch.column(column)), dtype=dtype)
+        elif dtype is not None:
+            data[column] = pd.Series(batch.column(column), dtype=dtype)
+        else:
+            data[column] = batch.column(column)
+    return pd.DataFrame(data, columns=batch.columns)
@@ -1,10 +1,14 @@
 import os
+import time
 
 DATABASE = os.environ['DATABASE_NAME']
 
 from db.api import DBConnection
-from db.utils import get_df_from_batch
+from db.utils import get_df_from_batch, get_df_from_message_batch
+from db.message_tables import message_table_name, register_message_tables
 from db.tables import *
+from db.spill import SpillDrainer, SpillStore
+import metrics
 
 if DATABASE == 'redshift':
     from db.loaders.redshift_loader import transit_insert_to_redshift
@@ -14,38 +18,115 @@ elif DATABASE == 'pg':
     from db.loaders.postgres_loader import insert_to_postgres
 elif DATABASE == 'bigquery':
     from db.loaders.bigquery_loader import insert_to_bigquery
-    from bigquery_utils.create_table import create_tables_bigquery
+    from bigquery_utils.create_table import create_tables_bigquery, create_message_tables_bigquery
 elif DATABASE == 'snowflake':
     from db.loaders.snowflake_loader import insert_to_snowflake
 else:
     raise Exception(f"{DATABASE}-database not supported")
 
-# create tables if don't exist
-try:
-    db = DBConnection(DATABASE)
-    if DATABASE == 'pg':
-        create_tables_postgres(db)
-    if DATABASE == 'clickhouse':
-        create_tables_clickhouse(db)
-    if DATABASE == 'snowflake':
-        create_tables_snowflake(db)
-    if DATABASE == 'bigquery':
-        create_tables_bigquery()
-    if DATABASE == 'redshift':
-        create_tables_redshift(db)
-    db.engine.dispose()
-    db = None
-except Exception as e:
-    print(repr(e))
-    print("Please create the tables with scripts provided in " +
-          f"'/sql/{DATABASE}_sessions.sql' and '/sql/{DATABASE}_events.sql'")
+# batches failing to be written are spilled to this directory and written back in the background,
+# '' disables the spill: the error is raised to the caller
+SPILL_DIR = os.getenv('spill_dir', '/tmp/connector_spill')
+SPILL_MAX_DELAY = float(os.getenv('spill_max_delay', 300))
+SPILL_MAX_ATTEMPTS = int(os.getenv('spill_max_attempts', 10))
+spill = None
+
+
+def prepare_tables():
+    """
+    Creates the tables if they don't exist and the spill directory, called by the consumers at startup:
+    importing this module connects to nothing
+    """
+    global spill
+    if SPILL_DIR and spill is None:
+        spill = SpillStore(SPILL_DIR)
+    try:
+        db = DBConnection(DATABASE)
+        if DATABASE == 'pg':
+            create_tables_postgres(db)
+        if DATABASE == 'clickhouse':
+            create_tables_clickhouse(db)
+        if DATABASE == 'snowflake':
+            create_tables_snowflake(db)
+        if DATABASE == 'bigquery':
+            create_tables_bigquery()
+        if DATABASE == 'redshift':
+            create_tables_redshift(db)
+        db.engine.dispose()
+    except Exception as e:
+        print(repr(e))
+        print("Please create the tables with scripts provided in " +
+              f"'/sql/{DATABASE}_sessions.sql' and '/sql/{DATABASE}_events.sql'")
+
+
+def prepare_message_tables(message_ids):
+    """
+    Registers the tables of the per-message-type mode (events_mode=tables) and creates them if they don't exist
+    """
+    register_message_tables(message_ids)
+    try:
+        if DATABASE == 'bigquery':
+            create_message_tables_bigquery(message_ids)
+        else:
+            db = DBConnection(DATABASE)
+            create_message_tables(db, message_ids)
+            db.engine.dispose()
+    except Exception as e:
+        print(repr(e))
+        print("Please create the message tables, see db.tables.message_table_ddl")
+
+
+def start_spill_drainer():
+    """
+    Starts the thread writing the spilled batches back, with its own connection
+    """
+    if spill is None:
+        return None
+    drain_db = DBConnection(DATABASE)
+    drainer = SpillDrainer(spill, lambda table, df: insert_df(drain_db, df, table),
+                           max_delay=SPILL_MAX_DELAY, max_attempts=SPILL_MAX_ATTEMPTS)
+    drainer.start()
+    return drainer
 
 
 def insert_batch(db: DBConnection, batch, table, level='normal'):
     if len(batch) == 0:
         return
-    df = get_df_from_batch(batch, level=level)
+    _write(db, batch, table, lambda: get_df_from_batch(batch, level=level))
+
+
+def insert_message_batch(db: DBConnection, batch, message_id: int):
+    """
+    Writes the rows of one message type to its own table (events_mode=tables)
+    """
+    if len(batch) == 0:
+        return
+    _write(db, batch, message_table_name(message_id), lambda: get_df_from_message_batch(batch, message_id))
+
+
+def _write(db: DBConnection, batch, table, get_df):
+    start = time.perf_counter()
+    try:
+        df = get_df()
+    except Exception as e:
+        metrics.count_error('dataframe', e)
+        raise
+    try:
+        insert_df(db, df, table)
+    except Exception as e:
+        metrics.count_error('insert', e)
+        if spill is None:
+            raise
+        path = spill.put(table, df)
+        metrics.spilled_rows.labels(table).inc(len(df))
+        print(f"[SPILL] insert into {table} failed: {e!r}, {len(df)} rows spilled to {path.name}")
+        return
+    metrics.flush_seconds.labels(db.config, table).observe(time.perf_counter() - start)
+    metrics.batch_rows.labels(table).observe(len(batch))
+    metrics.rows_written.labels(table).inc(len(batch))
+
 
+def insert_df(db: DBConnection, df, table):
     if db.config == 'redshift':
         transit_insert_to_redshift(db=db, df=df, table=table)
         return
@@ -0,0 +1,51 @@
+import time
+from typing import Optional
+
+
+class FlushPolicy:
+    """
+    Decides when a batch being filled has to be flushed: once it holds `max_rows` rows,
+    about `max_bytes` bytes, or once its first row is `max_age` seconds old.
+    A limit set to 0 is not checked. An empty batch is never due.
+    """
+
+    def __init__(self, max_rows: int, max_bytes: int = 0, max_age: float = 0):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.reset()
+
+    def reset(self) -> None:
+        self.rows = 0
+        self.bytes = 0
+        self.started_at = None
+
+    def add(self, nbytes: int = 0, now: Optional[float] = None) -> None:
+        if self.started_at is None:
+            self.started_at = time.time() if now is None else now
+        self.rows += 1
+        self.bytes += nbytes
+
+    def due(self, now: Optional[float] = None) -> bool:
+        if self.rows == 0:
+            return False
+        if self.max_rows and self.rows >= self.max_rows:
+            return True
+        if self.max_bytes and self.bytes >= self.max_bytes:
+            return True
+        if self.max_age:
+            if now is None:
+                now = time.time()
+            return now - self.started_at >= self.max_age
+        return False
+
+
+def row_size(row: dict) -> int:
+    """
+    Rough size of a row in bytes: the length of its strings plus 8 bytes per value
+    """
+    size = 8 * len(row)
+    for value in row.values():
+        if isinstance(value, str):
+            size += len(value)
+    return size
@@ -1,806 +1,655 @@
-from typing import Optional, Union
+from operator import attrgetter
+from typing import Callable, Dict, Optional, Union
 
-from db.models import Event, DetailedEvent, Session
+from db.models import Session
 from msgcodec.messages import *
 
 
-def handle_normal_message(message: Message) -> Optional[Event]:
-
-    n = Event()
-
-    if isinstance(message, ConnectionInformation):
-        n.connectioninformation_downlink = message.downlink
-        n.connectioninformation_type = message.type
-        return n
-
-    if isinstance(message, ConsoleLog):
-        n.consolelog_level = message.level
-        n.consolelog_value = message.value
-        return n
-
-    if isinstance(message, CustomEvent):
-        n.customevent_messageid = message.message_id
-        n.customevent_name = message.name
-        n.customevent_timestamp = message.timestamp
-        n.customevent_payload = message.payload
-        return n
-
-    if isinstance(message, ErrorEvent):
-        n.errorevent_message = message.message
-        n.errorevent_messageid = message.message_id
-        n.errorevent_name = message.name
-        n.errorevent_payload = message.payload
-        n.errorevent_source = message.source
-        n.errorevent_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, JSException):
-        n.jsexception_name = message.name
-        n.jsexception_payload = message.payload
-        n.jsexception_message = message.message
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
+def _row(columns: Dict[str, str], **constants) -> Callable[[Message], dict]:
+    """
+    Builds an event handler copying message attributes into row columns.
+    columns: {column name: message attribute name}
+    constants: columns set to the same value for every message of this type
+    """
+    names = tuple(columns)
+    get = attrgetter(*columns.values())
+    if len(names) == 1:
+        name = names[0]
+        return lambda message: {name: get(message), **constants}
+    return lambda message: dict(zip(names, get(message)), **constants)
+
+
+# Message class -> row builder, used by handle_normal_message
+normal_handlers: Dict[type, Callable[[Message], dict]] = {
+    ConnectionInformation: _row({
+        'connectioninformation_downlink': 'downlink',
+        'connectioninformation_type': 'type',
+    }),
+    ConsoleLog: _row({
+        'consolelog_level': 'level',
+        'consolelog_value': 'value',
+    }),
+    CustomEvent: _row({
+        'customevent_name': 'name',
+        'customevent_payload': 'payload',
+    }),
+    JSException: _row({
+        'jsexception_name': 'name',
+        'jsexception_payload': 'payload',
+        'jsexception_message': 'message',
+    }),
+    Metadata: _row({
+        'metadata_key': 'key',
+        'metadata_value': 'value',
+    }),
+    MouseClick: _row({
+        'mouseclick_hesitationtime': 'hesitation_time',
+        'mouseclick_id': 'id',
+        'mouseclick_label': 'label',
+        'mouseclick_selector': 'selector',
+    }),
+    PageEvent: _row({
+        'pageevent_firstcontentfulpaint': 'first_contentful_paint',
+        'pageevent_firstpaint': 'first_paint',
+        'pageevent_messageid': 'message_id',
+        'pageevent_referrer': 'referrer',
+        'pageevent_speedindex': 'speed_index',
+        'pageevent_timestamp': 'timestamp',
+        'pageevent_url': 'url',
+    }),
+    PageRenderTiming: _row({
+        'pagerendertiming_timetointeractive': 'time_to_interactive',
+        'pagerendertiming_visuallycomplete': 'visually_complete',
+    }),
+    SetViewportSize: _row({
+        'setviewportsize_height': 'height',
+        'setviewportsize_width': 'width',
+    }),
+    Timestamp: _row({
+        'timestamp_timestamp': 'timestamp',
+    }),
+    UserAnonymousID: _row({
+        'user_anonymous_id': 'id',
+    }),
+    UserID: _row({
+        'user_id': 'id',
+    }),
+    IssueEvent: _row({
+        'issueevent_messageid': 'message_id',
+        'issueevent_timestamp': 'timestamp',
+        'issueevent_type': 'type',
+        'issueevent_contextstring': 'context_string',
+        'issueevent_context': 'context',
+        'issueevent_payload': 'payload',
+    }),
+    CustomIssue: _row({
+        'customissue_name': 'name',
+        'customissue_payload': 'payload',
+    }),
+}
+
+
+# Message class -> row builder, used by handle_message
+detailed_handlers: Dict[type, Callable[[Message], dict]] = {
+    SessionEnd: _row({
+        'sessionend_timestamp': 'timestamp',
+    }, sessionend=True),
+    Timestamp: _row({
+        'timestamp_timestamp': 'timestamp',
+    }),
+    SessionStart: _row({
+        'sessionstart_trackerversion': 'tracker_version',
+        'sessionstart_revid': 'rev_id',
+        'sessionstart_timestamp': 'timestamp',
+        'sessionstart_useruuid': 'user_uuid',
+        'sessionstart_useragent': 'user_agent',
+        'sessionstart_useros': 'user_os',
+        'sessionstart_userosversion': 'user_os_version',
+        'sessionstart_userbrowser': 'user_browser',
+        'sessionstart_userbrowserversion': 'user_browser_version',
+        'sessionstart_userdevice': 'user_device',
+        'sessionstart_userdevicetype': 'user_device_type',
+        'sessionstart_userdevicememorysize': 'user_device_memory_size',
+        'sessionstart_userdeviceheapsize': 'user_device_heap_size',
+        'sessionstart_usercountry': 'user_country',
+    }),
+    CreateIFrameDocument: _row({
+        'create_iframedocument_frame_id': 'frame_id',
+        'create_iframedocument_id': 'id',
+    }),
+    SetViewportSize: _row({
+        'setviewportsize_width': 'width',
+        'setviewportsize_height': 'height',
+    }),
+    SetViewportScroll: _row({
+        'setviewportscroll_x': 'x',
+        'setviewportscroll_y': 'y',
+    }),
+    SetNodeScroll: _row({
+        'setnodescroll_id': 'id',
+        'setnodescroll_x': 'x',
+        'setnodescroll_y': 'y',
+    }),
+    ConsoleLog: _row({
+        'consolelog_level': 'level',
+        'consolelog_value': 'value',
+    }),
+    PageLoadTiming: _row({
+        'pageloadtiming_requeststart': 'request_start',
+        'pageloadtiming_responsestart': 'response_start',
+        'pageloadtiming_responseend': 'response_end',
+        'pageloadtiming_domcontentloadedeventstart': 'dom_content_loaded_event_start',
+        'pageloadtiming_domcontentloadedeventend': 'dom_content_loaded_event_end',
+        'pageloadtiming_loadeventstart': 'load_event_start',
+        'pageloadtiming_loadeventend': 'load_event_end',
+        'pageloadtiming_firstpaint': 'first_paint',
+        'pageloadtiming_firstcontentfulpaint': 'first_contentful_paint',
+    }),
+    PageRenderTiming: _row({
+        'pagerendertiming_speedindex': 'speed_index',
+        'pagerendertiming_visuallycomplete': 'visually_complete',
+        'pagerendertiming_timetointeractive': 'time_to_interactive',
+    }),
+    ResourceTiming: _row({
+        'resourcetiming_timestamp': 'timestamp',
+        'resourcetiming_duration': 'duration',
+        'resourcetiming_ttfb': 'ttfb',
+        'resourcetiming_headersize': 'header_size',
+        'resourcetiming_encodedbodysize': 'encoded_body_size',
+        'resourcetiming_decodedbodysize': 'decoded_body_size',
+        'resourcetiming_url': 'url',
+        'resourcetiming_initiator': 'initiator',
+    }),
+    JSException: _row({
+        'jsexception_name': 'name',
+        'jsexception_message': 'message',
+        'jsexception_payload': 'payload',
+    }),
+    UserID: _row({
+        'userid_id': 'id',
+    }),
+    UserAnonymousID: _row({
+        'useranonymousid_id': 'id',
+    }),
+    Metadata: _row({
+        'metadata_key': 'key',
+        'metadata_value': 'value',
+    }),
+    BatchMeta: _row({
+        'batchmeta_page_no': 'page_no',
+        'batchmeta_first_index': 'first_index',
+        'batchmeta_timestamp': 'timestamp',
+    }),
+    BatchMetadata: _row({
+        'batchmeta_page_no': 'page_no',
+        'batchmeta_first_index': 'first_index',
+        'batchmeta_timestamp': 'timestamp',
+    }),
+    PartitionedMessage: _row({
+        'part_no': 'part_no',
+        'part_total': 'part_total',
+    }),
+    PerformanceTrack: _row({
+        'performancetrack_frames': 'frames',
+        'performancetrack_ticks': 'ticks',
+        'performancetrack_totaljsheapsize': 'total_js_heap_size',
+        'performancetrack_usedjsheapsize': 'used_js_heap_size',
+    }),
+    PerformanceTrackAggr: _row({
+        'performancetrackaggr_timestampstart': 'timestamp_start',
+        'performancetrackaggr_timestampend': 'timestamp_end',
+        'performancetrackaggr_minfps': 'min_fps',
+        'performancetrackaggr_avgfps': 'avg_fps',
+        'performancetrackaggr_maxfps': 'max_fps',
+        'performancetrackaggr_mincpu': 'min_cpu',
+        'performancetrackaggr_avgcpu': 'avg_cpu',
+        'performancetrackaggr_maxcpu': 'max_cpu',
+        'performancetrackaggr_mintotaljsheapsize': 'min_total_js_heap_size',
+        'performancetrackaggr_avgtotaljsheapsize': 'avg_total_js_heap_size',
+        'performancetrackaggr_maxtotaljsheapsize': 'max_total_js_heap_size',
+        'performancetrackaggr_minusedjsheapsize': 'min_used_js_heap_size',
+        'performancetrackaggr_avgusedjsheapsize': 'avg_used_js_heap_size',
+        'performancetrackaggr_maxusedjsheapsize': 'max_used_js_heap_size',
+    }),
+    ConnectionInformation: _row({
+        'connectioninformation_downlink': 'downlink',
+        'connectioninformation_type': 'type',
+    }),
+    PageEvent: _row({
+        'pageevent_messageid': 'message_id',
+        'pageevent_timestamp': 'timestamp',
+        'pageevent_url': 'url',
+        'pageevent_referrer': 'referrer',
+        'pageevent_loaded': 'loaded',
+        'pageevent_requeststart': 'request_start',
+        'pageevent_responsestart': 'response_start',
+        'pageevent_responseend': 'response_end',
+        'pageevent_domcontentloadedeventstart': 'dom_content_loaded_event_start',
+        'pageevent_domcontentloadedeventend': 'dom_content_loaded_event_end',
+        'pageevent_loadeventstart': 'load_event_start',
+        'pageevent_loadeventend': 'load_event_end',
+        'pageevent_firstpaint': 'first_paint',
+        'pageevent_firstcontentfulpaint': 'first_contentful_paint',
+        'pageevent_speedindex': 'speed_index',
+    }),
+    InputEvent: _row({
+        'inputevent_messageid': 'message_id',
+        'inputevent_timestamp': 'timestamp',
+        'inputevent_value': 'value',
+        'inputevent_valuemasked': 'value_masked',
+        'inputevent_label': 'label',
+    }),
+    ClickEvent: _row({
+        'clickevent_messageid': 'message_id',
+        'clickevent_timestamp': 'timestamp',
+        'clickevent_hesitationtime': 'hesitation_time',
+        'clickevent_label': 'label',
+    }),
+    ResourceEvent: _row({
+        'resourceevent_messageid': 'message_id',
+        'resourceevent_timestamp': 'timestamp',
+        'resourceevent_duration': 'duration',
+        'resourceevent_ttfb': 'ttfb',
+        'resourceevent_headersize': 'header_size',
+        'resourceevent_encodedbodysize': 'encoded_body_size',
+        'resourceevent_decodedbodysize': 'decoded_body_size',
+        'resourceevent_url': 'url',
+        'resourceevent_type': 'type',
+        'resourceevent_success': 'success',
+        'resourceevent_method': 'method',
+        'resourceevent_status': 'status',
+    }),
+    CustomEvent: _row({
+        'customevent_name': 'name',
+        'customevent_payload': 'payload',
+    }),
+    Fetch: _row({
+        'fetch_method': 'method',
+        'fetch_url': 'url',
+        'fetch_request': 'request',
+        'fetch_status': 'status',
+        'fetch_timestamp': 'timestamp',
+        'fetch_duration': 'duration',
+    }),
+    Profiler: _row({
+        'profiler_name': 'name',
+        'profiler_duration': 'duration',
+        'profiler_args': 'args',
+        'profiler_result': 'result',
+    }),
+    GraphQL: _row({
+        'graphql_operationkind': 'operation_kind',
+        'graphql_operationname': 'operation_name',
+        'graphql_variables': 'variables',
+        'graphql_response': 'response',
+    }),
+    DOMDrop: _row({
+        'domdrop_timestamp': 'timestamp',
+    }),
+    MouseClick: _row({
+        'mouseclick_id': 'id',
+        'mouseclick_hesitationtime': 'hesitation_time',
+        'mouseclick_label': 'label',
+        'mouseclick_selector': 'selector',
+    }),
+    SetPageLocation: _row({
+        'setpagelocation_url': 'url',
+        'setpagelocation_referrer': 'referrer',
+        'setpagelocation_navigationstart': 'navigation_start',
+    }),
+    MouseMove: _row({
+        'mousemove_x': 'x',
+        'mousemove_y': 'y',
+    }),
+    LongTask: _row({
+        'longtasks_timestamp': 'timestamp',
+        'longtasks_duration': 'duration',
+        'longtask_context': 'context',
+        'longtask_containertype': 'container_type',
+        'longtasks_containersrc': 'container_src',
+        'longtasks_containerid': 'container_id',
+        'longtasks_containername': 'container_name',
+    }),
+    SetNodeAttributeURLBased: _row({
+        'setnodeurlbasedattribute_id': 'id',
+        'setnodeurlbasedattribute_name': 'name',
+        'setnodeurlbasedattribute_value': 'value',
+        'setnodeurlbasedattribute_baseurl': 'base_url',
+    }),
+    SetCSSDataURLBased: _row({
+        'setstyledata_id': 'id',
+        'setstyledata_data': 'data',
+        'setstyledata_baseurl': 'base_url',
+    }),
+    IssueEvent: _row({
+        'issueevent_messageid': 'message_id',
+        'issueevent_timestamp': 'timestamp',
+        'issueevent_type': 'type',
+        'issueevent_contextstring': 'context_string',
+        'issueevent_context': 'context',
+        'issueevent_payload': 'payload',
+    }),
+    TechnicalInfo: _row({
+        'technicalinfo_type': 'type',
+        'technicalinfo_value': 'value',
+    }),
+    CustomIssue: _row({
+        'customissue_name': 'name',
+        'customissue_payload': 'payload',
+    }),
+    AssetCache: _row({
+        'asset_cache_url': 'url',
+    }),
+    IOSSessionStart: _row({
+        'iossessionstart_timestamp': 'timestamp',
+        'iossessionstart_projectid': 'project_id',
+        'iossessionstart_trackerversion': 'tracker_version',
+        'iossessionstart_revid': 'rev_id',
+        'iossessionstart_useruuid': 'user_uuid',
+        'iossessionstart_useros': 'user_os',
+        'iossessionstart_userosversion': 'user_os_version',
+        'iossessionstart_userdevice': 'user_device',
+        'iossessionstart_userdevicetype': 'user_device_type',
+        'iossessionstart_usercountry': 'user_country',
+    }),
+    IOSSessionEnd: _row({
+        'iossessionend_timestamp': 'timestamp',
+    }),
+    IOSMetadata: _row({
+        'iosmetadata_timestamp': 'timestamp',
+        'iosmetadata_length': 'length',
+        'iosmetadata_key': 'key',
+        'iosmetadata_value': 'value',
+    }),
+    IOSBatchMeta: _row({
+        'iosbatchmeta_first_index': 'first_index',
+        'iosbatchmeta_timestamp': 'timestamp',
+    }),
+    IOSUserID: _row({
+        'iosuserid_timestamp': 'timestamp',
+        'iosuserid_length': 'length',
+        'iosuserid_value': 'value',
+    }),
+    IOSUserAnonymousID: _row({
+        'iosuseranonymousid_timestamp': 'timestamp',
+        'iosuseranonymousid_length': 'length',
+        'iosuseranonymousid_value': 'value',
+    }),
+    IOSScreenEnter: _row({
+        'iosscreenenter_timestamp': 'timestamp',
+        'iosscreenenter_length': 'length',
+        'iosscreenenter_title': 'title',
+        'iosscreenenter_view_name': 'view_name',
+    }),
+    IOSScreenLeave: _row({
+        'iosscreenleave_timestamp': 'timestamp',
+        'iosscreenleave_length': 'length',
+        'iosscreenleave_title': 'title',
+        'iosscreenleave_viewname': 'view_name',
+    }),
+    IOSScreenChanges: _row({
+        'iosscreenchanges_timestamp': 'timestamp',
+        'iosscreenchanges_length': 'length',
+        'iosscreenchanges_x': 'x',
+        'iosscreenchanges_y': 'y',
+        'iosscreenchanges_width': 'width',
+        'iosscreenchanges_height': 'height',
+    }),
+    IOSClickEvent: _row({
+        'iosclickevent_timestamp': 'timestamp',
+        'iosclickevent_length': 'length',
+        'iosclickevent_label': 'label',
+        'iosclickevent_x': 'x',
+        'iosclickevent_y': 'y',
+    }),
+    IOSInputEvent: _row({
+        'iosinputevent_timestamp': 'timestamp',
+        'iosinputevent_length': 'length',
+        'iosinputevent_value_masked': 'value_masked',
+        'iosinputevent_label': 'label',
+    }),
+    IOSLog: _row({
+        'ioslog_timestamp': 'timestamp',
+        'ioslog_length': 'length',
+        'ioslog_severity': 'severity',
+        'ioslog_content': 'content',
+    }),
+    IOSNetworkCall: _row({
+        'iosnetworkcall_timestamp': 'timestamp',
+        'iosnetworkcall_length': 'length',
+        'iosnetworkcall_duration': 'duration',
+        'iosnetworkcall_headers': 'headers',
+        'iosnetworkcall_body': 'body',
+        'iosnetworkcall_url': 'url',
+        'iosnetworkcall_success': 'success',
+        'iosnetworkcall_method': 'method',
+        'iosnetworkcall_status': 'status',
+    }),
+    IOSIssueEvent: _row({
+        'iosissueevent_timestamp': 'timestamp',
+        'iosissueevent_type': 'type',
+        'iosissueevent_context_string': 'context_string',
+        'iosissueevent_context': 'context',
+        'iosissueevent_payload': 'payload',
+    }),
+    IOSCustomEvent: _row({
+        'ioscustomevent_timestamp': 'timestamp',
+        'ioscustomevent_length': 'length',
+        'ioscustomevent_name': 'name',
+        'ioscustomevent_payload': 'payload',
+    }),
+    IOSInternalError: _row({
+        'iosinternalerror_timestamp': 'timestamp',
+        'iosinternalerror_length': 'length',
+        'iosinternalerror_content': 'content',
+    }),
+    IOSCrash: _row({
+        'ioscrash_timestamp': 'timestamp',
+        'ioscrash_length': 'length',
+        'ioscrash_name': 'name',
+        'ioscrash_reason': 'reason',
+        'ioscrash_stacktrace': 'stacktrace',
+    }),
+    IOSPerformanceEvent: _row({
+        'iosperformanceevent_timestamp': 'timestamp',
+        'iosperformanceevent_length': 'length',
+        'iosperformanceevent_name': 'name',
+        'iosperformanceevent_value': 'value',
+    }),
+    IOSPerformanceAggregated: _row({
+        'iosperformanceaggregated_timestampstart': 'timestamp_start',
+        'iosperformanceaggregated_timestampend': 'timestamp_end',
+        'iosperformanceaggregated_minfps': 'min_fps',
+        'iosperformanceaggregated_avgfps': 'avg_fps',
+        'iosperformanceaggregated_maxfps': 'max_fps',
+        'iosperformanceaggregated_mincpu': 'min_cpu',
+        'iosperformanceaggregated_avgcpu': 'avg_cpu',
+        'iosperformanceaggregated_maxcpu': 'max_cpu',
+        'iosperformanceaggregated_minmemory': 'min_memory',
+        'iosperformanceaggregated_avgmemory': 'avg_memory',
+        'iosperformanceaggregated_maxmemory': 'max_memory',
+        'iosperformanceaggregated_minbattery': 'min_battery',
+        'iosperformanceaggregated_avgbattery': 'avg_battery',
+        'iosperformanceaggregated_maxbattery': 'max_battery',
+    }),
+}
+
+
+# Message class -> function updating the session in place, used by handle_session
+session_handlers: Dict[type, Callable[[Session, Message], None]] = dict()
+
+
+def _session_handler(*message_classes):
+    def register(f):
+        for message_class in message_classes:
+            session_handlers[message_class] = f
+        return f
+    return register
+
+
+@_session_handler(SessionStart)
+def _session_start(n: Session, message: SessionStart):
+    n.session_start_timestamp = message.timestamp
+
+    n.user_uuid = message.user_uuid
+    n.user_agent = message.user_agent
+    n.user_os = message.user_os
+    n.user_os_version = message.user_os_version
+    n.user_browser = message.user_browser
+    n.user_browser_version = message.user_browser_version
+    n.user_device = message.user_device
+    n.user_device_type = message.user_device_type
+    n.user_device_memory_size = message.user_device_memory_size
+    n.user_device_heap_size = message.user_device_heap_size
+    n.user_country = message.user_country
+
+
+@_session_handler(SessionEnd)
+def _session_end(n: Session, message: SessionEnd):
+    n.session_end_timestamp = message.timestamp
+    try:
+        n.session_duration = n.session_end_timestamp - n.session_start_timestamp
+    except TypeError:
+        pass
+
+
+@_session_handler(BatchMeta, BatchMetadata)
+def _session_batch_meta(n: Session, message: Union[BatchMeta, BatchMetadata]):
+    n.batchmeta_page_no = message.page_no
+    n.batchmeta_first_index = message.first_index
+    n.batchmeta_timestamp = message.timestamp
+
+
+@_session_handler(ConnectionInformation)
+def _session_connection_information(n: Session, message: ConnectionInformation):
+    n.connection_effective_bandwidth = message.downlink
+    n.connection_type = message.type
+
+
+@_session_handler(Metadata)
+def _session_metadata(n: Session, message: Metadata):
+    n.metadata_key = message.key
+    n.metadata_value = message.value
+
+
+@_session_handler(PageEvent)
+def _session_page_event(n: Session, message: PageEvent):
+    n.referrer = message.referrer
+    n.first_contentful_paint = message.first_contentful_paint
+    n.speed_index = message.speed_index
+    n.timing_time_to_interactive = message.time_to_interactive
+    n.visually_complete = message.visually_complete
+    try:
+        n.urls_count += 1
+    except TypeError:
+        n.urls_count = 1
+    try:
+        n.urls.append(message.url)
+    except AttributeError:
+        n.urls = [message.url]
+
+
+@_session_handler(PerformanceTrackAggr)
+def _session_performance_track_aggr(n: Session, message: PerformanceTrackAggr):
+    n.avg_cpu = message.avg_cpu
+    n.avg_fps = message.avg_fps
+    n.max_cpu = message.max_cpu
+    n.max_fps = message.max_fps
+    n.max_total_js_heap_size = message.max_total_js_heap_size
+    n.max_used_js_heap_size = message.max_used_js_heap_size
+
+
+@_session_handler(UserID)
+def _session_user_id(n: Session, message: UserID):
+    n.user_id = message.id
+
+
+@_session_handler(UserAnonymousID)
+def _session_user_anonymous_id(n: Session, message: UserAnonymousID):
+    n.user_anonymous_id = message.id
+
+
+@_session_handler(JSException)
+def _session_js_exception(n: Session, message: JSException):
+    try:
+        n.js_exceptions_count += 1
+    except TypeError:
+        n.js_exceptions_count = 1
+
+
+@_session_handler(LongTask)
+def _session_long_task(n: Session, message: LongTask):
+    try:
+        n.long_tasks_total_duration += message.duration
+    except TypeError:
+        n.long_tasks_total_duration = message.duration
+
+    try:
+        if n.long_tasks_max_duration > message.duration:
+            n.long_tasks_max_duration = message.duration
+    except TypeError:
+        n.long_tasks_max_duration = message.duration
 
-    if isinstance(message, MouseClick):
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_id = message.id
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = message.selector
-        return n
+    try:
+        n.long_tasks_count += 1
+    except TypeError:
+        n.long_tasks_count = 1
 
-    if isinstance(message, MouseClickDepricated):
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_id = message.id
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = ''
-        return n
 
-    if isinstance(message, PageEvent):
-        n.pageevent_firstcontentfulpaint = message.first_contentful_paint
-        n.pageevent_firstpaint = message.first_paint
-        n.pageevent_messageid = message.message_id
-        n.pageevent_referrer = message.referrer
-        n.pageevent_speedindex = message.speed_index
-        n.pageevent_timestamp = message.timestamp
-        n.pageevent_url = message.url
-        return n
+@_session_handler(InputEvent, MouseClick)
+def _session_input(n: Session, message: Union[InputEvent, MouseClick]):
+    try:
+        n.inputs_count += 1
+    except TypeError:
+        n.inputs_count = 1
 
-    if isinstance(message, PageRenderTiming):
-        n.pagerendertiming_timetointeractive = message.time_to_interactive
-        n.pagerendertiming_visuallycomplete = message.visually_complete
-        return n
 
-    if isinstance(message, RawCustomEvent):
-        n.rawcustomevent_name = message.name
-        n.rawcustomevent_payload = message.payload
-        return n
+@_session_handler(IssueEvent)
+def _session_issue_event(n: Session, message: IssueEvent):
+    try:
+        n.issues_count += 1
+    except TypeError:
+        n.issues_count = 1
+        n.inputs_count = 1
 
-    if isinstance(message, SetViewportSize):
-        n.setviewportsize_height = message.height
-        n.setviewportsize_width = message.width
-        return n
 
-    if isinstance(message, Timestamp):
-        n.timestamp_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.user_anonymous_id = message.id
-        return n
+# Messages used by handle_normal_message and handle_session. At the `normal` level
+# every other message is skipped while decoding (see MessageCodec.decode_detailed)
+normal_level_message_ids = {m.__id__ for m in (*normal_handlers, *session_handlers)}
+detailed_level_message_ids = {m.__id__ for m in (*detailed_handlers, *session_handlers)}
+# the message types with a table in events_mode=tables: the ones kept at the detailed level
+message_table_ids = sorted(m.__id__ for m in detailed_handlers)
 
-    if isinstance(message, UserID):
-        n.user_id = message.id
-        return n
 
-    if isinstance(message, IssueEvent):
-        n.issueevent_messageid = message.message_id
-        n.issueevent_timestamp = message.timestamp
-        n.issueevent_type = message.type
-        n.issueevent_contextstring = message.context_string
-        n.issueevent_context = message.context
-        n.issueevent_payload = message.payload
-        return n
-
-    if isinstance(message, CustomIssue):
-        n.customissue_name = message.name
-        n.customissue_payload = message.payload
-        return n
+def handle_normal_message(message: Message) -> Optional[dict]:
+    handler = normal_handlers.get(type(message))
+    if handler is None:
+        return None
+    return handler(message)
 
 
 def handle_session(n: Session, message: Message) -> Optional[Session]:
-
+    handler = session_handlers.get(type(message))
+    if handler is None:
+        return n
     if not n:
         n = Session()
+    handler(n, message)
+    return n
 
-    if isinstance(message, SessionStart):
-        n.session_start_timestamp = message.timestamp
-
-        n.user_uuid = message.user_uuid
-        n.user_agent = message.user_agent
-        n.user_os = message.user_os
-        n.user_os_version = message.user_os_version
-        n.user_browser = message.user_browser
-        n.user_browser_version = message.user_browser_version
-        n.user_device = message.user_device
-        n.user_device_type = message.user_device_type
-        n.user_device_memory_size = message.user_device_memory_size
-        n.user_device_heap_size = message.user_device_heap_size
-        n.user_country = message.user_country
-        return n
-
-    if isinstance(message, SessionEnd):
-        n.session_end_timestamp = message.timestamp
-        try:
-            n.session_duration = n.session_end_timestamp - n.session_start_timestamp
-        except TypeError:
-            pass
-        return n
-
-    if isinstance(message, BatchMeta):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, BatchMetadata):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, PartitionedMessage):
-        n.part_no = message.part_no
-        n.part_total = message.part_total
-
-    # if isinstance(message, IOSBatchMeta):
-    #     n.iosbatchmeta_page_no = message.page_no
-    #     n.iosbatchmeta_first_index = message.first_index
-    #     n.iosbatchmeta_timestamp = message.timestamp
-    #     return n
-
-    if isinstance(message, ConnectionInformation):
-        n.connection_effective_bandwidth = message.downlink
-        n.connection_type = message.type
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
-
-    if isinstance(message, PageEvent):
-        n.referrer = message.referrer
-        n.first_contentful_paint = message.first_contentful_paint
-        n.speed_index = message.speed_index
-        n.timing_time_to_interactive = message.time_to_interactive
-        n.visually_complete = message.visually_complete
-        try:
-            n.urls_count += 1
-        except TypeError:
-            n.urls_count = 1
-        try:
-            n.urls.append(message.url)
-        except AttributeError:
-            n.urls = [message.url]
-        return n
-
-    if isinstance(message, PerformanceTrackAggr):
-        n.avg_cpu = message.avg_cpu
-        n.avg_fps = message.avg_fps
-        n.max_cpu = message.max_cpu
-        n.max_fps = message.max_fps
-        n.max_total_js_heap_size = message.max_total_js_heap_size
-        n.max_used_js_heap_size = message.max_used_js_heap_size
-        return n
-
-    if isinstance(message, UserID):
-        n.user_id = message.id
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.user_anonymous_id = message.id
-        return n
-
-    if isinstance(message, JSException):
-        try:
-            n.js_exceptions_count += 1
-        except TypeError:
-            n.js_exceptions_count = 1
-        return n
-
-    if isinstance(message, LongTask):
-        try:
-            n.long_tasks_total_duration += message.duration
-        except TypeError:
-            n.long_tasks_total_duration = message.duration
-
-        try:
-            if n.long_tasks_max_duration > message.duration:
-                n.long_tasks_max_duration = message.duration
-        except TypeError:
-            n.long_tasks_max_duration = message.duration
-
-        try:
-            n.long_tasks_count += 1
-        except TypeError:
-            n.long_tasks_count = 1
-        return n
-
-    if isinstance(message, InputEvent):
-        try:
-            n.inputs_count += 1
-        except TypeError:
-            n.inputs_count = 1
-        return n
-
-    if isinstance(message, MouseClick):
-        try:
-            n.inputs_count += 1
-        except TypeError:
-            n.inputs_count = 1
-        return n
-
-    if isinstance(message, IssueEvent):
-        try:
-            n.issues_count += 1
-        except TypeError:
-            n.issues_count = 1
-
-
-            n.inputs_count = 1
-        return n
-
-    if isinstance(message, MouseClickDepricated):
-        try:
-            n.inputs_count += 1
-        except TypeError:
-            n.inputs_count = 1
-        return n
-
-    if isinstance(message, IssueEvent):
-        try:
-            n.issues_count += 1
-        except TypeError:
-            n.issues_count = 1
-
-        try:
-            n.issues.append(message.type)
-        except AttributeError:
-            n.issues = [message.type]
-        return n
-
-
-def handle_message(message: Message) -> Optional[DetailedEvent]:
-    n = DetailedEvent()
-
-    if isinstance(message, SessionEnd):
-        n.sessionend = True
-        n.sessionend_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, Timestamp):
-        n.timestamp_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, SessionDisconnect):
-        n.sessiondisconnect = True
-        n.sessiondisconnect_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, SessionStart):
-        n.sessionstart_trackerversion = message.tracker_version
-        n.sessionstart_revid = message.rev_id
-        n.sessionstart_timestamp = message.timestamp
-        n.sessionstart_useruuid = message.user_uuid
-        n.sessionstart_useragent = message.user_agent
-        n.sessionstart_useros = message.user_os
-        n.sessionstart_userosversion = message.user_os_version
-        n.sessionstart_userbrowser = message.user_browser
-        n.sessionstart_userbrowserversion = message.user_browser_version
-        n.sessionstart_userdevice = message.user_device
-        n.sessionstart_userdevicetype = message.user_device_type
-        n.sessionstart_userdevicememorysize = message.user_device_memory_size
-        n.sessionstart_userdeviceheapsize = message.user_device_heap_size
-        n.sessionstart_usercountry = message.user_country
-        return n
-
-    if isinstance(message, CreateIFrameDocument):
-        n.create_iframedocument_frame_id = message.frame_id
-        n.create_iframedocument_id = message.id
-        return n
-
-    if isinstance(message, SetViewportSize):
-        n.setviewportsize_width = message.width
-        n.setviewportsize_height = message.height
-        return n
-
-    if isinstance(message, SetViewportScroll):
-        n.setviewportscroll_x = message.x
-        n.setviewportscroll_y = message.y
-        return n
-
-    if isinstance(message, SetNodeScroll):
-        n.setnodescroll_id = message.id
-        n.setnodescroll_x = message.x
-        n.setnodescroll_y = message.y
-        return n
-
-    if isinstance(message, ConsoleLog):
-        n.consolelog_level = message.level
-        n.consolelog_value = message.value
-        return n
-
-    if isinstance(message, PageLoadTiming):
-        n.pageloadtiming_requeststart = message.request_start
-        n.pageloadtiming_responsestart = message.response_start
-        n.pageloadtiming_responseend = message.response_end
-        n.pageloadtiming_domcontentloadedeventstart = message.dom_content_loaded_event_start
-        n.pageloadtiming_domcontentloadedeventend = message.dom_content_loaded_event_end
-        n.pageloadtiming_loadeventstart = message.load_event_start
-        n.pageloadtiming_loadeventend = message.load_event_end
-        n.pageloadtiming_firstpaint = message.first_paint
-        n.pageloadtiming_firstcontentfulpaint = message.first_contentful_paint
-        return n
-
-    if isinstance(message, PageRenderTiming):
-        n.pagerendertiming_speedindex = message.speed_index
-        n.pagerendertiming_visuallycomplete = message.visually_complete
-        n.pagerendertiming_timetointeractive = message.time_to_interactive
-        return n
-
-    if isinstance(message, ResourceTiming):
-        n.resourcetiming_timestamp = message.timestamp
-        n.resourcetiming_duration = message.duration
-        n.resourcetiming_ttfb = message.ttfb
-        n.resourcetiming_headersize = message.header_size
-        n.resourcetiming_encodedbodysize = message.encoded_body_size
-        n.resourcetiming_decodedbodysize = message.decoded_body_size
-        n.resourcetiming_url = message.url
-        n.resourcetiming_initiator = message.initiator
-        return n
-
-    if isinstance(message, JSException):
-        n.jsexception_name = message.name
-        n.jsexception_message = message.message
-        n.jsexception_payload = message.payload
-        return n
-
-    if isinstance(message, RawErrorEvent):
-        n.rawerrorevent_timestamp = message.timestamp
-        n.rawerrorevent_source = message.source
-        n.rawerrorevent_name = message.name
-        n.rawerrorevent_message = message.message
-        n.rawerrorevent_payload = message.payload
-        return n
-
-    if isinstance(message, RawCustomEvent):
-        n.rawcustomevent_name = message.name
-        n.rawcustomevent_payload = message.payload
-        return n
-
-    if isinstance(message, UserID):
-        n.userid_id = message.id
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.useranonymousid_id = message.id
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
-
-    if isinstance(message, BatchMeta):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, BatchMetadata):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, PartitionedMessage):
-        n.part_no = message.part_no
-        n.part_total = message.part_total
-
-    if isinstance(message, PerformanceTrack):
-        n.performancetrack_frames = message.frames
-        n.performancetrack_ticks = message.ticks
-        n.performancetrack_totaljsheapsize = message.total_js_heap_size
-        n.performancetrack_usedjsheapsize = message.used_js_heap_size
-        return n
-
-    if isinstance(message, PerformanceTrackAggr):
-        n.performancetrackaggr_timestampstart = message.timestamp_start
-        n.performancetrackaggr_timestampend = message.timestamp_end
-        n.performancetrackaggr_minfps = message.min_fps
-        n.performancetrackaggr_avgfps = message.avg_fps
-        n.performancetrackaggr_maxfps = message.max_fps
-        n.performancetrackaggr_mincpu = message.min_cpu
-        n.performancetrackaggr_avgcpu = message.avg_cpu
-        n.performancetrackaggr_maxcpu = message.max_cpu
-        n.performancetrackaggr_mintotaljsheapsize = message.min_total_js_heap_size
-        n.performancetrackaggr_avgtotaljsheapsize = message.avg_total_js_heap_size
-        n.performancetrackaggr_maxtotaljsheapsize = message.max_total_js_heap_size
-        n.performancetrackaggr_minusedjsheapsize = message.min_used_js_heap_size
-        n.performancetrackaggr_avgusedjsheapsize = message.avg_used_js_heap_size
-        n.performancetrackaggr_maxusedjsheapsize = message.max_used_js_heap_size
-        return n
 
-    if isinstance(message, ConnectionInformation):
-        n.connectioninformation_downlink = message.downlink
-        n.connectioninformation_type = message.type
-        return n
+def handle_message(message: Message) -> Optional[dict]:
+    handler = detailed_handlers.get(type(message))
+    if handler is None:
+        return None
+    return handler(message)
 
-    if isinstance(message, PageEvent):
-        n.pageevent_messageid = message.message_id
-        n.pageevent_timestamp = message.timestamp
-        n.pageevent_url = message.url
-        n.pageevent_referrer = message.referrer
-        n.pageevent_loaded = message.loaded
-        n.pageevent_requeststart = message.request_start
-        n.pageevent_responsestart = message.response_start
-        n.pageevent_responseend = message.response_end
-        n.pageevent_domcontentloadedeventstart = message.dom_content_loaded_event_start
-        n.pageevent_domcontentloadedeventend = message.dom_content_loaded_event_end
-        n.pageevent_loadeventstart = message.load_event_start
-        n.pageevent_loadeventend = message.load_event_end
-        n.pageevent_firstpaint = message.first_paint
-        n.pageevent_firstcontentfulpaint = message.first_contentful_paint
-        n.pageevent_speedindex = message.speed_index
-        return n
-
-    if isinstance(message, InputEvent):
-        n.inputevent_messageid = message.message_id
-        n.inputevent_timestamp = message.timestamp
-        n.inputevent_value = message.value
-        n.inputevent_valuemasked = message.value_masked
-        n.inputevent_label = message.label
-        return n
-
-    if isinstance(message, ClickEvent):
-        n.clickevent_messageid = message.message_id
-        n.clickevent_timestamp = message.timestamp
-        n.clickevent_hesitationtime = message.hesitation_time
-        n.clickevent_label = message.label
-        return n
-
-    if isinstance(message, ErrorEvent):
-        n.errorevent_messageid = message.message_id
-        n.errorevent_timestamp = message.timestamp
-        n.errorevent_source = message.source
-        n.errorevent_name = message.name
-        n.errorevent_message = message.message
-        n.errorevent_payload = message.payload
-        return n
-
-    if isinstance(message, ResourceEvent):
-        n.resourceevent_messageid = message.message_id
-        n.resourceevent_timestamp = message.timestamp
-        n.resourceevent_duration = message.duration
-        n.resourceevent_ttfb = message.ttfb
-        n.resourceevent_headersize = message.header_size
-        n.resourceevent_encodedbodysize = message.encoded_body_size
-        n.resourceevent_decodedbodysize = message.decoded_body_size
-        n.resourceevent_url = message.url
-        n.resourceevent_type = message.type
-        n.resourceevent_success = message.success
-        n.resourceevent_method = message.method
-        n.resourceevent_status = message.status
-        return n
 
-    if isinstance(message, CustomEvent):
-        n.customevent_messageid = message.message_id
-        n.customevent_timestamp = message.timestamp
-        n.customevent_name = message.name
-        n.customevent_payload = message.payload
-        return n
-
-    # if isinstance(message, CreateDocument):
-    #     n.createdocument = True
-    #     return n
-    #
-    # if isinstance(message, CreateElementNode):
-    #     n.createelementnode_id = message.id
-    #     if isinstance(message.parent_id, tuple):
-    #         n.createelementnode_parentid = message.parent_id[0]
-    #     else:
-    #         n.createelementnode_parentid = message.parent_id
-    #     return n
-
-    # if isinstance(message, CSSInsertRule):
-    #     n.cssinsertrule_stylesheetid = message.id
-    #     n.cssinsertrule_rule = message.rule
-    #     n.cssinsertrule_index = message.index
-    #     return n
-
-    # if isinstance(message, CSSInsertRuleURLBased):
-    #     n.cssinsertrule_urlbased_id = message.id
-    #     n.cssinsertrule_urlbased_rule = message.rule
-    #     n.cssinsertrule_urlbased_index = message.index
-    #     n.cssinsertrule_urlbased_base_url = message.base_url
-    #
-    # if isinstance(message, CSSDeleteRule):
-    #     n.cssdeleterule_stylesheetid = message.id
-    #     n.cssdeleterule_index = message.index
-    #     return n
-
-    if isinstance(message, Fetch):
-        n.fetch_method = message.method
-        n.fetch_url = message.url
-        n.fetch_request = message.request
-        n.fetch_status = message.status
-        n.fetch_timestamp = message.timestamp
-        n.fetch_duration = message.duration
-        return n
-
-    if isinstance(message, FetchEvent):
-        n.fetch_event_message_id = message.message_id
-        n.fetch_event_timestamp = message.timestamp
-        n.fetch_event_method = message.method
-        n.fetch_event_url = message.url
-        n.fetch_event_request = message.request
-        n.fetch_event_response = message.response
-        n.fetch_event_status = message.status
-        n.fetch_event_duration = message.duration
-        return n
-
-    if isinstance(message, Profiler):
-        n.profiler_name = message.name
-        n.profiler_duration = message.duration
-        n.profiler_args = message.args
-        n.profiler_result = message.result
-        return n
-
-    if isinstance(message, GraphQL):
-        n.graphql_operationkind = message.operation_kind
-        n.graphql_operationname = message.operation_name
-        n.graphql_variables = message.variables
-        n.graphql_response = message.response
-        return n
-
-    if isinstance(message, GraphQLEvent):
-        n.graphqlevent_messageid = message.message_id
-        n.graphqlevent_timestamp = message.timestamp
-        n.graphqlevent_name = message.name
-        return n
-
-    if isinstance(message, DomDrop):
-        n.domdrop_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, MouseClick):
-        n.mouseclick_id = message.id
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = message.selector
-        return n
-
-    if isinstance(message, MouseClickDepricated):
-        n.mouseclick_id = message.id
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = ''
-        return n
-
-    if isinstance(message, SetPageLocation):
-        n.setpagelocation_url = message.url
-        n.setpagelocation_referrer = message.referrer
-        n.setpagelocation_navigationstart = message.navigation_start
-        return n
-
-    if isinstance(message, MouseMove):
-        n.mousemove_x = message.x
-        n.mousemove_y = message.y
-        return n
-
-    if isinstance(message, LongTask):
-        n.longtasks_timestamp = message.timestamp
-        n.longtasks_duration = message.duration
-        n.longtask_context = message.context
-        n.longtask_containertype = message.container_type
-        n.longtasks_containersrc = message.container_src
-        n.longtasks_containerid = message.container_id
-        n.longtasks_containername = message.container_name
-        return n
-
-    if isinstance(message, SetNodeURLBasedAttribute):
-        n.setnodeurlbasedattribute_id = message.id
-        n.setnodeurlbasedattribute_name = message.name
-        n.setnodeurlbasedattribute_value = message.value
-        n.setnodeurlbasedattribute_baseurl = message.base_url
-        return n
-
-    if isinstance(message, SetStyleData):
-        n.setstyledata_id = message.id
-        n.setstyledata_data = message.data
-        n.setstyledata_baseurl = message.base_url
-        return n
-
-    if isinstance(message, IssueEvent):
-        n.issueevent_messageid = message.message_id
-        n.issueevent_timestamp = message.timestamp
-        n.issueevent_type = message.type
-        n.issueevent_contextstring = message.context_string
-        n.issueevent_context = message.context
-        n.issueevent_payload = message.payload
-        return n
-
-    if isinstance(message, TechnicalInfo):
-        n.technicalinfo_type = message.type
-        n.technicalinfo_value = message.value
-        return n
-
-    if isinstance(message, CustomIssue):
-        n.customissue_name = message.name
-        n.customissue_payload = message.payload
-        return n
-
-    if isinstance(message, PageClose):
-        n.pageclose = True
-        return n
-
-    if isinstance(message, AssetCache):
-        n.asset_cache_url = message.url
-        return n
-
-    if isinstance(message, IOSSessionStart):
-        n.iossessionstart_timestamp = message.timestamp
-        n.iossessionstart_projectid = message.project_id
-        n.iossessionstart_trackerversion = message.tracker_version
-        n.iossessionstart_revid = message.rev_id
-        n.iossessionstart_useruuid = message.user_uuid
-        n.iossessionstart_useros = message.user_os
-        n.iossessionstart_userosversion = message.user_os_version
-        n.iossessionstart_userdevice = message.user_device
-        n.iossessionstart_userdevicetype = message.user_device_type
-        n.iossessionstart_usercountry = message.user_country
-        return n
-
-    if isinstance(message, IOSSessionEnd):
-        n.iossessionend_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, IOSMetadata):
-        n.iosmetadata_timestamp = message.timestamp
-        n.iosmetadata_length = message.length
-        n.iosmetadata_key = message.key
-        n.iosmetadata_value = message.value
-        return n
-
-    if isinstance(message, IOSBatchMeta):
-        n.iosbatchmeta_page_no = message.page_no
-        n.iosbatchmeta_first_index = message.first_index
-        n.iosbatchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, IOSUserID):
-        n.iosuserid_timestamp = message.timestamp
-        n.iosuserid_length = message.length
-        n.iosuserid_value = message.value
-        return n
-
-    if isinstance(message, IOSUserAnonymousID):
-        n.iosuseranonymousid_timestamp = message.timestamp
-        n.iosuseranonymousid_length = message.length
-        n.iosuseranonymousid_value = message.value
-        return n
-
-    if isinstance(message, IOSScreenEnter):
-        n.iosscreenenter_timestamp = message.timestamp
-        n.iosscreenenter_length = message.length
-        n.iosscreenenter_title = message.title
-        n.iosscreenenter_view_name = message.view_name
-        return n
-
-    if isinstance(message, IOSScreenLeave):
-        n.iosscreenleave_timestamp = message.timestamp
-        n.iosscreenleave_length = message.length
-        n.iosscreenleave_title = message.title
-        n.iosscreenleave_viewname = message.view_name
-        return n
-
-    if isinstance(message, IOSScreenChanges):
-        n.iosscreenchanges_timestamp = message.timestamp
-        n.iosscreenchanges_length = message.length
-        n.iosscreenchanges_x = message.x
-        n.iosscreenchanges_y = message.y
-        n.iosscreenchanges_width = message.width
-        n.iosscreenchanges_height = message.height
-        return n
-
-    if isinstance(message, IOSClickEvent):
-        n.iosclickevent_timestamp = message.timestamp
-        n.iosclickevent_length = message.length
-        n.iosclickevent_label = message.label
-        n.iosclickevent_x = message.x
-        n.iosclickevent_y = message.y
-        return n
-
-    if isinstance(message, IOSInputEvent):
-        n.iosinputevent_timestamp = message.timestamp
-        n.iosinputevent_length = message.length
-        n.iosinputevent_value_masked = message.value_masked
-        n.iosinputevent_label = message.label
-        return n
-
-    if isinstance(message, IOSLog):
-        n.ioslog_timestamp = message.timestamp
-        n.ioslog_length = message.length
-        n.ioslog_severity = message.severity
-        n.ioslog_content = message.content
-        return n
-
-    if isinstance(message, IOSNetworkCall):
-        n.iosnetworkcall_timestamp = message.timestamp
-        n.iosnetworkcall_length = message.length
-        n.iosnetworkcall_duration = message.duration
-        n.iosnetworkcall_headers = message.headers
-        n.iosnetworkcall_body = message.body
-        n.iosnetworkcall_url = message.url
-        n.iosnetworkcall_success = message.success
-        n.iosnetworkcall_method = message.method
-        n.iosnetworkcall_status = message.status
-        return n
-
-    if isinstance(message, IOSIssueEvent):
-        n.iosissueevent_timestamp = message.timestamp
-        n.iosissueevent_type = message.type
-        n.iosissueevent_context_string = message.context_string
-        n.iosissueevent_context = message.context
-        n.iosissueevent_payload = message.payload
-        return n
-
-    if isinstance(message, IOSCustomEvent):
-        n.ioscustomevent_timestamp = message.timestamp
-        n.ioscustomevent_length = message.length
-        n.ioscustomevent_name = message.name
-        n.ioscustomevent_payload = message.payload
-        return n
-
-    if isinstance(message, IOSInternalError):
-        n.iosinternalerror_timestamp = message.timestamp
-        n.iosinternalerror_length = message.length
-        n.iosinternalerror_content = message.content
-        return n
-
-    if isinstance(message, IOSCrash):
-        n.ioscrash_timestamp = message.timestamp
-        n.ioscrash_length = message.length
-        n.ioscrash_name = message.name
-        n.ioscrash_reason = message.reason
-        n.ioscrash_stacktrace = message.stacktrace
-        return n
-
-    if isinstance(message, IOSPerformanceEvent):
-        n.iosperformanceevent_timestamp = message.timestamp
-        n.iosperformanceevent_length = message.length
-        n.iosperformanceevent_name = message.name
-        n.iosperformanceevent_value = message.value
-        return n
-
-    if isinstance(message, IOSPerformanceAggregated):
-        n.iosperformanceaggregated_timestampstart = message.timestamp_start
-        n.iosperformanceaggregated_timestampend = message.timestamp_end
-        n.iosperformanceaggregated_minfps = message.min_fps
-        n.iosperformanceaggregated_avgfps = message.avg_fps
-        n.iosperformanceaggregated_maxfps = message.max_fps
-        n.iosperformanceaggregated_mincpu = message.min_cpu
-        n.iosperformanceaggregated_avgcpu = message.avg_cpu
-        n.iosperformanceaggregated_maxcpu = message.max_cpu
-        n.iosperformanceaggregated_minmemory = message.min_memory
-        n.iosperformanceaggregated_avgmemory = message.avg_memory
-        n.iosperformanceaggregated_maxmemory = message.max_memory
-        n.iosperformanceaggregated_minbattery = message.min_battery
-        n.iosperformanceaggregated_avgbattery = message.avg_battery
-        n.iosperformanceaggregated_maxbattery = message.max_battery
-        return n
-    return None
+def handle_message_row(message: Message) -> Optional[dict]:
+    """
+    Row of the table of the message type (events_mode=tables): every attribute of the message,
+    for the message types kept at the detailed level
+    """
+    if type(message) not in detailed_handlers:
+        return None
+    return message.to_dict()
@@ -1,32 +1,66 @@
 import os
-from kafka import KafkaConsumer
+import time
+from kafka import KafkaConsumer, TopicPartition
 from datetime import datetime
-from collections import defaultdict
+from itertools import chain
 
-from msgcodec.codec import MessageCodec
+from msgcodec.msgcodec import MessageCodec
 from msgcodec.messages import SessionEnd
 from db.api import DBConnection
-from db.models import events_detailed_table_name, events_table_name, sessions_table_name, conf
-from db.writer import insert_batch
-from handler import handle_message, handle_normal_message, handle_session
+from db.models import events_detailed_table_name, events_table_name, sessions_table_name
+from db.batch import ColumnarBatch, MessageTablesBatch
+from db.message_tables import EVENTS_MODE, message_columns
+from db.utils import detailed_events_col, events_col
+from db.writer import insert_batch, insert_message_batch, prepare_message_tables, prepare_tables, start_spill_drainer
+from handler import handle_message, handle_message_row, handle_normal_message, handle_session, message_table_ids
+from session_cache import SessionCache
+from flush_policy import FlushPolicy, row_size
+import metrics
 
 DATABASE = os.environ['DATABASE_NAME']
-LEVEL = conf[DATABASE]['level']
+LEVEL = os.environ['level']
 
-db = DBConnection(DATABASE)
+SESSIONS_CACHE_SIZE = int(os.getenv('sessions_cache_size', 100000))
+SESSIONS_TTL = int(os.getenv('sessions_ttl', 3600))
+# a batch is flushed at the first limit reached, 0 disables a limit (ages in seconds)
+EVENTS_BATCH_ROWS = int(os.getenv('events_batch_rows', 4000))
+EVENTS_BATCH_BYTES = int(os.getenv('events_batch_bytes', 0))
+EVENTS_BATCH_AGE = int(os.getenv('events_batch_age', 60))
+SESSIONS_BATCH_ROWS = int(os.getenv('sessions_batch_rows', 400))
+SESSIONS_BATCH_BYTES = int(os.getenv('sessions_batch_bytes', 0))
+SESSIONS_BATCH_AGE = int(os.getenv('sessions_batch_age', 60))
+
+db = None
 
 if LEVEL == 'detailed':
     table_name = events_detailed_table_name
+    table_columns = detailed_events_col
 elif LEVEL == 'normal':
     table_name = events_table_name
+    table_columns = events_col
+# detailed level only: the events are written to one table per message type
+MESSAGE_TABLES = LEVEL == 'detailed' and EVENTS_MODE == 'tables'
+
+
+def new_events_batch():
+    if MESSAGE_TABLES:
+        return MessageTablesBatch(lambda message_id: [column for column, _ in message_columns(message_id)])
+    return ColumnarBatch(table_columns)
 
 
 def main():
-    batch_size = 4000
-    sessions_batch_size = 400
-    batch = []
-    sessions = defaultdict(lambda: None)
+    global db
+    db = DBConnection(DATABASE)
+    prepare_tables()
+    if MESSAGE_TABLES:
+        prepare_message_tables(message_table_ids)
+    batch = new_events_batch()
+    sessions = SessionCache(max_size=SESSIONS_CACHE_SIZE, ttl=SESSIONS_TTL)
     sessions_batch = []
+    events_policy = FlushPolicy(max_rows=EVENTS_BATCH_ROWS, max_bytes=EVENTS_BATCH_BYTES,
+                                max_age=EVENTS_BATCH_AGE)
+    sessions_policy = FlushPolicy(max_rows=SESSIONS_BATCH_ROWS, max_bytes=SESSIONS_BATCH_BYTES,
+                                  max_age=SESSIONS_BATCH_AGE)
 
     codec = MessageCodec()
     consumer = KafkaConsumer(security_protocol="SSL",
@@ -38,51 +72,79 @@ def main():
 
     consumer.subscribe(topics=["events", "messages"])
     print("Kafka consumer subscribed")
-    for msg in consumer:
-        message = codec.decode(msg.value)
-        if message is None:
-            print('-')
-            continue
-
-        if LEVEL == 'detailed':
-            n = handle_message(message)
-        elif LEVEL == 'normal':
-            n = handle_normal_message(message)
-
-        session_id = decode_key(msg.key)
-        sessions[session_id] = handle_session(sessions[session_id], message)
-        if sessions[session_id]:
-            sessions[session_id].sessionid = session_id
-
-        # put in a batch for insertion if received a SessionEnd
-        if isinstance(message, SessionEnd):
-            if sessions[session_id]:
-                sessions_batch.append(sessions[session_id])
-
-        # try to insert sessions
-        if len(sessions_batch) >= sessions_batch_size:
+    metrics.serve()
+    start_spill_drainer()
+    while True:
+        # eviction and flush policies are checked on every poll, empty ones included.
+        # Sessions that never sent a SessionEnd are inserted as partial rows once evicted,
+        # the ended ones are already waiting in sessions_batch
+        now = time.time()
+        for s in sessions.evict(now):
+            if s.session_end_timestamp is None:
+                sessions_batch.append(s)
+                sessions_policy.add(row_size(s.__dict__), now)
+        metrics.observe_sessions(sessions)
+        if sessions_policy.due(now):
             attempt_session_insert(sessions_batch)
             for s in sessions_batch:
-                try:
-                    del sessions[s.sessionid]
-                except KeyError  as e:
-                    print(repr(e))
+                sessions.discard(s.sessionid, s)
             sessions_batch = []
-
-        if n:
-            n.sessionid = session_id
-            n.received_at = int(datetime.now().timestamp() * 1000)
-            n.batch_order_number = len(batch)
-            batch.append(n)
-        else:
-            continue
-
-        # insert a batch of events
-        if len(batch) >= batch_size:
+            sessions_policy.reset()
+        if events_policy.due(now):
             attempt_batch_insert(batch)
-            batch = []
+            batch = new_events_batch()
+            events_policy.reset()
             consumer.commit()
-            print("sessions in cache:", len(sessions))
+            print("sessions in cache:", sessions.stats())
+
+        records = consumer.poll(timeout_ms=1000)
+        for msg in chain.from_iterable(records.values()):
+            metrics.observe_lag(msg.topic, msg.partition, msg.offset,
+                                consumer.highwater(TopicPartition(msg.topic, msg.partition)))
+            message = decode_message(codec, msg.value)
+            if message is None:
+                print('-')
+                metrics.errors.labels('decode', 'undecodable').inc()
+                continue
+            metrics.messages_decoded.labels(type(message).__name__).inc()
+
+            if MESSAGE_TABLES:
+                n = handle_message_row(message)
+            elif LEVEL == 'detailed':
+                n = handle_message(message)
+            elif LEVEL == 'normal':
+                n = handle_normal_message(message)
+
+            now = time.time()
+            session_id = decode_key(msg.key)
+            session = handle_session(sessions.get(session_id), message)
+            if session:
+                session.sessionid = session_id
+                sessions.put(session_id, session, now)
+
+            # put in a batch for insertion if received a SessionEnd
+            if isinstance(message, SessionEnd):
+                if session:
+                    sessions_batch.append(session)
+                    sessions_policy.add(row_size(session.__dict__), now)
+
+            if n:
+                n['sessionid'] = session_id
+                n['received_at'] = int(datetime.now().timestamp() * 1000)
+                n['batch_order_number'] = len(batch)
+                if MESSAGE_TABLES:
+                    batch.append(message.__id__, n)
+                else:
+                    batch.append(n)
+                events_policy.add(row_size(n), now)
+
+
+def decode_message(codec, value):
+    # one message per Kafka record on the events and messages topics
+    start = time.perf_counter()
+    message = codec.decode(value)
+    metrics.decode_seconds.observe(time.perf_counter() - start)
+    return message
 
 
 def attempt_session_insert(sess_batch):
@@ -105,7 +167,11 @@ def attempt_batch_insert(batch):
     # insert a batch
     try:
         print("inserting...")
-        insert_batch(db=db, batch=batch, table=table_name, level=LEVEL)
+        if isinstance(batch, MessageTablesBatch):
+            for message_id, message_batch in batch.batches.items():
+                insert_message_batch(db, message_batch, message_id)
+        else:
+            insert_batch(db=db, batch=batch, table=table_name, level=LEVEL)
         print("inserted succesfully")
     except TypeError as e:
         print("Type conversion error")
@@ -0,0 +1,50 @@
+import collections
+import os
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+# port of the Prometheus endpoint, 0 disables it. In the worker-pool mode,
+# worker i serves its own metrics on metrics_port + 1 + i
+METRICS_PORT = int(os.getenv('metrics_port', 0))
+
+messages_decoded = Counter('connector_messages_decoded_total', 'Messages decoded, per message type', ['type'])
+decode_seconds = Histogram('connector_decode_seconds', 'Decoding time of a Kafka message (a batch of messages)',
+                           buckets=(.0001, .00025, .0005, .001, .0025, .005, .01, .025, .05, .1, .25, 1))
+flush_seconds = Histogram('connector_flush_seconds', 'Writing time of a batch, per loader and table',
+                          ['loader', 'table'], buckets=(.05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, 120))
+batch_rows = Histogram('connector_batch_rows', 'Rows of the batches written, per table', ['table'],
+                       buckets=(10, 50, 100, 400, 1000, 2000, 4000, 10000, 40000))
+rows_written = Counter('connector_rows_written_total', 'Rows written, per table', ['table'])
+errors = Counter('connector_errors_total', 'Errors, per stage and exception class', ['stage', 'error'])
+spilled_rows = Counter('connector_spilled_rows_total', 'Rows spilled after a failed write, per table', ['table'])
+spill_drained_rows = Counter('connector_spill_drained_rows_total', 'Spilled rows written back, per table', ['table'])
+spill_pending = Gauge('connector_spill_pending', 'Spilled batches waiting to be written back')
+sessions_cached = Gauge('connector_sessions_cached', 'Sessions being built in the sessions cache')
+sessions_evicted = Counter('connector_sessions_evicted_total', 'Sessions evicted from the cache, by reason', ['reason'])
+consumer_lag = Gauge('connector_consumer_lag', 'Messages left after the last one read, per partition',
+                     ['topic', 'partition'])
+
+
+def serve(worker=None):
+    if METRICS_PORT:
+        start_http_server(METRICS_PORT if worker is None else METRICS_PORT + 1 + worker)
+
+
+def count_messages(messages) -> None:
+    # one increment per message type, not per message
+    for message_type, n in collections.Counter(type(m).__name__ for m in messages).items():
+        messages_decoded.labels(message_type).inc(n)
+
+
+def count_error(stage: str, e: BaseException) -> None:
+    errors.labels(stage, type(e).__name__).inc()
+
+
+def observe_sessions(sessions) -> None:
+    sessions_cached.set(sessions.size)
+
+
+def observe_lag(topic, partition, offset: int, high: int) -> None:
+    # high: the partition high watermark, negative when not known yet
+    if high is not None and high >= 0:
+        consumer_lag.labels(topic, str(partition)).set(max(high - offset - 1, 0))
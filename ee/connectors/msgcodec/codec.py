@@ -1,4 +1,6 @@
 import io
+from typing import Tuple
+
 
 class Codec:
     """
@@ -8,7 +10,7 @@ class Codec:
     @staticmethod
     def read_boolean(reader: io.BytesIO):
         b = reader.read(1)
-        return b == 1
+        return b == b'\x01'
 
     @staticmethod
     def read_uint(reader: io.BytesIO):
@@ -62,3 +64,50 @@ class Codec:
             return s.decode("utf-8", errors="replace").replace("\x00", "\uFFFD")
         except UnicodeDecodeError:
             return None
+
+    @staticmethod
+    def read_boolean_from(buf: memoryview, pos: int) -> Tuple[bool, int]:
+        """
+        Same as read_boolean: False when the buffer is exhausted, the cursor stays at the end
+        """
+        if pos >= len(buf):
+            return False, pos
+        return buf[pos] == 1, pos + 1
+
+    @staticmethod
+    def read_uint_from(buf: memoryview, pos: int) -> Tuple[int, int]:
+        """
+        Same as read_uint, but reads straight from a buffer starting at the cursor `pos`.
+        Returns the value and the position right after it.
+        Raises IndexError when the buffer is exhausted
+        """
+        b = buf[pos]
+        pos += 1
+        if b < 0x80:
+            return b, pos
+        x = b & 0x7f
+        s = 7
+        while True:
+            b = buf[pos]
+            pos += 1
+            if b < 0x80:
+                return x | b << s, pos
+            x |= (b & 0x7f) << s
+            s += 7
+
+    @staticmethod
+    def read_int_from(buf: memoryview, pos: int) -> Tuple[int, int]:
+        ux, pos = Codec.read_uint_from(buf, pos)
+        x = ux >> 1
+        if ux & 1 != 0:
+            x = - x - 1
+        return x, pos
+
+    @staticmethod
+    def read_string_from(buf: memoryview, pos: int) -> Tuple[str, int]:
+        """
+        Decodes the string directly from the buffer slice, no intermediate bytes object is created
+        """
+        length, pos = Codec.read_uint_from(buf, pos)
+        end = pos + length
+        return str(buf[pos:end], "utf-8", "replace").replace("\x00", "\uFFFD"), end
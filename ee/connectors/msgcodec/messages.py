@@ -1,19 +1,26 @@
 # Auto-generated, do not edit
 
 from abc import ABC
+from collections import namedtuple
+
 
 class Message(ABC):
-    pass
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
 
-class Timestamp(Message):
+class Timestamp(namedtuple('Timestamp', ['timestamp']), Message):
+    __slots__ = ()
     __id__ = 0
 
-    def __init__(self, timestamp):
-        self.timestamp = timestamp
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class SessionStart(Message):
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_agent', 'user_os', 'user_os_version', 'user_browser', 'user_browser_version', 'user_device', 'user_device_type', 'user_device_memory_size', 'user_device_heap_size', 'user_country', 'user_id')
     __id__ = 1
 
     def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_agent, user_os, user_os_version, user_browser, user_browser_version, user_device, user_device_type, user_device_memory_size, user_device_heap_size, user_country, user_id):
@@ -36,6 +43,7 @@ class SessionStart(Message):
 
 
 class SessionEndDeprecated(Message):
+    __slots__ = ('timestamp',)
     __id__ = 3
 
     def __init__(self, timestamp):
@@ -43,6 +51,7 @@ class SessionEndDeprecated(Message):
 
 
 class SetPageLocation(Message):
+    __slots__ = ('url', 'referrer', 'navigation_start')
     __id__ = 4
 
     def __init__(self, url, referrer, navigation_start):
@@ -52,6 +61,7 @@ class SetPageLocation(Message):
 
 
 class SetViewportSize(Message):
+    __slots__ = ('width', 'height')
     __id__ = 5
 
     def __init__(self, width, height):
@@ -60,6 +70,7 @@ class SetViewportSize(Message):
 
 
 class SetViewportScroll(Message):
+    __slots__ = ('x', 'y')
     __id__ = 6
 
     def __init__(self, x, y):
@@ -68,13 +79,15 @@ class SetViewportScroll(Message):
 
 
 class CreateDocument(Message):
+    __slots__ = ()
     __id__ = 7
 
     def __init__(self, ):
-        
+        pass
 
 
 class CreateElementNode(Message):
+    __slots__ = ('id', 'parent_id', 'index', 'tag', 'svg')
     __id__ = 8
 
     def __init__(self, id, parent_id, index, tag, svg):
@@ -86,6 +99,7 @@ class CreateElementNode(Message):
 
 
 class CreateTextNode(Message):
+    __slots__ = ('id', 'parent_id', 'index')
     __id__ = 9
 
     def __init__(self, id, parent_id, index):
@@ -95,6 +109,7 @@ class CreateTextNode(Message):
 
 
 class MoveNode(Message):
+    __slots__ = ('id', 'parent_id', 'index')
     __id__ = 10
 
     def __init__(self, id, parent_id, index):
@@ -104,6 +119,7 @@ class MoveNode(Message):
 
 
 class RemoveNode(Message):
+    __slots__ = ('id',)
     __id__ = 11
 
     def __init__(self, id):
@@ -111,6 +127,7 @@ class RemoveNode(Message):
 
 
 class SetNodeAttribute(Message):
+    __slots__ = ('id', 'name', 'value')
     __id__ = 12
 
     def __init__(self, id, name, value):
@@ -120,6 +137,7 @@ class SetNodeAttribute(Message):
 
 
 class RemoveNodeAttribute(Message):
+    __slots__ = ('id', 'name')
     __id__ = 13
 
     def __init__(self, id, name):
@@ -128,6 +146,7 @@ class RemoveNodeAttribute(Message):
 
 
 class SetNodeData(Message):
+    __slots__ = ('id', 'data')
     __id__ = 14
 
     def __init__(self, id, data):
@@ -136,6 +155,7 @@ class SetNodeData(Message):
 
 
 class SetCSSData(Message):
+    __slots__ = ('id', 'data')
     __id__ = 15
 
     def __init__(self, id, data):
@@ -144,6 +164,7 @@ class SetCSSData(Message):
 
 
 class SetNodeScroll(Message):
+    __slots__ = ('id', 'x', 'y')
     __id__ = 16
 
     def __init__(self, id, x, y):
@@ -153,6 +174,7 @@ class SetNodeScroll(Message):
 
 
 class SetInputTarget(Message):
+    __slots__ = ('id', 'label')
     __id__ = 17
 
     def __init__(self, id, label):
@@ -161,6 +183,7 @@ class SetInputTarget(Message):
 
 
 class SetInputValue(Message):
+    __slots__ = ('id', 'value', 'mask')
     __id__ = 18
 
     def __init__(self, id, value, mask):
@@ -170,6 +193,7 @@ class SetInputValue(Message):
 
 
 class SetInputChecked(Message):
+    __slots__ = ('id', 'checked')
     __id__ = 19
 
     def __init__(self, id, checked):
@@ -178,6 +202,7 @@ class SetInputChecked(Message):
 
 
 class MouseMove(Message):
+    __slots__ = ('x', 'y')
     __id__ = 20
 
     def __init__(self, x, y):
@@ -186,6 +211,7 @@ class MouseMove(Message):
 
 
 class NetworkRequest(Message):
+    __slots__ = ('type', 'method', 'url', 'request', 'response', 'status', 'timestamp', 'duration')
     __id__ = 21
 
     def __init__(self, type, method, url, request, response, status, timestamp, duration):
@@ -200,6 +226,7 @@ class NetworkRequest(Message):
 
 
 class ConsoleLog(Message):
+    __slots__ = ('level', 'value')
     __id__ = 22
 
     def __init__(self, level, value):
@@ -208,6 +235,7 @@ class ConsoleLog(Message):
 
 
 class PageLoadTiming(Message):
+    __slots__ = ('request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint')
     __id__ = 23
 
     def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint):
@@ -223,6 +251,7 @@ class PageLoadTiming(Message):
 
 
 class PageRenderTiming(Message):
+    __slots__ = ('speed_index', 'visually_complete', 'time_to_interactive')
     __id__ = 24
 
     def __init__(self, speed_index, visually_complete, time_to_interactive):
@@ -232,6 +261,7 @@ class PageRenderTiming(Message):
 
 
 class JSExceptionDeprecated(Message):
+    __slots__ = ('name', 'message', 'payload')
     __id__ = 25
 
     def __init__(self, name, message, payload):
@@ -241,6 +271,7 @@ class JSExceptionDeprecated(Message):
 
 
 class IntegrationEvent(Message):
+    __slots__ = ('timestamp', 'source', 'name', 'message', 'payload')
     __id__ = 26
 
     def __init__(self, timestamp, source, name, message, payload):
@@ -252,6 +283,7 @@ class IntegrationEvent(Message):
 
 
 class CustomEvent(Message):
+    __slots__ = ('name', 'payload')
     __id__ = 27
 
     def __init__(self, name, payload):
@@ -260,6 +292,7 @@ class CustomEvent(Message):
 
 
 class UserID(Message):
+    __slots__ = ('id',)
     __id__ = 28
 
     def __init__(self, id):
@@ -267,6 +300,7 @@ class UserID(Message):
 
 
 class UserAnonymousID(Message):
+    __slots__ = ('id',)
     __id__ = 29
 
     def __init__(self, id):
@@ -274,6 +308,7 @@ class UserAnonymousID(Message):
 
 
 class Metadata(Message):
+    __slots__ = ('key', 'value')
     __id__ = 30
 
     def __init__(self, key, value):
@@ -281,30 +316,16 @@ class Metadata(Message):
         self.value = value
 
 
-class PageEvent(Message):
+class PageEvent(namedtuple('PageEvent', ['message_id', 'timestamp', 'url', 'referrer', 'loaded', 'request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint', 'speed_index', 'visually_complete', 'time_to_interactive']), Message):
+    __slots__ = ()
     __id__ = 31
 
-    def __init__(self, message_id, timestamp, url, referrer, loaded, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint, speed_index, visually_complete, time_to_interactive):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.url = url
-        self.referrer = referrer
-        self.loaded = loaded
-        self.request_start = request_start
-        self.response_start = response_start
-        self.response_end = response_end
-        self.dom_content_loaded_event_start = dom_content_loaded_event_start
-        self.dom_content_loaded_event_end = dom_content_loaded_event_end
-        self.load_event_start = load_event_start
-        self.load_event_end = load_event_end
-        self.first_paint = first_paint
-        self.first_contentful_paint = first_contentful_paint
-        self.speed_index = speed_index
-        self.visually_complete = visually_complete
-        self.time_to_interactive = time_to_interactive
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class InputEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'value', 'value_masked', 'label')
     __id__ = 32
 
     def __init__(self, message_id, timestamp, value, value_masked, label):
@@ -316,6 +337,7 @@ class InputEvent(Message):
 
 
 class ClickEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'hesitation_time', 'label', 'selector')
     __id__ = 33
 
     def __init__(self, message_id, timestamp, hesitation_time, label, selector):
@@ -327,6 +349,7 @@ class ClickEvent(Message):
 
 
 class ResourceEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'type', 'success', 'method', 'status')
     __id__ = 35
 
     def __init__(self, message_id, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, type, success, method, status):
@@ -345,6 +368,7 @@ class ResourceEvent(Message):
 
 
 class CSSInsertRule(Message):
+    __slots__ = ('id', 'rule', 'index')
     __id__ = 37
 
     def __init__(self, id, rule, index):
@@ -354,6 +378,7 @@ class CSSInsertRule(Message):
 
 
 class CSSDeleteRule(Message):
+    __slots__ = ('id', 'index')
     __id__ = 38
 
     def __init__(self, id, index):
@@ -362,6 +387,7 @@ class CSSDeleteRule(Message):
 
 
 class Fetch(Message):
+    __slots__ = ('method', 'url', 'request', 'response', 'status', 'timestamp', 'duration')
     __id__ = 39
 
     def __init__(self, method, url, request, response, status, timestamp, duration):
@@ -375,6 +401,7 @@ class Fetch(Message):
 
 
 class Profiler(Message):
+    __slots__ = ('name', 'duration', 'args', 'result')
     __id__ = 40
 
     def __init__(self, name, duration, args, result):
@@ -385,6 +412,7 @@ class Profiler(Message):
 
 
 class OTable(Message):
+    __slots__ = ('key', 'value')
     __id__ = 41
 
     def __init__(self, key, value):
@@ -393,6 +421,7 @@ class OTable(Message):
 
 
 class StateAction(Message):
+    __slots__ = ('type',)
     __id__ = 42
 
     def __init__(self, type):
@@ -400,6 +429,7 @@ class StateAction(Message):
 
 
 class Redux(Message):
+    __slots__ = ('action', 'state', 'duration')
     __id__ = 44
 
     def __init__(self, action, state, duration):
@@ -409,6 +439,7 @@ class Redux(Message):
 
 
 class Vuex(Message):
+    __slots__ = ('mutation', 'state')
     __id__ = 45
 
     def __init__(self, mutation, state):
@@ -417,6 +448,7 @@ class Vuex(Message):
 
 
 class MobX(Message):
+    __slots__ = ('type', 'payload')
     __id__ = 46
 
     def __init__(self, type, payload):
@@ -425,6 +457,7 @@ class MobX(Message):
 
 
 class NgRx(Message):
+    __slots__ = ('action', 'state', 'duration')
     __id__ = 47
 
     def __init__(self, action, state, duration):
@@ -434,6 +467,7 @@ class NgRx(Message):
 
 
 class GraphQL(Message):
+    __slots__ = ('operation_kind', 'operation_name', 'variables', 'response')
     __id__ = 48
 
     def __init__(self, operation_kind, operation_name, variables, response):
@@ -444,6 +478,7 @@ class GraphQL(Message):
 
 
 class PerformanceTrack(Message):
+    __slots__ = ('frames', 'ticks', 'total_js_heap_size', 'used_js_heap_size')
     __id__ = 49
 
     def __init__(self, frames, ticks, total_js_heap_size, used_js_heap_size):
@@ -454,6 +489,7 @@ class PerformanceTrack(Message):
 
 
 class StringDict(Message):
+    __slots__ = ('key', 'value')
     __id__ = 50
 
     def __init__(self, key, value):
@@ -462,6 +498,7 @@ class StringDict(Message):
 
 
 class SetNodeAttributeDict(Message):
+    __slots__ = ('id', 'name_key', 'value_key')
     __id__ = 51
 
     def __init__(self, id, name_key, value_key):
@@ -471,6 +508,7 @@ class SetNodeAttributeDict(Message):
 
 
 class DOMDrop(Message):
+    __slots__ = ('timestamp',)
     __id__ = 52
 
     def __init__(self, timestamp):
@@ -478,6 +516,7 @@ class DOMDrop(Message):
 
 
 class ResourceTiming(Message):
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator')
     __id__ = 53
 
     def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator):
@@ -492,6 +531,7 @@ class ResourceTiming(Message):
 
 
 class ConnectionInformation(Message):
+    __slots__ = ('downlink', 'type')
     __id__ = 54
 
     def __init__(self, downlink, type):
@@ -500,6 +540,7 @@ class ConnectionInformation(Message):
 
 
 class SetPageVisibility(Message):
+    __slots__ = ('hidden',)
     __id__ = 55
 
     def __init__(self, hidden):
@@ -507,6 +548,7 @@ class SetPageVisibility(Message):
 
 
 class PerformanceTrackAggr(Message):
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_total_js_heap_size', 'avg_total_js_heap_size', 'max_total_js_heap_size', 'min_used_js_heap_size', 'avg_used_js_heap_size', 'max_used_js_heap_size')
     __id__ = 56
 
     def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_total_js_heap_size, avg_total_js_heap_size, max_total_js_heap_size, min_used_js_heap_size, avg_used_js_heap_size, max_used_js_heap_size):
@@ -527,6 +569,7 @@ class PerformanceTrackAggr(Message):
 
 
 class LoadFontFace(Message):
+    __slots__ = ('parent_id', 'family', 'source', 'descriptors')
     __id__ = 57
 
     def __init__(self, parent_id, family, source, descriptors):
@@ -537,6 +580,7 @@ class LoadFontFace(Message):
 
 
 class SetNodeFocus(Message):
+    __slots__ = ('id',)
     __id__ = 58
 
     def __init__(self, id):
@@ -544,6 +588,7 @@ class SetNodeFocus(Message):
 
 
 class LongTask(Message):
+    __slots__ = ('timestamp', 'duration', 'context', 'container_type', 'container_src', 'container_id', 'container_name')
     __id__ = 59
 
     def __init__(self, timestamp, duration, context, container_type, container_src, container_id, container_name):
@@ -557,6 +602,7 @@ class LongTask(Message):
 
 
 class SetNodeAttributeURLBased(Message):
+    __slots__ = ('id', 'name', 'value', 'base_url')
     __id__ = 60
 
     def __init__(self, id, name, value, base_url):
@@ -567,6 +613,7 @@ class SetNodeAttributeURLBased(Message):
 
 
 class SetCSSDataURLBased(Message):
+    __slots__ = ('id', 'data', 'base_url')
     __id__ = 61
 
     def __init__(self, id, data, base_url):
@@ -576,6 +623,7 @@ class SetCSSDataURLBased(Message):
 
 
 class IssueEventDeprecated(Message):
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload')
     __id__ = 62
 
     def __init__(self, message_id, timestamp, type, context_string, context, payload):
@@ -588,6 +636,7 @@ class IssueEventDeprecated(Message):
 
 
 class TechnicalInfo(Message):
+    __slots__ = ('type', 'value')
     __id__ = 63
 
     def __init__(self, type, value):
@@ -596,6 +645,7 @@ class TechnicalInfo(Message):
 
 
 class CustomIssue(Message):
+    __slots__ = ('name', 'payload')
     __id__ = 64
 
     def __init__(self, name, payload):
@@ -604,6 +654,7 @@ class CustomIssue(Message):
 
 
 class AssetCache(Message):
+    __slots__ = ('url',)
     __id__ = 66
 
     def __init__(self, url):
@@ -611,6 +662,7 @@ class AssetCache(Message):
 
 
 class CSSInsertRuleURLBased(Message):
+    __slots__ = ('id', 'rule', 'index', 'base_url')
     __id__ = 67
 
     def __init__(self, id, rule, index, base_url):
@@ -620,17 +672,16 @@ class CSSInsertRuleURLBased(Message):
         self.base_url = base_url
 
 
-class MouseClick(Message):
+class MouseClick(namedtuple('MouseClick', ['id', 'hesitation_time', 'label', 'selector']), Message):
+    __slots__ = ()
     __id__ = 69
 
-    def __init__(self, id, hesitation_time, label, selector):
-        self.id = id
-        self.hesitation_time = hesitation_time
-        self.label = label
-        self.selector = selector
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class CreateIFrameDocument(Message):
+    __slots__ = ('frame_id', 'id')
     __id__ = 70
 
     def __init__(self, frame_id, id):
@@ -639,6 +690,7 @@ class CreateIFrameDocument(Message):
 
 
 class AdoptedSSReplaceURLBased(Message):
+    __slots__ = ('sheet_id', 'text', 'base_url')
     __id__ = 71
 
     def __init__(self, sheet_id, text, base_url):
@@ -648,6 +700,7 @@ class AdoptedSSReplaceURLBased(Message):
 
 
 class AdoptedSSReplace(Message):
+    __slots__ = ('sheet_id', 'text')
     __id__ = 72
 
     def __init__(self, sheet_id, text):
@@ -656,6 +709,7 @@ class AdoptedSSReplace(Message):
 
 
 class AdoptedSSInsertRuleURLBased(Message):
+    __slots__ = ('sheet_id', 'rule', 'index', 'base_url')
     __id__ = 73
 
     def __init__(self, sheet_id, rule, index, base_url):
@@ -666,6 +720,7 @@ class AdoptedSSInsertRuleURLBased(Message):
 
 
 class AdoptedSSInsertRule(Message):
+    __slots__ = ('sheet_id', 'rule', 'index')
     __id__ = 74
 
     def __init__(self, sheet_id, rule, index):
@@ -675,6 +730,7 @@ class AdoptedSSInsertRule(Message):
 
 
 class AdoptedSSDeleteRule(Message):
+    __slots__ = ('sheet_id', 'index')
     __id__ = 75
 
     def __init__(self, sheet_id, index):
@@ -683,6 +739,7 @@ class AdoptedSSDeleteRule(Message):
 
 
 class AdoptedSSAddOwner(Message):
+    __slots__ = ('sheet_id', 'id')
     __id__ = 76
 
     def __init__(self, sheet_id, id):
@@ -691,6 +748,7 @@ class AdoptedSSAddOwner(Message):
 
 
 class AdoptedSSRemoveOwner(Message):
+    __slots__ = ('sheet_id', 'id')
     __id__ = 77
 
     def __init__(self, sheet_id, id):
@@ -699,6 +757,7 @@ class AdoptedSSRemoveOwner(Message):
 
 
 class JSException(Message):
+    __slots__ = ('name', 'message', 'payload', 'metadata')
     __id__ = 78
 
     def __init__(self, name, message, payload, metadata):
@@ -709,6 +768,7 @@ class JSException(Message):
 
 
 class Zustand(Message):
+    __slots__ = ('mutation', 'state')
     __id__ = 79
 
     def __init__(self, mutation, state):
@@ -717,6 +777,7 @@ class Zustand(Message):
 
 
 class BatchMeta(Message):
+    __slots__ = ('page_no', 'first_index', 'timestamp')
     __id__ = 80
 
     def __init__(self, page_no, first_index, timestamp):
@@ -726,6 +787,7 @@ class BatchMeta(Message):
 
 
 class BatchMetadata(Message):
+    __slots__ = ('version', 'page_no', 'first_index', 'timestamp', 'location')
     __id__ = 81
 
     def __init__(self, version, page_no, first_index, timestamp, location):
@@ -737,6 +799,7 @@ class BatchMetadata(Message):
 
 
 class PartitionedMessage(Message):
+    __slots__ = ('part_no', 'part_total')
     __id__ = 82
 
     def __init__(self, part_no, part_total):
@@ -745,6 +808,7 @@ class PartitionedMessage(Message):
 
 
 class IssueEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload', 'url')
     __id__ = 125
 
     def __init__(self, message_id, timestamp, type, context_string, context, payload, url):
@@ -758,6 +822,7 @@ class IssueEvent(Message):
 
 
 class SessionEnd(Message):
+    __slots__ = ('timestamp', 'encryption_key')
     __id__ = 126
 
     def __init__(self, timestamp, encryption_key):
@@ -766,6 +831,7 @@ class SessionEnd(Message):
 
 
 class SessionSearch(Message):
+    __slots__ = ('timestamp', 'partition')
     __id__ = 127
 
     def __init__(self, timestamp, partition):
@@ -774,6 +840,7 @@ class SessionSearch(Message):
 
 
 class IOSBatchMeta(Message):
+    __slots__ = ('timestamp', 'length', 'first_index')
     __id__ = 107
 
     def __init__(self, timestamp, length, first_index):
@@ -783,6 +850,7 @@ class IOSBatchMeta(Message):
 
 
 class IOSSessionStart(Message):
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_os', 'user_os_version', 'user_device', 'user_device_type', 'user_country')
     __id__ = 90
 
     def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_os, user_os_version, user_device, user_device_type, user_country):
@@ -799,6 +867,7 @@ class IOSSessionStart(Message):
 
 
 class IOSSessionEnd(Message):
+    __slots__ = ('timestamp',)
     __id__ = 91
 
     def __init__(self, timestamp):
@@ -806,6 +875,7 @@ class IOSSessionEnd(Message):
 
 
 class IOSMetadata(Message):
+    __slots__ = ('timestamp', 'length', 'key', 'value')
     __id__ = 92
 
     def __init__(self, timestamp, length, key, value):
@@ -816,6 +886,7 @@ class IOSMetadata(Message):
 
 
 class IOSCustomEvent(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'payload')
     __id__ = 93
 
     def __init__(self, timestamp, length, name, payload):
@@ -826,6 +897,7 @@ class IOSCustomEvent(Message):
 
 
 class IOSUserID(Message):
+    __slots__ = ('timestamp', 'length', 'value')
     __id__ = 94
 
     def __init__(self, timestamp, length, value):
@@ -835,6 +907,7 @@ class IOSUserID(Message):
 
 
 class IOSUserAnonymousID(Message):
+    __slots__ = ('timestamp', 'length', 'value')
     __id__ = 95
 
     def __init__(self, timestamp, length, value):
@@ -844,6 +917,7 @@ class IOSUserAnonymousID(Message):
 
 
 class IOSScreenChanges(Message):
+    __slots__ = ('timestamp', 'length', 'x', 'y', 'width', 'height')
     __id__ = 96
 
     def __init__(self, timestamp, length, x, y, width, height):
@@ -856,6 +930,7 @@ class IOSScreenChanges(Message):
 
 
 class IOSCrash(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'reason', 'stacktrace')
     __id__ = 97
 
     def __init__(self, timestamp, length, name, reason, stacktrace):
@@ -867,6 +942,7 @@ class IOSCrash(Message):
 
 
 class IOSScreenEnter(Message):
+    __slots__ = ('timestamp', 'length', 'title', 'view_name')
     __id__ = 98
 
     def __init__(self, timestamp, length, title, view_name):
@@ -877,6 +953,7 @@ class IOSScreenEnter(Message):
 
 
 class IOSScreenLeave(Message):
+    __slots__ = ('timestamp', 'length', 'title', 'view_name')
     __id__ = 99
 
     def __init__(self, timestamp, length, title, view_name):
@@ -887,6 +964,7 @@ class IOSScreenLeave(Message):
 
 
 class IOSClickEvent(Message):
+    __slots__ = ('timestamp', 'length', 'label', 'x', 'y')
     __id__ = 100
 
     def __init__(self, timestamp, length, label, x, y):
@@ -898,6 +976,7 @@ class IOSClickEvent(Message):
 
 
 class IOSInputEvent(Message):
+    __slots__ = ('timestamp', 'length', 'value', 'value_masked', 'label')
     __id__ = 101
 
     def __init__(self, timestamp, length, value, value_masked, label):
@@ -909,6 +988,7 @@ class IOSInputEvent(Message):
 
 
 class IOSPerformanceEvent(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'value')
     __id__ = 102
 
     def __init__(self, timestamp, length, name, value):
@@ -919,6 +999,7 @@ class IOSPerformanceEvent(Message):
 
 
 class IOSLog(Message):
+    __slots__ = ('timestamp', 'length', 'severity', 'content')
     __id__ = 103
 
     def __init__(self, timestamp, length, severity, content):
@@ -929,6 +1010,7 @@ class IOSLog(Message):
 
 
 class IOSInternalError(Message):
+    __slots__ = ('timestamp', 'length', 'content')
     __id__ = 104
 
     def __init__(self, timestamp, length, content):
@@ -938,6 +1020,7 @@ class IOSInternalError(Message):
 
 
 class IOSNetworkCall(Message):
+    __slots__ = ('timestamp', 'length', 'duration', 'headers', 'body', 'url', 'success', 'method', 'status')
     __id__ = 105
 
     def __init__(self, timestamp, length, duration, headers, body, url, success, method, status):
@@ -953,6 +1036,7 @@ class IOSNetworkCall(Message):
 
 
 class IOSPerformanceAggregated(Message):
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_memory', 'avg_memory', 'max_memory', 'min_battery', 'avg_battery', 'max_battery')
     __id__ = 110
 
     def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_memory, avg_memory, max_memory, min_battery, avg_battery, max_battery):
@@ -973,6 +1057,7 @@ class IOSPerformanceAggregated(Message):
 
 
 class IOSIssueEvent(Message):
+    __slots__ = ('timestamp', 'type', 'context_string', 'context', 'payload')
     __id__ = 111
 
     def __init__(self, timestamp, type, context_string, context, payload):
@@ -982,4 +1067,3 @@ class IOSIssueEvent(Message):
         self.context = context
         self.payload = payload
 
-
@@ -2,9 +2,12 @@
 
 from msgcodec.codec import Codec
 from msgcodec.messages import *
-from typing import List
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import io
 
+MESSAGES_WITHOUT_SIZE = {BatchMeta.__id__, BatchMetadata.__id__, PartitionedMessage.__id__}
+
+
 class MessageCodec(Codec):
 
     def read_message_id(self, reader: io.BytesIO) -> int:
@@ -19,7 +22,7 @@ class MessageCodec(Codec):
 
     def decode(self, b: bytes) -> Message:
         reader = io.BytesIO(b)
-        return self.read_head_message(reader)
+        return self.read_head_message(reader, self.read_message_id(reader))
 
     @staticmethod
     def check_message_id(b: bytes) -> int:
@@ -43,7 +46,18 @@ class MessageCodec(Codec):
             raise UnicodeDecodeError(f"Error while decoding message key (SessionID) from {b}\n{e}")
         return decoded
 
-    def decode_detailed(self, b: bytes) -> List[Message]:
+    @staticmethod
+    def message_has_size(message_id: int) -> bool:
+        """
+        Batch meta messages are written without the three bytes of message length
+        """
+        return message_id not in MESSAGES_WITHOUT_SIZE
+
+    def decode_detailed(self, b: bytes, wanted: Optional[Set[int]] = None) -> List[Message]:
+        """
+        wanted: optional set of message ids to decode. In batches started with BatchMetadata
+        every other message is skipped by its length and is not returned
+        """
         reader = io.BytesIO(b)
         messages_list = list()
         messages_list.append(self.handler(reader, 0))
@@ -57,16 +71,22 @@ class MessageCodec(Codec):
             return messages_list
         while True:
             try:
-                messages_list.append(self.handler(reader, mode))
+                message = self.handler(reader, mode, wanted)
             except IndexError:
                 break
+            if message is not None or wanted is None:
+                messages_list.append(message)
         return messages_list
 
-    def handler(self, reader: io.BytesIO, mode=0) -> Message:
+    def handler(self, reader: io.BytesIO, mode=0, wanted: Optional[Set[int]] = None) -> Optional[Message]:
         message_id = self.read_message_id(reader)
         if mode == 1:
-            # We skip the three bytes representing the length of message. It can be used to skip unwanted messages
-            reader.read(3)
+            if self.message_has_size(message_id):
+                # Three bytes (little endian) representing the length of message
+                size = int.from_bytes(reader.read(3), "little")
+                if wanted is not None and message_id not in wanted:
+                    reader.seek(size, io.SEEK_CUR)
+                    return None
             return self.read_head_message(reader, message_id)
         elif mode == 0:
             # Old format with no bytes for message length
@@ -74,784 +94,2406 @@ class MessageCodec(Codec):
         else:
             raise IOError()
 
-    def read_head_message(self, reader: io.BytesIO, message_id) -> Message:
+    def decode_buffer(self, b: bytes, wanted: Optional[Set[int]] = None) -> List[Message]:
+        """
+        Same as decode_detailed, but walks the batch with an integer cursor over a memoryview
+        instead of reading it byte by byte through io.BytesIO
+        """
+        buf = memoryview(b)
+        messages_list = list()
+        message, pos = self.handler_from(buf, 0, 0)
+        messages_list.append(message)
+        if isinstance(message, BatchMeta):
+            # Old BatchMeta
+            mode = 0
+        elif isinstance(message, BatchMetadata):
+            # New BatchMeta
+            mode = 1
+        else:
+            return messages_list
+        while True:
+            try:
+                message, pos = self.handler_from(buf, pos, mode, wanted)
+            except IndexError:
+                break
+            if message is not None or wanted is None:
+                messages_list.append(message)
+        return messages_list
 
-        if message_id == 0:
-            return Timestamp(
-                timestamp=self.read_uint(reader)
-            )
-
-        if message_id == 1:
-            return SessionStart(
-                timestamp=self.read_uint(reader),
-                project_id=self.read_uint(reader),
-                tracker_version=self.read_string(reader),
-                rev_id=self.read_string(reader),
-                user_uuid=self.read_string(reader),
-                user_agent=self.read_string(reader),
-                user_os=self.read_string(reader),
-                user_os_version=self.read_string(reader),
-                user_browser=self.read_string(reader),
-                user_browser_version=self.read_string(reader),
-                user_device=self.read_string(reader),
-                user_device_type=self.read_string(reader),
-                user_device_memory_size=self.read_uint(reader),
-                user_device_heap_size=self.read_uint(reader),
-                user_country=self.read_string(reader),
-                user_id=self.read_string(reader)
-            )
-
-        if message_id == 3:
-            return SessionEndDeprecated(
-                timestamp=self.read_uint(reader)
-            )
-
-        if message_id == 4:
-            return SetPageLocation(
-                url=self.read_string(reader),
-                referrer=self.read_string(reader),
-                navigation_start=self.read_uint(reader)
-            )
-
-        if message_id == 5:
-            return SetViewportSize(
-                width=self.read_uint(reader),
-                height=self.read_uint(reader)
-            )
-
-        if message_id == 6:
-            return SetViewportScroll(
-                x=self.read_int(reader),
-                y=self.read_int(reader)
-            )
-
-        if message_id == 7:
-            return CreateDocument(
-                
-            )
-
-        if message_id == 8:
-            return CreateElementNode(
-                id=self.read_uint(reader),
-                parent_id=self.read_uint(reader),
-                index=self.read_uint(reader),
-                tag=self.read_string(reader),
-                svg=self.read_boolean(reader)
-            )
-
-        if message_id == 9:
-            return CreateTextNode(
-                id=self.read_uint(reader),
-                parent_id=self.read_uint(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 10:
-            return MoveNode(
-                id=self.read_uint(reader),
-                parent_id=self.read_uint(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 11:
-            return RemoveNode(
-                id=self.read_uint(reader)
-            )
-
-        if message_id == 12:
-            return SetNodeAttribute(
-                id=self.read_uint(reader),
-                name=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 13:
-            return RemoveNodeAttribute(
-                id=self.read_uint(reader),
-                name=self.read_string(reader)
-            )
-
-        if message_id == 14:
-            return SetNodeData(
-                id=self.read_uint(reader),
-                data=self.read_string(reader)
-            )
-
-        if message_id == 15:
-            return SetCSSData(
-                id=self.read_uint(reader),
-                data=self.read_string(reader)
-            )
-
-        if message_id == 16:
-            return SetNodeScroll(
-                id=self.read_uint(reader),
-                x=self.read_int(reader),
-                y=self.read_int(reader)
-            )
-
-        if message_id == 17:
-            return SetInputTarget(
-                id=self.read_uint(reader),
-                label=self.read_string(reader)
-            )
-
-        if message_id == 18:
-            return SetInputValue(
-                id=self.read_uint(reader),
-                value=self.read_string(reader),
-                mask=self.read_int(reader)
-            )
-
-        if message_id == 19:
-            return SetInputChecked(
-                id=self.read_uint(reader),
-                checked=self.read_boolean(reader)
-            )
-
-        if message_id == 20:
-            return MouseMove(
-                x=self.read_uint(reader),
-                y=self.read_uint(reader)
-            )
-
-        if message_id == 21:
-            return NetworkRequest(
-                type=self.read_string(reader),
-                method=self.read_string(reader),
-                url=self.read_string(reader),
-                request=self.read_string(reader),
-                response=self.read_string(reader),
-                status=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                duration=self.read_uint(reader)
-            )
-
-        if message_id == 22:
-            return ConsoleLog(
-                level=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 23:
-            return PageLoadTiming(
-                request_start=self.read_uint(reader),
-                response_start=self.read_uint(reader),
-                response_end=self.read_uint(reader),
-                dom_content_loaded_event_start=self.read_uint(reader),
-                dom_content_loaded_event_end=self.read_uint(reader),
-                load_event_start=self.read_uint(reader),
-                load_event_end=self.read_uint(reader),
-                first_paint=self.read_uint(reader),
-                first_contentful_paint=self.read_uint(reader)
-            )
-
-        if message_id == 24:
-            return PageRenderTiming(
-                speed_index=self.read_uint(reader),
-                visually_complete=self.read_uint(reader),
-                time_to_interactive=self.read_uint(reader)
-            )
-
-        if message_id == 25:
-            return JSExceptionDeprecated(
-                name=self.read_string(reader),
-                message=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 26:
-            return IntegrationEvent(
-                timestamp=self.read_uint(reader),
-                source=self.read_string(reader),
-                name=self.read_string(reader),
-                message=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 27:
-            return CustomEvent(
-                name=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 28:
-            return UserID(
-                id=self.read_string(reader)
-            )
-
-        if message_id == 29:
-            return UserAnonymousID(
-                id=self.read_string(reader)
-            )
-
-        if message_id == 30:
-            return Metadata(
-                key=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 31:
-            return PageEvent(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                url=self.read_string(reader),
-                referrer=self.read_string(reader),
-                loaded=self.read_boolean(reader),
-                request_start=self.read_uint(reader),
-                response_start=self.read_uint(reader),
-                response_end=self.read_uint(reader),
-                dom_content_loaded_event_start=self.read_uint(reader),
-                dom_content_loaded_event_end=self.read_uint(reader),
-                load_event_start=self.read_uint(reader),
-                load_event_end=self.read_uint(reader),
-                first_paint=self.read_uint(reader),
-                first_contentful_paint=self.read_uint(reader),
-                speed_index=self.read_uint(reader),
-                visually_complete=self.read_uint(reader),
-                time_to_interactive=self.read_uint(reader)
-            )
-
-        if message_id == 32:
-            return InputEvent(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                value=self.read_string(reader),
-                value_masked=self.read_boolean(reader),
-                label=self.read_string(reader)
-            )
-
-        if message_id == 33:
-            return ClickEvent(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                hesitation_time=self.read_uint(reader),
-                label=self.read_string(reader),
-                selector=self.read_string(reader)
-            )
-
-        if message_id == 35:
-            return ResourceEvent(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                duration=self.read_uint(reader),
-                ttfb=self.read_uint(reader),
-                header_size=self.read_uint(reader),
-                encoded_body_size=self.read_uint(reader),
-                decoded_body_size=self.read_uint(reader),
-                url=self.read_string(reader),
-                type=self.read_string(reader),
-                success=self.read_boolean(reader),
-                method=self.read_string(reader),
-                status=self.read_uint(reader)
-            )
-
-        if message_id == 37:
-            return CSSInsertRule(
-                id=self.read_uint(reader),
-                rule=self.read_string(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 38:
-            return CSSDeleteRule(
-                id=self.read_uint(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 39:
-            return Fetch(
-                method=self.read_string(reader),
-                url=self.read_string(reader),
-                request=self.read_string(reader),
-                response=self.read_string(reader),
-                status=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                duration=self.read_uint(reader)
-            )
-
-        if message_id == 40:
-            return Profiler(
-                name=self.read_string(reader),
-                duration=self.read_uint(reader),
-                args=self.read_string(reader),
-                result=self.read_string(reader)
-            )
-
-        if message_id == 41:
-            return OTable(
-                key=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 42:
-            return StateAction(
-                type=self.read_string(reader)
-            )
-
-        if message_id == 44:
-            return Redux(
-                action=self.read_string(reader),
-                state=self.read_string(reader),
-                duration=self.read_uint(reader)
-            )
-
-        if message_id == 45:
-            return Vuex(
-                mutation=self.read_string(reader),
-                state=self.read_string(reader)
-            )
-
-        if message_id == 46:
-            return MobX(
-                type=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 47:
-            return NgRx(
-                action=self.read_string(reader),
-                state=self.read_string(reader),
-                duration=self.read_uint(reader)
-            )
-
-        if message_id == 48:
-            return GraphQL(
-                operation_kind=self.read_string(reader),
-                operation_name=self.read_string(reader),
-                variables=self.read_string(reader),
-                response=self.read_string(reader)
-            )
-
-        if message_id == 49:
-            return PerformanceTrack(
-                frames=self.read_int(reader),
-                ticks=self.read_int(reader),
-                total_js_heap_size=self.read_uint(reader),
-                used_js_heap_size=self.read_uint(reader)
-            )
-
-        if message_id == 50:
-            return StringDict(
-                key=self.read_uint(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 51:
-            return SetNodeAttributeDict(
-                id=self.read_uint(reader),
-                name_key=self.read_uint(reader),
-                value_key=self.read_uint(reader)
-            )
-
-        if message_id == 52:
-            return DOMDrop(
-                timestamp=self.read_uint(reader)
-            )
-
-        if message_id == 53:
-            return ResourceTiming(
-                timestamp=self.read_uint(reader),
-                duration=self.read_uint(reader),
-                ttfb=self.read_uint(reader),
-                header_size=self.read_uint(reader),
-                encoded_body_size=self.read_uint(reader),
-                decoded_body_size=self.read_uint(reader),
-                url=self.read_string(reader),
-                initiator=self.read_string(reader)
-            )
-
-        if message_id == 54:
-            return ConnectionInformation(
-                downlink=self.read_uint(reader),
-                type=self.read_string(reader)
-            )
-
-        if message_id == 55:
-            return SetPageVisibility(
-                hidden=self.read_boolean(reader)
-            )
-
-        if message_id == 56:
-            return PerformanceTrackAggr(
-                timestamp_start=self.read_uint(reader),
-                timestamp_end=self.read_uint(reader),
-                min_fps=self.read_uint(reader),
-                avg_fps=self.read_uint(reader),
-                max_fps=self.read_uint(reader),
-                min_cpu=self.read_uint(reader),
-                avg_cpu=self.read_uint(reader),
-                max_cpu=self.read_uint(reader),
-                min_total_js_heap_size=self.read_uint(reader),
-                avg_total_js_heap_size=self.read_uint(reader),
-                max_total_js_heap_size=self.read_uint(reader),
-                min_used_js_heap_size=self.read_uint(reader),
-                avg_used_js_heap_size=self.read_uint(reader),
-                max_used_js_heap_size=self.read_uint(reader)
-            )
-
-        if message_id == 57:
-            return LoadFontFace(
-                parent_id=self.read_uint(reader),
-                family=self.read_string(reader),
-                source=self.read_string(reader),
-                descriptors=self.read_string(reader)
-            )
-
-        if message_id == 58:
-            return SetNodeFocus(
-                id=self.read_int(reader)
-            )
-
-        if message_id == 59:
-            return LongTask(
-                timestamp=self.read_uint(reader),
-                duration=self.read_uint(reader),
-                context=self.read_uint(reader),
-                container_type=self.read_uint(reader),
-                container_src=self.read_string(reader),
-                container_id=self.read_string(reader),
-                container_name=self.read_string(reader)
-            )
-
-        if message_id == 60:
-            return SetNodeAttributeURLBased(
-                id=self.read_uint(reader),
-                name=self.read_string(reader),
-                value=self.read_string(reader),
-                base_url=self.read_string(reader)
-            )
-
-        if message_id == 61:
-            return SetCSSDataURLBased(
-                id=self.read_uint(reader),
-                data=self.read_string(reader),
-                base_url=self.read_string(reader)
-            )
-
-        if message_id == 62:
-            return IssueEventDeprecated(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                type=self.read_string(reader),
-                context_string=self.read_string(reader),
-                context=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 63:
-            return TechnicalInfo(
-                type=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 64:
-            return CustomIssue(
-                name=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 66:
-            return AssetCache(
-                url=self.read_string(reader)
-            )
-
-        if message_id == 67:
-            return CSSInsertRuleURLBased(
-                id=self.read_uint(reader),
-                rule=self.read_string(reader),
-                index=self.read_uint(reader),
-                base_url=self.read_string(reader)
-            )
-
-        if message_id == 69:
-            return MouseClick(
-                id=self.read_uint(reader),
-                hesitation_time=self.read_uint(reader),
-                label=self.read_string(reader),
-                selector=self.read_string(reader)
-            )
-
-        if message_id == 70:
-            return CreateIFrameDocument(
-                frame_id=self.read_uint(reader),
-                id=self.read_uint(reader)
-            )
-
-        if message_id == 71:
-            return AdoptedSSReplaceURLBased(
-                sheet_id=self.read_uint(reader),
-                text=self.read_string(reader),
-                base_url=self.read_string(reader)
-            )
-
-        if message_id == 72:
-            return AdoptedSSReplace(
-                sheet_id=self.read_uint(reader),
-                text=self.read_string(reader)
-            )
-
-        if message_id == 73:
-            return AdoptedSSInsertRuleURLBased(
-                sheet_id=self.read_uint(reader),
-                rule=self.read_string(reader),
-                index=self.read_uint(reader),
-                base_url=self.read_string(reader)
-            )
-
-        if message_id == 74:
-            return AdoptedSSInsertRule(
-                sheet_id=self.read_uint(reader),
-                rule=self.read_string(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 75:
-            return AdoptedSSDeleteRule(
-                sheet_id=self.read_uint(reader),
-                index=self.read_uint(reader)
-            )
-
-        if message_id == 76:
-            return AdoptedSSAddOwner(
-                sheet_id=self.read_uint(reader),
-                id=self.read_uint(reader)
-            )
-
-        if message_id == 77:
-            return AdoptedSSRemoveOwner(
-                sheet_id=self.read_uint(reader),
-                id=self.read_uint(reader)
-            )
-
-        if message_id == 78:
-            return JSException(
-                name=self.read_string(reader),
-                message=self.read_string(reader),
-                payload=self.read_string(reader),
-                metadata=self.read_string(reader)
-            )
-
-        if message_id == 79:
-            return Zustand(
-                mutation=self.read_string(reader),
-                state=self.read_string(reader)
-            )
-
-        if message_id == 80:
-            return BatchMeta(
-                page_no=self.read_uint(reader),
-                first_index=self.read_uint(reader),
-                timestamp=self.read_int(reader)
-            )
-
-        if message_id == 81:
-            return BatchMetadata(
-                version=self.read_uint(reader),
-                page_no=self.read_uint(reader),
-                first_index=self.read_uint(reader),
-                timestamp=self.read_int(reader),
-                location=self.read_string(reader)
-            )
-
-        if message_id == 82:
-            return PartitionedMessage(
-                part_no=self.read_uint(reader),
-                part_total=self.read_uint(reader)
-            )
-
-        if message_id == 125:
-            return IssueEvent(
-                message_id=self.read_uint(reader),
-                timestamp=self.read_uint(reader),
-                type=self.read_string(reader),
-                context_string=self.read_string(reader),
-                context=self.read_string(reader),
-                payload=self.read_string(reader),
-                url=self.read_string(reader)
-            )
-
-        if message_id == 126:
-            return SessionEnd(
-                timestamp=self.read_uint(reader),
-                encryption_key=self.read_string(reader)
-            )
-
-        if message_id == 127:
-            return SessionSearch(
-                timestamp=self.read_uint(reader),
-                partition=self.read_uint(reader)
-            )
-
-        if message_id == 107:
-            return IOSBatchMeta(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                first_index=self.read_uint(reader)
-            )
-
-        if message_id == 90:
-            return IOSSessionStart(
-                timestamp=self.read_uint(reader),
-                project_id=self.read_uint(reader),
-                tracker_version=self.read_string(reader),
-                rev_id=self.read_string(reader),
-                user_uuid=self.read_string(reader),
-                user_os=self.read_string(reader),
-                user_os_version=self.read_string(reader),
-                user_device=self.read_string(reader),
-                user_device_type=self.read_string(reader),
-                user_country=self.read_string(reader)
-            )
-
-        if message_id == 91:
-            return IOSSessionEnd(
-                timestamp=self.read_uint(reader)
-            )
-
-        if message_id == 92:
-            return IOSMetadata(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                key=self.read_string(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 93:
-            return IOSCustomEvent(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                name=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
-
-        if message_id == 94:
-            return IOSUserID(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 95:
-            return IOSUserAnonymousID(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                value=self.read_string(reader)
-            )
-
-        if message_id == 96:
-            return IOSScreenChanges(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                x=self.read_uint(reader),
-                y=self.read_uint(reader),
-                width=self.read_uint(reader),
-                height=self.read_uint(reader)
-            )
-
-        if message_id == 97:
-            return IOSCrash(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                name=self.read_string(reader),
-                reason=self.read_string(reader),
-                stacktrace=self.read_string(reader)
-            )
-
-        if message_id == 98:
-            return IOSScreenEnter(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                title=self.read_string(reader),
-                view_name=self.read_string(reader)
-            )
-
-        if message_id == 99:
-            return IOSScreenLeave(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                title=self.read_string(reader),
-                view_name=self.read_string(reader)
-            )
-
-        if message_id == 100:
-            return IOSClickEvent(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                label=self.read_string(reader),
-                x=self.read_uint(reader),
-                y=self.read_uint(reader)
-            )
-
-        if message_id == 101:
-            return IOSInputEvent(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                value=self.read_string(reader),
-                value_masked=self.read_boolean(reader),
-                label=self.read_string(reader)
-            )
-
-        if message_id == 102:
-            return IOSPerformanceEvent(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                name=self.read_string(reader),
-                value=self.read_uint(reader)
-            )
-
-        if message_id == 103:
-            return IOSLog(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                severity=self.read_string(reader),
-                content=self.read_string(reader)
-            )
-
-        if message_id == 104:
-            return IOSInternalError(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                content=self.read_string(reader)
-            )
-
-        if message_id == 105:
-            return IOSNetworkCall(
-                timestamp=self.read_uint(reader),
-                length=self.read_uint(reader),
-                duration=self.read_uint(reader),
-                headers=self.read_string(reader),
-                body=self.read_string(reader),
-                url=self.read_string(reader),
-                success=self.read_boolean(reader),
-                method=self.read_string(reader),
-                status=self.read_uint(reader)
-            )
-
-        if message_id == 110:
-            return IOSPerformanceAggregated(
-                timestamp_start=self.read_uint(reader),
-                timestamp_end=self.read_uint(reader),
-                min_fps=self.read_uint(reader),
-                avg_fps=self.read_uint(reader),
-                max_fps=self.read_uint(reader),
-                min_cpu=self.read_uint(reader),
-                avg_cpu=self.read_uint(reader),
-                max_cpu=self.read_uint(reader),
-                min_memory=self.read_uint(reader),
-                avg_memory=self.read_uint(reader),
-                max_memory=self.read_uint(reader),
-                min_battery=self.read_uint(reader),
-                avg_battery=self.read_uint(reader),
-                max_battery=self.read_uint(reader)
-            )
-
-        if message_id == 111:
-            return IOSIssueEvent(
-                timestamp=self.read_uint(reader),
-                type=self.read_string(reader),
-                context_string=self.read_string(reader),
-                context=self.read_string(reader),
-                payload=self.read_string(reader)
-            )
+    def handler_from(self, buf: memoryview, pos: int, mode=0,
+                     wanted: Optional[Set[int]] = None) -> Tuple[Optional[Message], int]:
+        message_id, pos = read_uint_from(buf, pos)
+        if mode == 1:
+            if message_id not in MESSAGES_WITHOUT_SIZE:
+                if wanted is not None and message_id not in wanted:
+                    size = buf[pos] | buf[pos + 1] << 8 | buf[pos + 2] << 16
+                    return None, pos + 3 + size
+                pos += 3
+        elif mode != 0:
+            raise IOError()
+        decode = DECODERS_FROM.get(message_id)
+        if decode is None:
+            return None, pos
+        return decode(buf, pos)
 
+    def read_head_message(self, reader: io.BytesIO, message_id) -> Message:
+        decode = DECODERS.get(message_id)
+        if decode is None:
+            return None
+        return decode(reader)
+
+    def read_head_message_from(self, buf: memoryview, pos: int, message_id: int) -> Tuple[Message, int]:
+        decode = DECODERS_FROM.get(message_id)
+        if decode is None:
+            return None, pos
+        return decode(buf, pos)
+
+
+read_boolean, read_uint, read_int, read_string = \
+    Codec.read_boolean, Codec.read_uint, Codec.read_int, Codec.read_string
+read_boolean_from, read_uint_from, read_int_from, read_string_from = \
+    Codec.read_boolean_from, Codec.read_uint_from, Codec.read_int_from, Codec.read_string_from
+
+
+def decode_timestamp(reader: io.BytesIO) -> Timestamp:
+    return Timestamp(
+        timestamp=read_uint(reader)
+    )
+
+
+def decode_timestamp_from(buf: memoryview, pos: int) -> Tuple[Timestamp, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    return Timestamp(
+        timestamp=timestamp
+    ), pos
+
+
+def decode_session_start(reader: io.BytesIO) -> SessionStart:
+    return SessionStart(
+        timestamp=read_uint(reader),
+        project_id=read_uint(reader),
+        tracker_version=read_string(reader),
+        rev_id=read_string(reader),
+        user_uuid=read_string(reader),
+        user_agent=read_string(reader),
+        user_os=read_string(reader),
+        user_os_version=read_string(reader),
+        user_browser=read_string(reader),
+        user_browser_version=read_string(reader),
+        user_device=read_string(reader),
+        user_device_type=read_string(reader),
+        user_device_memory_size=read_uint(reader),
+        user_device_heap_size=read_uint(reader),
+        user_country=read_string(reader),
+        user_id=read_string(reader)
+    )
+
+
+def decode_session_start_from(buf: memoryview, pos: int) -> Tuple[SessionStart, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    project_id, pos = read_uint_from(buf, pos)
+    tracker_version, pos = read_string_from(buf, pos)
+    rev_id, pos = read_string_from(buf, pos)
+    user_uuid, pos = read_string_from(buf, pos)
+    user_agent, pos = read_string_from(buf, pos)
+    user_os, pos = read_string_from(buf, pos)
+    user_os_version, pos = read_string_from(buf, pos)
+    user_browser, pos = read_string_from(buf, pos)
+    user_browser_version, pos = read_string_from(buf, pos)
+    user_device, pos = read_string_from(buf, pos)
+    user_device_type, pos = read_string_from(buf, pos)
+    user_device_memory_size, pos = read_uint_from(buf, pos)
+    user_device_heap_size, pos = read_uint_from(buf, pos)
+    user_country, pos = read_string_from(buf, pos)
+    user_id, pos = read_string_from(buf, pos)
+    return SessionStart(
+        timestamp=timestamp,
+        project_id=project_id,
+        tracker_version=tracker_version,
+        rev_id=rev_id,
+        user_uuid=user_uuid,
+        user_agent=user_agent,
+        user_os=user_os,
+        user_os_version=user_os_version,
+        user_browser=user_browser,
+        user_browser_version=user_browser_version,
+        user_device=user_device,
+        user_device_type=user_device_type,
+        user_device_memory_size=user_device_memory_size,
+        user_device_heap_size=user_device_heap_size,
+        user_country=user_country,
+        user_id=user_id
+    ), pos
+
+
+def decode_session_end_deprecated(reader: io.BytesIO) -> SessionEndDeprecated:
+    return SessionEndDeprecated(
+        timestamp=read_uint(reader)
+    )
+
+
+def decode_session_end_deprecated_from(buf: memoryview, pos: int) -> Tuple[SessionEndDeprecated, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    return SessionEndDeprecated(
+        timestamp=timestamp
+    ), pos
+
+
+def decode_set_page_location(reader: io.BytesIO) -> SetPageLocation:
+    return SetPageLocation(
+        url=read_string(reader),
+        referrer=read_string(reader),
+        navigation_start=read_uint(reader)
+    )
+
+
+def decode_set_page_location_from(buf: memoryview, pos: int) -> Tuple[SetPageLocation, int]:
+    url, pos = read_string_from(buf, pos)
+    referrer, pos = read_string_from(buf, pos)
+    navigation_start, pos = read_uint_from(buf, pos)
+    return SetPageLocation(
+        url=url,
+        referrer=referrer,
+        navigation_start=navigation_start
+    ), pos
+
+
+def decode_set_viewport_size(reader: io.BytesIO) -> SetViewportSize:
+    return SetViewportSize(
+        width=read_uint(reader),
+        height=read_uint(reader)
+    )
+
+
+def decode_set_viewport_size_from(buf: memoryview, pos: int) -> Tuple[SetViewportSize, int]:
+    width, pos = read_uint_from(buf, pos)
+    height, pos = read_uint_from(buf, pos)
+    return SetViewportSize(
+        width=width,
+        height=height
+    ), pos
+
+
+def decode_set_viewport_scroll(reader: io.BytesIO) -> SetViewportScroll:
+    return SetViewportScroll(
+        x=read_int(reader),
+        y=read_int(reader)
+    )
+
+
+def decode_set_viewport_scroll_from(buf: memoryview, pos: int) -> Tuple[SetViewportScroll, int]:
+    x, pos = read_int_from(buf, pos)
+    y, pos = read_int_from(buf, pos)
+    return SetViewportScroll(
+        x=x,
+        y=y
+    ), pos
+
+
+def decode_create_document(reader: io.BytesIO) -> CreateDocument:
+    return CreateDocument(
+        
+    )
+
+
+def decode_create_document_from(buf: memoryview, pos: int) -> Tuple[CreateDocument, int]:
+    return CreateDocument(
+        
+    ), pos
+
+
+def decode_create_element_node(reader: io.BytesIO) -> CreateElementNode:
+    return CreateElementNode(
+        id=read_uint(reader),
+        parent_id=read_uint(reader),
+        index=read_uint(reader),
+        tag=read_string(reader),
+        svg=read_boolean(reader)
+    )
+
+
+def decode_create_element_node_from(buf: memoryview, pos: int) -> Tuple[CreateElementNode, int]:
+    id, pos = read_uint_from(buf, pos)
+    parent_id, pos = read_uint_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    tag, pos = read_string_from(buf, pos)
+    svg, pos = read_boolean_from(buf, pos)
+    return CreateElementNode(
+        id=id,
+        parent_id=parent_id,
+        index=index,
+        tag=tag,
+        svg=svg
+    ), pos
+
+
+def decode_create_text_node(reader: io.BytesIO) -> CreateTextNode:
+    return CreateTextNode(
+        id=read_uint(reader),
+        parent_id=read_uint(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_create_text_node_from(buf: memoryview, pos: int) -> Tuple[CreateTextNode, int]:
+    id, pos = read_uint_from(buf, pos)
+    parent_id, pos = read_uint_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return CreateTextNode(
+        id=id,
+        parent_id=parent_id,
+        index=index
+    ), pos
+
+
+def decode_move_node(reader: io.BytesIO) -> MoveNode:
+    return MoveNode(
+        id=read_uint(reader),
+        parent_id=read_uint(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_move_node_from(buf: memoryview, pos: int) -> Tuple[MoveNode, int]:
+    id, pos = read_uint_from(buf, pos)
+    parent_id, pos = read_uint_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return MoveNode(
+        id=id,
+        parent_id=parent_id,
+        index=index
+    ), pos
+
+
+def decode_remove_node(reader: io.BytesIO) -> RemoveNode:
+    return RemoveNode(
+        id=read_uint(reader)
+    )
+
+
+def decode_remove_node_from(buf: memoryview, pos: int) -> Tuple[RemoveNode, int]:
+    id, pos = read_uint_from(buf, pos)
+    return RemoveNode(
+        id=id
+    ), pos
+
+
+def decode_set_node_attribute(reader: io.BytesIO) -> SetNodeAttribute:
+    return SetNodeAttribute(
+        id=read_uint(reader),
+        name=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_set_node_attribute_from(buf: memoryview, pos: int) -> Tuple[SetNodeAttribute, int]:
+    id, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return SetNodeAttribute(
+        id=id,
+        name=name,
+        value=value
+    ), pos
+
+
+def decode_remove_node_attribute(reader: io.BytesIO) -> RemoveNodeAttribute:
+    return RemoveNodeAttribute(
+        id=read_uint(reader),
+        name=read_string(reader)
+    )
+
+
+def decode_remove_node_attribute_from(buf: memoryview, pos: int) -> Tuple[RemoveNodeAttribute, int]:
+    id, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    return RemoveNodeAttribute(
+        id=id,
+        name=name
+    ), pos
+
+
+def decode_set_node_data(reader: io.BytesIO) -> SetNodeData:
+    return SetNodeData(
+        id=read_uint(reader),
+        data=read_string(reader)
+    )
+
+
+def decode_set_node_data_from(buf: memoryview, pos: int) -> Tuple[SetNodeData, int]:
+    id, pos = read_uint_from(buf, pos)
+    data, pos = read_string_from(buf, pos)
+    return SetNodeData(
+        id=id,
+        data=data
+    ), pos
+
+
+def decode_set_css_data(reader: io.BytesIO) -> SetCSSData:
+    return SetCSSData(
+        id=read_uint(reader),
+        data=read_string(reader)
+    )
+
+
+def decode_set_css_data_from(buf: memoryview, pos: int) -> Tuple[SetCSSData, int]:
+    id, pos = read_uint_from(buf, pos)
+    data, pos = read_string_from(buf, pos)
+    return SetCSSData(
+        id=id,
+        data=data
+    ), pos
+
+
+def decode_set_node_scroll(reader: io.BytesIO) -> SetNodeScroll:
+    return SetNodeScroll(
+        id=read_uint(reader),
+        x=read_int(reader),
+        y=read_int(reader)
+    )
+
+
+def decode_set_node_scroll_from(buf: memoryview, pos: int) -> Tuple[SetNodeScroll, int]:
+    id, pos = read_uint_from(buf, pos)
+    x, pos = read_int_from(buf, pos)
+    y, pos = read_int_from(buf, pos)
+    return SetNodeScroll(
+        id=id,
+        x=x,
+        y=y
+    ), pos
+
+
+def decode_set_input_target(reader: io.BytesIO) -> SetInputTarget:
+    return SetInputTarget(
+        id=read_uint(reader),
+        label=read_string(reader)
+    )
+
+
+def decode_set_input_target_from(buf: memoryview, pos: int) -> Tuple[SetInputTarget, int]:
+    id, pos = read_uint_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    return SetInputTarget(
+        id=id,
+        label=label
+    ), pos
+
+
+def decode_set_input_value(reader: io.BytesIO) -> SetInputValue:
+    return SetInputValue(
+        id=read_uint(reader),
+        value=read_string(reader),
+        mask=read_int(reader)
+    )
+
+
+def decode_set_input_value_from(buf: memoryview, pos: int) -> Tuple[SetInputValue, int]:
+    id, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    mask, pos = read_int_from(buf, pos)
+    return SetInputValue(
+        id=id,
+        value=value,
+        mask=mask
+    ), pos
+
+
+def decode_set_input_checked(reader: io.BytesIO) -> SetInputChecked:
+    return SetInputChecked(
+        id=read_uint(reader),
+        checked=read_boolean(reader)
+    )
+
+
+def decode_set_input_checked_from(buf: memoryview, pos: int) -> Tuple[SetInputChecked, int]:
+    id, pos = read_uint_from(buf, pos)
+    checked, pos = read_boolean_from(buf, pos)
+    return SetInputChecked(
+        id=id,
+        checked=checked
+    ), pos
+
+
+def decode_mouse_move(reader: io.BytesIO) -> MouseMove:
+    return MouseMove(
+        x=read_uint(reader),
+        y=read_uint(reader)
+    )
+
+
+def decode_mouse_move_from(buf: memoryview, pos: int) -> Tuple[MouseMove, int]:
+    x, pos = read_uint_from(buf, pos)
+    y, pos = read_uint_from(buf, pos)
+    return MouseMove(
+        x=x,
+        y=y
+    ), pos
+
+
+def decode_network_request(reader: io.BytesIO) -> NetworkRequest:
+    return NetworkRequest(
+        type=read_string(reader),
+        method=read_string(reader),
+        url=read_string(reader),
+        request=read_string(reader),
+        response=read_string(reader),
+        status=read_uint(reader),
+        timestamp=read_uint(reader),
+        duration=read_uint(reader)
+    )
+
+
+def decode_network_request_from(buf: memoryview, pos: int) -> Tuple[NetworkRequest, int]:
+    type, pos = read_string_from(buf, pos)
+    method, pos = read_string_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    request, pos = read_string_from(buf, pos)
+    response, pos = read_string_from(buf, pos)
+    status, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    return NetworkRequest(
+        type=type,
+        method=method,
+        url=url,
+        request=request,
+        response=response,
+        status=status,
+        timestamp=timestamp,
+        duration=duration
+    ), pos
+
+
+def decode_console_log(reader: io.BytesIO) -> ConsoleLog:
+    return ConsoleLog(
+        level=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_console_log_from(buf: memoryview, pos: int) -> Tuple[ConsoleLog, int]:
+    level, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return ConsoleLog(
+        level=level,
+        value=value
+    ), pos
+
+
+def decode_page_load_timing(reader: io.BytesIO) -> PageLoadTiming:
+    return PageLoadTiming(
+        request_start=read_uint(reader),
+        response_start=read_uint(reader),
+        response_end=read_uint(reader),
+        dom_content_loaded_event_start=read_uint(reader),
+        dom_content_loaded_event_end=read_uint(reader),
+        load_event_start=read_uint(reader),
+        load_event_end=read_uint(reader),
+        first_paint=read_uint(reader),
+        first_contentful_paint=read_uint(reader)
+    )
+
+
+def decode_page_load_timing_from(buf: memoryview, pos: int) -> Tuple[PageLoadTiming, int]:
+    request_start, pos = read_uint_from(buf, pos)
+    response_start, pos = read_uint_from(buf, pos)
+    response_end, pos = read_uint_from(buf, pos)
+    dom_content_loaded_event_start, pos = read_uint_from(buf, pos)
+    dom_content_loaded_event_end, pos = read_uint_from(buf, pos)
+    load_event_start, pos = read_uint_from(buf, pos)
+    load_event_end, pos = read_uint_from(buf, pos)
+    first_paint, pos = read_uint_from(buf, pos)
+    first_contentful_paint, pos = read_uint_from(buf, pos)
+    return PageLoadTiming(
+        request_start=request_start,
+        response_start=response_start,
+        response_end=response_end,
+        dom_content_loaded_event_start=dom_content_loaded_event_start,
+        dom_content_loaded_event_end=dom_content_loaded_event_end,
+        load_event_start=load_event_start,
+        load_event_end=load_event_end,
+        first_paint=first_paint,
+        first_contentful_paint=first_contentful_paint
+    ), pos
+
+
+def decode_page_render_timing(reader: io.BytesIO) -> PageRenderTiming:
+    return PageRenderTiming(
+        speed_index=read_uint(reader),
+        visually_complete=read_uint(reader),
+        time_to_interactive=read_uint(reader)
+    )
+
+
+def decode_page_render_timing_from(buf: memoryview, pos: int) -> Tuple[PageRenderTiming, int]:
+    speed_index, pos = read_uint_from(buf, pos)
+    visually_complete, pos = read_uint_from(buf, pos)
+    time_to_interactive, pos = read_uint_from(buf, pos)
+    return PageRenderTiming(
+        speed_index=speed_index,
+        visually_complete=visually_complete,
+        time_to_interactive=time_to_interactive
+    ), pos
+
+
+def decode_js_exception_deprecated(reader: io.BytesIO) -> JSExceptionDeprecated:
+    return JSExceptionDeprecated(
+        name=read_string(reader),
+        message=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_js_exception_deprecated_from(buf: memoryview, pos: int) -> Tuple[JSExceptionDeprecated, int]:
+    name, pos = read_string_from(buf, pos)
+    message, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return JSExceptionDeprecated(
+        name=name,
+        message=message,
+        payload=payload
+    ), pos
+
+
+def decode_integration_event(reader: io.BytesIO) -> IntegrationEvent:
+    return IntegrationEvent(
+        timestamp=read_uint(reader),
+        source=read_string(reader),
+        name=read_string(reader),
+        message=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_integration_event_from(buf: memoryview, pos: int) -> Tuple[IntegrationEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    source, pos = read_string_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    message, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return IntegrationEvent(
+        timestamp=timestamp,
+        source=source,
+        name=name,
+        message=message,
+        payload=payload
+    ), pos
+
+
+def decode_custom_event(reader: io.BytesIO) -> CustomEvent:
+    return CustomEvent(
+        name=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_custom_event_from(buf: memoryview, pos: int) -> Tuple[CustomEvent, int]:
+    name, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return CustomEvent(
+        name=name,
+        payload=payload
+    ), pos
+
+
+def decode_user_id(reader: io.BytesIO) -> UserID:
+    return UserID(
+        id=read_string(reader)
+    )
+
+
+def decode_user_id_from(buf: memoryview, pos: int) -> Tuple[UserID, int]:
+    id, pos = read_string_from(buf, pos)
+    return UserID(
+        id=id
+    ), pos
+
+
+def decode_user_anonymous_id(reader: io.BytesIO) -> UserAnonymousID:
+    return UserAnonymousID(
+        id=read_string(reader)
+    )
+
+
+def decode_user_anonymous_id_from(buf: memoryview, pos: int) -> Tuple[UserAnonymousID, int]:
+    id, pos = read_string_from(buf, pos)
+    return UserAnonymousID(
+        id=id
+    ), pos
+
+
+def decode_metadata(reader: io.BytesIO) -> Metadata:
+    return Metadata(
+        key=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_metadata_from(buf: memoryview, pos: int) -> Tuple[Metadata, int]:
+    key, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return Metadata(
+        key=key,
+        value=value
+    ), pos
+
+
+def decode_page_event(reader: io.BytesIO) -> PageEvent:
+    return PageEvent(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        url=read_string(reader),
+        referrer=read_string(reader),
+        loaded=read_boolean(reader),
+        request_start=read_uint(reader),
+        response_start=read_uint(reader),
+        response_end=read_uint(reader),
+        dom_content_loaded_event_start=read_uint(reader),
+        dom_content_loaded_event_end=read_uint(reader),
+        load_event_start=read_uint(reader),
+        load_event_end=read_uint(reader),
+        first_paint=read_uint(reader),
+        first_contentful_paint=read_uint(reader),
+        speed_index=read_uint(reader),
+        visually_complete=read_uint(reader),
+        time_to_interactive=read_uint(reader)
+    )
+
+
+def decode_page_event_from(buf: memoryview, pos: int) -> Tuple[PageEvent, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    referrer, pos = read_string_from(buf, pos)
+    loaded, pos = read_boolean_from(buf, pos)
+    request_start, pos = read_uint_from(buf, pos)
+    response_start, pos = read_uint_from(buf, pos)
+    response_end, pos = read_uint_from(buf, pos)
+    dom_content_loaded_event_start, pos = read_uint_from(buf, pos)
+    dom_content_loaded_event_end, pos = read_uint_from(buf, pos)
+    load_event_start, pos = read_uint_from(buf, pos)
+    load_event_end, pos = read_uint_from(buf, pos)
+    first_paint, pos = read_uint_from(buf, pos)
+    first_contentful_paint, pos = read_uint_from(buf, pos)
+    speed_index, pos = read_uint_from(buf, pos)
+    visually_complete, pos = read_uint_from(buf, pos)
+    time_to_interactive, pos = read_uint_from(buf, pos)
+    return PageEvent(
+        message_id=message_id,
+        timestamp=timestamp,
+        url=url,
+        referrer=referrer,
+        loaded=loaded,
+        request_start=request_start,
+        response_start=response_start,
+        response_end=response_end,
+        dom_content_loaded_event_start=dom_content_loaded_event_start,
+        dom_content_loaded_event_end=dom_content_loaded_event_end,
+        load_event_start=load_event_start,
+        load_event_end=load_event_end,
+        first_paint=first_paint,
+        first_contentful_paint=first_contentful_paint,
+        speed_index=speed_index,
+        visually_complete=visually_complete,
+        time_to_interactive=time_to_interactive
+    ), pos
+
+
+def decode_input_event(reader: io.BytesIO) -> InputEvent:
+    return InputEvent(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        value=read_string(reader),
+        value_masked=read_boolean(reader),
+        label=read_string(reader)
+    )
+
+
+def decode_input_event_from(buf: memoryview, pos: int) -> Tuple[InputEvent, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    value_masked, pos = read_boolean_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    return InputEvent(
+        message_id=message_id,
+        timestamp=timestamp,
+        value=value,
+        value_masked=value_masked,
+        label=label
+    ), pos
+
+
+def decode_click_event(reader: io.BytesIO) -> ClickEvent:
+    return ClickEvent(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        hesitation_time=read_uint(reader),
+        label=read_string(reader),
+        selector=read_string(reader)
+    )
+
+
+def decode_click_event_from(buf: memoryview, pos: int) -> Tuple[ClickEvent, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    hesitation_time, pos = read_uint_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    selector, pos = read_string_from(buf, pos)
+    return ClickEvent(
+        message_id=message_id,
+        timestamp=timestamp,
+        hesitation_time=hesitation_time,
+        label=label,
+        selector=selector
+    ), pos
+
+
+def decode_resource_event(reader: io.BytesIO) -> ResourceEvent:
+    return ResourceEvent(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        duration=read_uint(reader),
+        ttfb=read_uint(reader),
+        header_size=read_uint(reader),
+        encoded_body_size=read_uint(reader),
+        decoded_body_size=read_uint(reader),
+        url=read_string(reader),
+        type=read_string(reader),
+        success=read_boolean(reader),
+        method=read_string(reader),
+        status=read_uint(reader)
+    )
+
+
+def decode_resource_event_from(buf: memoryview, pos: int) -> Tuple[ResourceEvent, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    ttfb, pos = read_uint_from(buf, pos)
+    header_size, pos = read_uint_from(buf, pos)
+    encoded_body_size, pos = read_uint_from(buf, pos)
+    decoded_body_size, pos = read_uint_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    type, pos = read_string_from(buf, pos)
+    success, pos = read_boolean_from(buf, pos)
+    method, pos = read_string_from(buf, pos)
+    status, pos = read_uint_from(buf, pos)
+    return ResourceEvent(
+        message_id=message_id,
+        timestamp=timestamp,
+        duration=duration,
+        ttfb=ttfb,
+        header_size=header_size,
+        encoded_body_size=encoded_body_size,
+        decoded_body_size=decoded_body_size,
+        url=url,
+        type=type,
+        success=success,
+        method=method,
+        status=status
+    ), pos
+
+
+def decode_css_insert_rule(reader: io.BytesIO) -> CSSInsertRule:
+    return CSSInsertRule(
+        id=read_uint(reader),
+        rule=read_string(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_css_insert_rule_from(buf: memoryview, pos: int) -> Tuple[CSSInsertRule, int]:
+    id, pos = read_uint_from(buf, pos)
+    rule, pos = read_string_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return CSSInsertRule(
+        id=id,
+        rule=rule,
+        index=index
+    ), pos
+
+
+def decode_css_delete_rule(reader: io.BytesIO) -> CSSDeleteRule:
+    return CSSDeleteRule(
+        id=read_uint(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_css_delete_rule_from(buf: memoryview, pos: int) -> Tuple[CSSDeleteRule, int]:
+    id, pos = read_uint_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return CSSDeleteRule(
+        id=id,
+        index=index
+    ), pos
+
+
+def decode_fetch(reader: io.BytesIO) -> Fetch:
+    return Fetch(
+        method=read_string(reader),
+        url=read_string(reader),
+        request=read_string(reader),
+        response=read_string(reader),
+        status=read_uint(reader),
+        timestamp=read_uint(reader),
+        duration=read_uint(reader)
+    )
+
+
+def decode_fetch_from(buf: memoryview, pos: int) -> Tuple[Fetch, int]:
+    method, pos = read_string_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    request, pos = read_string_from(buf, pos)
+    response, pos = read_string_from(buf, pos)
+    status, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    return Fetch(
+        method=method,
+        url=url,
+        request=request,
+        response=response,
+        status=status,
+        timestamp=timestamp,
+        duration=duration
+    ), pos
+
+
+def decode_profiler(reader: io.BytesIO) -> Profiler:
+    return Profiler(
+        name=read_string(reader),
+        duration=read_uint(reader),
+        args=read_string(reader),
+        result=read_string(reader)
+    )
+
+
+def decode_profiler_from(buf: memoryview, pos: int) -> Tuple[Profiler, int]:
+    name, pos = read_string_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    args, pos = read_string_from(buf, pos)
+    result, pos = read_string_from(buf, pos)
+    return Profiler(
+        name=name,
+        duration=duration,
+        args=args,
+        result=result
+    ), pos
+
+
+def decode_o_table(reader: io.BytesIO) -> OTable:
+    return OTable(
+        key=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_o_table_from(buf: memoryview, pos: int) -> Tuple[OTable, int]:
+    key, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return OTable(
+        key=key,
+        value=value
+    ), pos
+
+
+def decode_state_action(reader: io.BytesIO) -> StateAction:
+    return StateAction(
+        type=read_string(reader)
+    )
+
+
+def decode_state_action_from(buf: memoryview, pos: int) -> Tuple[StateAction, int]:
+    type, pos = read_string_from(buf, pos)
+    return StateAction(
+        type=type
+    ), pos
+
+
+def decode_redux(reader: io.BytesIO) -> Redux:
+    return Redux(
+        action=read_string(reader),
+        state=read_string(reader),
+        duration=read_uint(reader)
+    )
+
+
+def decode_redux_from(buf: memoryview, pos: int) -> Tuple[Redux, int]:
+    action, pos = read_string_from(buf, pos)
+    state, pos = read_string_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    return Redux(
+        action=action,
+        state=state,
+        duration=duration
+    ), pos
+
+
+def decode_vuex(reader: io.BytesIO) -> Vuex:
+    return Vuex(
+        mutation=read_string(reader),
+        state=read_string(reader)
+    )
+
+
+def decode_vuex_from(buf: memoryview, pos: int) -> Tuple[Vuex, int]:
+    mutation, pos = read_string_from(buf, pos)
+    state, pos = read_string_from(buf, pos)
+    return Vuex(
+        mutation=mutation,
+        state=state
+    ), pos
+
+
+def decode_mob_x(reader: io.BytesIO) -> MobX:
+    return MobX(
+        type=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_mob_x_from(buf: memoryview, pos: int) -> Tuple[MobX, int]:
+    type, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return MobX(
+        type=type,
+        payload=payload
+    ), pos
+
+
+def decode_ng_rx(reader: io.BytesIO) -> NgRx:
+    return NgRx(
+        action=read_string(reader),
+        state=read_string(reader),
+        duration=read_uint(reader)
+    )
+
+
+def decode_ng_rx_from(buf: memoryview, pos: int) -> Tuple[NgRx, int]:
+    action, pos = read_string_from(buf, pos)
+    state, pos = read_string_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    return NgRx(
+        action=action,
+        state=state,
+        duration=duration
+    ), pos
+
+
+def decode_graph_ql(reader: io.BytesIO) -> GraphQL:
+    return GraphQL(
+        operation_kind=read_string(reader),
+        operation_name=read_string(reader),
+        variables=read_string(reader),
+        response=read_string(reader)
+    )
+
+
+def decode_graph_ql_from(buf: memoryview, pos: int) -> Tuple[GraphQL, int]:
+    operation_kind, pos = read_string_from(buf, pos)
+    operation_name, pos = read_string_from(buf, pos)
+    variables, pos = read_string_from(buf, pos)
+    response, pos = read_string_from(buf, pos)
+    return GraphQL(
+        operation_kind=operation_kind,
+        operation_name=operation_name,
+        variables=variables,
+        response=response
+    ), pos
+
+
+def decode_performance_track(reader: io.BytesIO) -> PerformanceTrack:
+    return PerformanceTrack(
+        frames=read_int(reader),
+        ticks=read_int(reader),
+        total_js_heap_size=read_uint(reader),
+        used_js_heap_size=read_uint(reader)
+    )
+
+
+def decode_performance_track_from(buf: memoryview, pos: int) -> Tuple[PerformanceTrack, int]:
+    frames, pos = read_int_from(buf, pos)
+    ticks, pos = read_int_from(buf, pos)
+    total_js_heap_size, pos = read_uint_from(buf, pos)
+    used_js_heap_size, pos = read_uint_from(buf, pos)
+    return PerformanceTrack(
+        frames=frames,
+        ticks=ticks,
+        total_js_heap_size=total_js_heap_size,
+        used_js_heap_size=used_js_heap_size
+    ), pos
+
+
+def decode_string_dict(reader: io.BytesIO) -> StringDict:
+    return StringDict(
+        key=read_uint(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_string_dict_from(buf: memoryview, pos: int) -> Tuple[StringDict, int]:
+    key, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return StringDict(
+        key=key,
+        value=value
+    ), pos
+
+
+def decode_set_node_attribute_dict(reader: io.BytesIO) -> SetNodeAttributeDict:
+    return SetNodeAttributeDict(
+        id=read_uint(reader),
+        name_key=read_uint(reader),
+        value_key=read_uint(reader)
+    )
+
+
+def decode_set_node_attribute_dict_from(buf: memoryview, pos: int) -> Tuple[SetNodeAttributeDict, int]:
+    id, pos = read_uint_from(buf, pos)
+    name_key, pos = read_uint_from(buf, pos)
+    value_key, pos = read_uint_from(buf, pos)
+    return SetNodeAttributeDict(
+        id=id,
+        name_key=name_key,
+        value_key=value_key
+    ), pos
+
+
+def decode_dom_drop(reader: io.BytesIO) -> DOMDrop:
+    return DOMDrop(
+        timestamp=read_uint(reader)
+    )
+
+
+def decode_dom_drop_from(buf: memoryview, pos: int) -> Tuple[DOMDrop, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    return DOMDrop(
+        timestamp=timestamp
+    ), pos
+
+
+def decode_resource_timing(reader: io.BytesIO) -> ResourceTiming:
+    return ResourceTiming(
+        timestamp=read_uint(reader),
+        duration=read_uint(reader),
+        ttfb=read_uint(reader),
+        header_size=read_uint(reader),
+        encoded_body_size=read_uint(reader),
+        decoded_body_size=read_uint(reader),
+        url=read_string(reader),
+        initiator=read_string(reader)
+    )
+
+
+def decode_resource_timing_from(buf: memoryview, pos: int) -> Tuple[ResourceTiming, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    ttfb, pos = read_uint_from(buf, pos)
+    header_size, pos = read_uint_from(buf, pos)
+    encoded_body_size, pos = read_uint_from(buf, pos)
+    decoded_body_size, pos = read_uint_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    initiator, pos = read_string_from(buf, pos)
+    return ResourceTiming(
+        timestamp=timestamp,
+        duration=duration,
+        ttfb=ttfb,
+        header_size=header_size,
+        encoded_body_size=encoded_body_size,
+        decoded_body_size=decoded_body_size,
+        url=url,
+        initiator=initiator
+    ), pos
+
+
+def decode_connection_information(reader: io.BytesIO) -> ConnectionInformation:
+    return ConnectionInformation(
+        downlink=read_uint(reader),
+        type=read_string(reader)
+    )
+
+
+def decode_connection_information_from(buf: memoryview, pos: int) -> Tuple[ConnectionInformation, int]:
+    downlink, pos = read_uint_from(buf, pos)
+    type, pos = read_string_from(buf, pos)
+    return ConnectionInformation(
+        downlink=downlink,
+        type=type
+    ), pos
+
+
+def decode_set_page_visibility(reader: io.BytesIO) -> SetPageVisibility:
+    return SetPageVisibility(
+        hidden=read_boolean(reader)
+    )
+
+
+def decode_set_page_visibility_from(buf: memoryview, pos: int) -> Tuple[SetPageVisibility, int]:
+    hidden, pos = read_boolean_from(buf, pos)
+    return SetPageVisibility(
+        hidden=hidden
+    ), pos
+
+
+def decode_performance_track_aggr(reader: io.BytesIO) -> PerformanceTrackAggr:
+    return PerformanceTrackAggr(
+        timestamp_start=read_uint(reader),
+        timestamp_end=read_uint(reader),
+        min_fps=read_uint(reader),
+        avg_fps=read_uint(reader),
+        max_fps=read_uint(reader),
+        min_cpu=read_uint(reader),
+        avg_cpu=read_uint(reader),
+        max_cpu=read_uint(reader),
+        min_total_js_heap_size=read_uint(reader),
+        avg_total_js_heap_size=read_uint(reader),
+        max_total_js_heap_size=read_uint(reader),
+        min_used_js_heap_size=read_uint(reader),
+        avg_used_js_heap_size=read_uint(reader),
+        max_used_js_heap_size=read_uint(reader)
+    )
+
+
+def decode_performance_track_aggr_from(buf: memoryview, pos: int) -> Tuple[PerformanceTrackAggr, int]:
+    timestamp_start, pos = read_uint_from(buf, pos)
+    timestamp_end, pos = read_uint_from(buf, pos)
+    min_fps, pos = read_uint_from(buf, pos)
+    avg_fps, pos = read_uint_from(buf, pos)
+    max_fps, pos = read_uint_from(buf, pos)
+    min_cpu, pos = read_uint_from(buf, pos)
+    avg_cpu, pos = read_uint_from(buf, pos)
+    max_cpu, pos = read_uint_from(buf, pos)
+    min_total_js_heap_size, pos = read_uint_from(buf, pos)
+    avg_total_js_heap_size, pos = read_uint_from(buf, pos)
+    max_total_js_heap_size, pos = read_uint_from(buf, pos)
+    min_used_js_heap_size, pos = read_uint_from(buf, pos)
+    avg_used_js_heap_size, pos = read_uint_from(buf, pos)
+    max_used_js_heap_size, pos = read_uint_from(buf, pos)
+    return PerformanceTrackAggr(
+        timestamp_start=timestamp_start,
+        timestamp_end=timestamp_end,
+        min_fps=min_fps,
+        avg_fps=avg_fps,
+        max_fps=max_fps,
+        min_cpu=min_cpu,
+        avg_cpu=avg_cpu,
+        max_cpu=max_cpu,
+        min_total_js_heap_size=min_total_js_heap_size,
+        avg_total_js_heap_size=avg_total_js_heap_size,
+        max_total_js_heap_size=max_total_js_heap_size,
+        min_used_js_heap_size=min_used_js_heap_size,
+        avg_used_js_heap_size=avg_used_js_heap_size,
+        max_used_js_heap_size=max_used_js_heap_size
+    ), pos
+
+
+def decode_load_font_face(reader: io.BytesIO) -> LoadFontFace:
+    return LoadFontFace(
+        parent_id=read_uint(reader),
+        family=read_string(reader),
+        source=read_string(reader),
+        descriptors=read_string(reader)
+    )
+
+
+def decode_load_font_face_from(buf: memoryview, pos: int) -> Tuple[LoadFontFace, int]:
+    parent_id, pos = read_uint_from(buf, pos)
+    family, pos = read_string_from(buf, pos)
+    source, pos = read_string_from(buf, pos)
+    descriptors, pos = read_string_from(buf, pos)
+    return LoadFontFace(
+        parent_id=parent_id,
+        family=family,
+        source=source,
+        descriptors=descriptors
+    ), pos
+
+
+def decode_set_node_focus(reader: io.BytesIO) -> SetNodeFocus:
+    return SetNodeFocus(
+        id=read_int(reader)
+    )
+
+
+def decode_set_node_focus_from(buf: memoryview, pos: int) -> Tuple[SetNodeFocus, int]:
+    id, pos = read_int_from(buf, pos)
+    return SetNodeFocus(
+        id=id
+    ), pos
+
+
+def decode_long_task(reader: io.BytesIO) -> LongTask:
+    return LongTask(
+        timestamp=read_uint(reader),
+        duration=read_uint(reader),
+        context=read_uint(reader),
+        container_type=read_uint(reader),
+        container_src=read_string(reader),
+        container_id=read_string(reader),
+        container_name=read_string(reader)
+    )
+
+
+def decode_long_task_from(buf: memoryview, pos: int) -> Tuple[LongTask, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    context, pos = read_uint_from(buf, pos)
+    container_type, pos = read_uint_from(buf, pos)
+    container_src, pos = read_string_from(buf, pos)
+    container_id, pos = read_string_from(buf, pos)
+    container_name, pos = read_string_from(buf, pos)
+    return LongTask(
+        timestamp=timestamp,
+        duration=duration,
+        context=context,
+        container_type=container_type,
+        container_src=container_src,
+        container_id=container_id,
+        container_name=container_name
+    ), pos
+
+
+def decode_set_node_attribute_url_based(reader: io.BytesIO) -> SetNodeAttributeURLBased:
+    return SetNodeAttributeURLBased(
+        id=read_uint(reader),
+        name=read_string(reader),
+        value=read_string(reader),
+        base_url=read_string(reader)
+    )
+
+
+def decode_set_node_attribute_url_based_from(buf: memoryview, pos: int) -> Tuple[SetNodeAttributeURLBased, int]:
+    id, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    base_url, pos = read_string_from(buf, pos)
+    return SetNodeAttributeURLBased(
+        id=id,
+        name=name,
+        value=value,
+        base_url=base_url
+    ), pos
+
+
+def decode_set_css_data_url_based(reader: io.BytesIO) -> SetCSSDataURLBased:
+    return SetCSSDataURLBased(
+        id=read_uint(reader),
+        data=read_string(reader),
+        base_url=read_string(reader)
+    )
+
+
+def decode_set_css_data_url_based_from(buf: memoryview, pos: int) -> Tuple[SetCSSDataURLBased, int]:
+    id, pos = read_uint_from(buf, pos)
+    data, pos = read_string_from(buf, pos)
+    base_url, pos = read_string_from(buf, pos)
+    return SetCSSDataURLBased(
+        id=id,
+        data=data,
+        base_url=base_url
+    ), pos
+
+
+def decode_issue_event_deprecated(reader: io.BytesIO) -> IssueEventDeprecated:
+    return IssueEventDeprecated(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        type=read_string(reader),
+        context_string=read_string(reader),
+        context=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_issue_event_deprecated_from(buf: memoryview, pos: int) -> Tuple[IssueEventDeprecated, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    type, pos = read_string_from(buf, pos)
+    context_string, pos = read_string_from(buf, pos)
+    context, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return IssueEventDeprecated(
+        message_id=message_id,
+        timestamp=timestamp,
+        type=type,
+        context_string=context_string,
+        context=context,
+        payload=payload
+    ), pos
+
+
+def decode_technical_info(reader: io.BytesIO) -> TechnicalInfo:
+    return TechnicalInfo(
+        type=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_technical_info_from(buf: memoryview, pos: int) -> Tuple[TechnicalInfo, int]:
+    type, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return TechnicalInfo(
+        type=type,
+        value=value
+    ), pos
+
+
+def decode_custom_issue(reader: io.BytesIO) -> CustomIssue:
+    return CustomIssue(
+        name=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_custom_issue_from(buf: memoryview, pos: int) -> Tuple[CustomIssue, int]:
+    name, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return CustomIssue(
+        name=name,
+        payload=payload
+    ), pos
+
+
+def decode_asset_cache(reader: io.BytesIO) -> AssetCache:
+    return AssetCache(
+        url=read_string(reader)
+    )
+
+
+def decode_asset_cache_from(buf: memoryview, pos: int) -> Tuple[AssetCache, int]:
+    url, pos = read_string_from(buf, pos)
+    return AssetCache(
+        url=url
+    ), pos
+
+
+def decode_css_insert_rule_url_based(reader: io.BytesIO) -> CSSInsertRuleURLBased:
+    return CSSInsertRuleURLBased(
+        id=read_uint(reader),
+        rule=read_string(reader),
+        index=read_uint(reader),
+        base_url=read_string(reader)
+    )
+
+
+def decode_css_insert_rule_url_based_from(buf: memoryview, pos: int) -> Tuple[CSSInsertRuleURLBased, int]:
+    id, pos = read_uint_from(buf, pos)
+    rule, pos = read_string_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    base_url, pos = read_string_from(buf, pos)
+    return CSSInsertRuleURLBased(
+        id=id,
+        rule=rule,
+        index=index,
+        base_url=base_url
+    ), pos
+
+
+def decode_mouse_click(reader: io.BytesIO) -> MouseClick:
+    return MouseClick(
+        id=read_uint(reader),
+        hesitation_time=read_uint(reader),
+        label=read_string(reader),
+        selector=read_string(reader)
+    )
+
+
+def decode_mouse_click_from(buf: memoryview, pos: int) -> Tuple[MouseClick, int]:
+    id, pos = read_uint_from(buf, pos)
+    hesitation_time, pos = read_uint_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    selector, pos = read_string_from(buf, pos)
+    return MouseClick(
+        id=id,
+        hesitation_time=hesitation_time,
+        label=label,
+        selector=selector
+    ), pos
+
+
+def decode_create_i_frame_document(reader: io.BytesIO) -> CreateIFrameDocument:
+    return CreateIFrameDocument(
+        frame_id=read_uint(reader),
+        id=read_uint(reader)
+    )
+
+
+def decode_create_i_frame_document_from(buf: memoryview, pos: int) -> Tuple[CreateIFrameDocument, int]:
+    frame_id, pos = read_uint_from(buf, pos)
+    id, pos = read_uint_from(buf, pos)
+    return CreateIFrameDocument(
+        frame_id=frame_id,
+        id=id
+    ), pos
+
+
+def decode_adopted_ss_replace_url_based(reader: io.BytesIO) -> AdoptedSSReplaceURLBased:
+    return AdoptedSSReplaceURLBased(
+        sheet_id=read_uint(reader),
+        text=read_string(reader),
+        base_url=read_string(reader)
+    )
+
+
+def decode_adopted_ss_replace_url_based_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSReplaceURLBased, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    text, pos = read_string_from(buf, pos)
+    base_url, pos = read_string_from(buf, pos)
+    return AdoptedSSReplaceURLBased(
+        sheet_id=sheet_id,
+        text=text,
+        base_url=base_url
+    ), pos
+
+
+def decode_adopted_ss_replace(reader: io.BytesIO) -> AdoptedSSReplace:
+    return AdoptedSSReplace(
+        sheet_id=read_uint(reader),
+        text=read_string(reader)
+    )
+
+
+def decode_adopted_ss_replace_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSReplace, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    text, pos = read_string_from(buf, pos)
+    return AdoptedSSReplace(
+        sheet_id=sheet_id,
+        text=text
+    ), pos
+
+
+def decode_adopted_ss_insert_rule_url_based(reader: io.BytesIO) -> AdoptedSSInsertRuleURLBased:
+    return AdoptedSSInsertRuleURLBased(
+        sheet_id=read_uint(reader),
+        rule=read_string(reader),
+        index=read_uint(reader),
+        base_url=read_string(reader)
+    )
+
+
+def decode_adopted_ss_insert_rule_url_based_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSInsertRuleURLBased, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    rule, pos = read_string_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    base_url, pos = read_string_from(buf, pos)
+    return AdoptedSSInsertRuleURLBased(
+        sheet_id=sheet_id,
+        rule=rule,
+        index=index,
+        base_url=base_url
+    ), pos
+
+
+def decode_adopted_ss_insert_rule(reader: io.BytesIO) -> AdoptedSSInsertRule:
+    return AdoptedSSInsertRule(
+        sheet_id=read_uint(reader),
+        rule=read_string(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_adopted_ss_insert_rule_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSInsertRule, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    rule, pos = read_string_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return AdoptedSSInsertRule(
+        sheet_id=sheet_id,
+        rule=rule,
+        index=index
+    ), pos
+
+
+def decode_adopted_ss_delete_rule(reader: io.BytesIO) -> AdoptedSSDeleteRule:
+    return AdoptedSSDeleteRule(
+        sheet_id=read_uint(reader),
+        index=read_uint(reader)
+    )
+
+
+def decode_adopted_ss_delete_rule_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSDeleteRule, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    index, pos = read_uint_from(buf, pos)
+    return AdoptedSSDeleteRule(
+        sheet_id=sheet_id,
+        index=index
+    ), pos
+
+
+def decode_adopted_ss_add_owner(reader: io.BytesIO) -> AdoptedSSAddOwner:
+    return AdoptedSSAddOwner(
+        sheet_id=read_uint(reader),
+        id=read_uint(reader)
+    )
+
+
+def decode_adopted_ss_add_owner_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSAddOwner, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    id, pos = read_uint_from(buf, pos)
+    return AdoptedSSAddOwner(
+        sheet_id=sheet_id,
+        id=id
+    ), pos
+
+
+def decode_adopted_ss_remove_owner(reader: io.BytesIO) -> AdoptedSSRemoveOwner:
+    return AdoptedSSRemoveOwner(
+        sheet_id=read_uint(reader),
+        id=read_uint(reader)
+    )
+
+
+def decode_adopted_ss_remove_owner_from(buf: memoryview, pos: int) -> Tuple[AdoptedSSRemoveOwner, int]:
+    sheet_id, pos = read_uint_from(buf, pos)
+    id, pos = read_uint_from(buf, pos)
+    return AdoptedSSRemoveOwner(
+        sheet_id=sheet_id,
+        id=id
+    ), pos
+
+
+def decode_js_exception(reader: io.BytesIO) -> JSException:
+    return JSException(
+        name=read_string(reader),
+        message=read_string(reader),
+        payload=read_string(reader),
+        metadata=read_string(reader)
+    )
+
+
+def decode_js_exception_from(buf: memoryview, pos: int) -> Tuple[JSException, int]:
+    name, pos = read_string_from(buf, pos)
+    message, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    metadata, pos = read_string_from(buf, pos)
+    return JSException(
+        name=name,
+        message=message,
+        payload=payload,
+        metadata=metadata
+    ), pos
+
+
+def decode_zustand(reader: io.BytesIO) -> Zustand:
+    return Zustand(
+        mutation=read_string(reader),
+        state=read_string(reader)
+    )
+
+
+def decode_zustand_from(buf: memoryview, pos: int) -> Tuple[Zustand, int]:
+    mutation, pos = read_string_from(buf, pos)
+    state, pos = read_string_from(buf, pos)
+    return Zustand(
+        mutation=mutation,
+        state=state
+    ), pos
+
+
+def decode_batch_meta(reader: io.BytesIO) -> BatchMeta:
+    return BatchMeta(
+        page_no=read_uint(reader),
+        first_index=read_uint(reader),
+        timestamp=read_int(reader)
+    )
+
+
+def decode_batch_meta_from(buf: memoryview, pos: int) -> Tuple[BatchMeta, int]:
+    page_no, pos = read_uint_from(buf, pos)
+    first_index, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_int_from(buf, pos)
+    return BatchMeta(
+        page_no=page_no,
+        first_index=first_index,
+        timestamp=timestamp
+    ), pos
+
+
+def decode_batch_metadata(reader: io.BytesIO) -> BatchMetadata:
+    return BatchMetadata(
+        version=read_uint(reader),
+        page_no=read_uint(reader),
+        first_index=read_uint(reader),
+        timestamp=read_int(reader),
+        location=read_string(reader)
+    )
+
+
+def decode_batch_metadata_from(buf: memoryview, pos: int) -> Tuple[BatchMetadata, int]:
+    version, pos = read_uint_from(buf, pos)
+    page_no, pos = read_uint_from(buf, pos)
+    first_index, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_int_from(buf, pos)
+    location, pos = read_string_from(buf, pos)
+    return BatchMetadata(
+        version=version,
+        page_no=page_no,
+        first_index=first_index,
+        timestamp=timestamp,
+        location=location
+    ), pos
+
+
+def decode_partitioned_message(reader: io.BytesIO) -> PartitionedMessage:
+    return PartitionedMessage(
+        part_no=read_uint(reader),
+        part_total=read_uint(reader)
+    )
+
+
+def decode_partitioned_message_from(buf: memoryview, pos: int) -> Tuple[PartitionedMessage, int]:
+    part_no, pos = read_uint_from(buf, pos)
+    part_total, pos = read_uint_from(buf, pos)
+    return PartitionedMessage(
+        part_no=part_no,
+        part_total=part_total
+    ), pos
+
+
+def decode_issue_event(reader: io.BytesIO) -> IssueEvent:
+    return IssueEvent(
+        message_id=read_uint(reader),
+        timestamp=read_uint(reader),
+        type=read_string(reader),
+        context_string=read_string(reader),
+        context=read_string(reader),
+        payload=read_string(reader),
+        url=read_string(reader)
+    )
+
+
+def decode_issue_event_from(buf: memoryview, pos: int) -> Tuple[IssueEvent, int]:
+    message_id, pos = read_uint_from(buf, pos)
+    timestamp, pos = read_uint_from(buf, pos)
+    type, pos = read_string_from(buf, pos)
+    context_string, pos = read_string_from(buf, pos)
+    context, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    return IssueEvent(
+        message_id=message_id,
+        timestamp=timestamp,
+        type=type,
+        context_string=context_string,
+        context=context,
+        payload=payload,
+        url=url
+    ), pos
+
+
+def decode_session_end(reader: io.BytesIO) -> SessionEnd:
+    return SessionEnd(
+        timestamp=read_uint(reader),
+        encryption_key=read_string(reader)
+    )
+
+
+def decode_session_end_from(buf: memoryview, pos: int) -> Tuple[SessionEnd, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    encryption_key, pos = read_string_from(buf, pos)
+    return SessionEnd(
+        timestamp=timestamp,
+        encryption_key=encryption_key
+    ), pos
+
+
+def decode_session_search(reader: io.BytesIO) -> SessionSearch:
+    return SessionSearch(
+        timestamp=read_uint(reader),
+        partition=read_uint(reader)
+    )
+
+
+def decode_session_search_from(buf: memoryview, pos: int) -> Tuple[SessionSearch, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    partition, pos = read_uint_from(buf, pos)
+    return SessionSearch(
+        timestamp=timestamp,
+        partition=partition
+    ), pos
+
+
+def decode_ios_batch_meta(reader: io.BytesIO) -> IOSBatchMeta:
+    return IOSBatchMeta(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        first_index=read_uint(reader)
+    )
+
+
+def decode_ios_batch_meta_from(buf: memoryview, pos: int) -> Tuple[IOSBatchMeta, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    first_index, pos = read_uint_from(buf, pos)
+    return IOSBatchMeta(
+        timestamp=timestamp,
+        length=length,
+        first_index=first_index
+    ), pos
+
+
+def decode_ios_session_start(reader: io.BytesIO) -> IOSSessionStart:
+    return IOSSessionStart(
+        timestamp=read_uint(reader),
+        project_id=read_uint(reader),
+        tracker_version=read_string(reader),
+        rev_id=read_string(reader),
+        user_uuid=read_string(reader),
+        user_os=read_string(reader),
+        user_os_version=read_string(reader),
+        user_device=read_string(reader),
+        user_device_type=read_string(reader),
+        user_country=read_string(reader)
+    )
+
+
+def decode_ios_session_start_from(buf: memoryview, pos: int) -> Tuple[IOSSessionStart, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    project_id, pos = read_uint_from(buf, pos)
+    tracker_version, pos = read_string_from(buf, pos)
+    rev_id, pos = read_string_from(buf, pos)
+    user_uuid, pos = read_string_from(buf, pos)
+    user_os, pos = read_string_from(buf, pos)
+    user_os_version, pos = read_string_from(buf, pos)
+    user_device, pos = read_string_from(buf, pos)
+    user_device_type, pos = read_string_from(buf, pos)
+    user_country, pos = read_string_from(buf, pos)
+    return IOSSessionStart(
+        timestamp=timestamp,
+        project_id=project_id,
+        tracker_version=tracker_version,
+        rev_id=rev_id,
+        user_uuid=user_uuid,
+        user_os=user_os,
+        user_os_version=user_os_version,
+        user_device=user_device,
+        user_device_type=user_device_type,
+        user_country=user_country
+    ), pos
+
+
+def decode_ios_session_end(reader: io.BytesIO) -> IOSSessionEnd:
+    return IOSSessionEnd(
+        timestamp=read_uint(reader)
+    )
+
+
+def decode_ios_session_end_from(buf: memoryview, pos: int) -> Tuple[IOSSessionEnd, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    return IOSSessionEnd(
+        timestamp=timestamp
+    ), pos
+
+
+def decode_ios_metadata(reader: io.BytesIO) -> IOSMetadata:
+    return IOSMetadata(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        key=read_string(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_ios_metadata_from(buf: memoryview, pos: int) -> Tuple[IOSMetadata, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    key, pos = read_string_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return IOSMetadata(
+        timestamp=timestamp,
+        length=length,
+        key=key,
+        value=value
+    ), pos
+
+
+def decode_ios_custom_event(reader: io.BytesIO) -> IOSCustomEvent:
+    return IOSCustomEvent(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        name=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_ios_custom_event_from(buf: memoryview, pos: int) -> Tuple[IOSCustomEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return IOSCustomEvent(
+        timestamp=timestamp,
+        length=length,
+        name=name,
+        payload=payload
+    ), pos
+
+
+def decode_ios_user_id(reader: io.BytesIO) -> IOSUserID:
+    return IOSUserID(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_ios_user_id_from(buf: memoryview, pos: int) -> Tuple[IOSUserID, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return IOSUserID(
+        timestamp=timestamp,
+        length=length,
+        value=value
+    ), pos
+
+
+def decode_ios_user_anonymous_id(reader: io.BytesIO) -> IOSUserAnonymousID:
+    return IOSUserAnonymousID(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        value=read_string(reader)
+    )
+
+
+def decode_ios_user_anonymous_id_from(buf: memoryview, pos: int) -> Tuple[IOSUserAnonymousID, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    return IOSUserAnonymousID(
+        timestamp=timestamp,
+        length=length,
+        value=value
+    ), pos
+
+
+def decode_ios_screen_changes(reader: io.BytesIO) -> IOSScreenChanges:
+    return IOSScreenChanges(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        x=read_uint(reader),
+        y=read_uint(reader),
+        width=read_uint(reader),
+        height=read_uint(reader)
+    )
+
+
+def decode_ios_screen_changes_from(buf: memoryview, pos: int) -> Tuple[IOSScreenChanges, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    x, pos = read_uint_from(buf, pos)
+    y, pos = read_uint_from(buf, pos)
+    width, pos = read_uint_from(buf, pos)
+    height, pos = read_uint_from(buf, pos)
+    return IOSScreenChanges(
+        timestamp=timestamp,
+        length=length,
+        x=x,
+        y=y,
+        width=width,
+        height=height
+    ), pos
+
+
+def decode_ios_crash(reader: io.BytesIO) -> IOSCrash:
+    return IOSCrash(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        name=read_string(reader),
+        reason=read_string(reader),
+        stacktrace=read_string(reader)
+    )
+
+
+def decode_ios_crash_from(buf: memoryview, pos: int) -> Tuple[IOSCrash, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    reason, pos = read_string_from(buf, pos)
+    stacktrace, pos = read_string_from(buf, pos)
+    return IOSCrash(
+        timestamp=timestamp,
+        length=length,
+        name=name,
+        reason=reason,
+        stacktrace=stacktrace
+    ), pos
+
+
+def decode_ios_screen_enter(reader: io.BytesIO) -> IOSScreenEnter:
+    return IOSScreenEnter(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        title=read_string(reader),
+        view_name=read_string(reader)
+    )
+
+
+def decode_ios_screen_enter_from(buf: memoryview, pos: int) -> Tuple[IOSScreenEnter, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    title, pos = read_string_from(buf, pos)
+    view_name, pos = read_string_from(buf, pos)
+    return IOSScreenEnter(
+        timestamp=timestamp,
+        length=length,
+        title=title,
+        view_name=view_name
+    ), pos
+
+
+def decode_ios_screen_leave(reader: io.BytesIO) -> IOSScreenLeave:
+    return IOSScreenLeave(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        title=read_string(reader),
+        view_name=read_string(reader)
+    )
+
+
+def decode_ios_screen_leave_from(buf: memoryview, pos: int) -> Tuple[IOSScreenLeave, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    title, pos = read_string_from(buf, pos)
+    view_name, pos = read_string_from(buf, pos)
+    return IOSScreenLeave(
+        timestamp=timestamp,
+        length=length,
+        title=title,
+        view_name=view_name
+    ), pos
+
+
+def decode_ios_click_event(reader: io.BytesIO) -> IOSClickEvent:
+    return IOSClickEvent(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        label=read_string(reader),
+        x=read_uint(reader),
+        y=read_uint(reader)
+    )
+
+
+def decode_ios_click_event_from(buf: memoryview, pos: int) -> Tuple[IOSClickEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    x, pos = read_uint_from(buf, pos)
+    y, pos = read_uint_from(buf, pos)
+    return IOSClickEvent(
+        timestamp=timestamp,
+        length=length,
+        label=label,
+        x=x,
+        y=y
+    ), pos
+
+
+def decode_ios_input_event(reader: io.BytesIO) -> IOSInputEvent:
+    return IOSInputEvent(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        value=read_string(reader),
+        value_masked=read_boolean(reader),
+        label=read_string(reader)
+    )
+
+
+def decode_ios_input_event_from(buf: memoryview, pos: int) -> Tuple[IOSInputEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    value, pos = read_string_from(buf, pos)
+    value_masked, pos = read_boolean_from(buf, pos)
+    label, pos = read_string_from(buf, pos)
+    return IOSInputEvent(
+        timestamp=timestamp,
+        length=length,
+        value=value,
+        value_masked=value_masked,
+        label=label
+    ), pos
+
+
+def decode_ios_performance_event(reader: io.BytesIO) -> IOSPerformanceEvent:
+    return IOSPerformanceEvent(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        name=read_string(reader),
+        value=read_uint(reader)
+    )
+
+
+def decode_ios_performance_event_from(buf: memoryview, pos: int) -> Tuple[IOSPerformanceEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    name, pos = read_string_from(buf, pos)
+    value, pos = read_uint_from(buf, pos)
+    return IOSPerformanceEvent(
+        timestamp=timestamp,
+        length=length,
+        name=name,
+        value=value
+    ), pos
+
+
+def decode_ios_log(reader: io.BytesIO) -> IOSLog:
+    return IOSLog(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        severity=read_string(reader),
+        content=read_string(reader)
+    )
+
+
+def decode_ios_log_from(buf: memoryview, pos: int) -> Tuple[IOSLog, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    severity, pos = read_string_from(buf, pos)
+    content, pos = read_string_from(buf, pos)
+    return IOSLog(
+        timestamp=timestamp,
+        length=length,
+        severity=severity,
+        content=content
+    ), pos
+
+
+def decode_ios_internal_error(reader: io.BytesIO) -> IOSInternalError:
+    return IOSInternalError(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        content=read_string(reader)
+    )
+
+
+def decode_ios_internal_error_from(buf: memoryview, pos: int) -> Tuple[IOSInternalError, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    content, pos = read_string_from(buf, pos)
+    return IOSInternalError(
+        timestamp=timestamp,
+        length=length,
+        content=content
+    ), pos
+
+
+def decode_ios_network_call(reader: io.BytesIO) -> IOSNetworkCall:
+    return IOSNetworkCall(
+        timestamp=read_uint(reader),
+        length=read_uint(reader),
+        duration=read_uint(reader),
+        headers=read_string(reader),
+        body=read_string(reader),
+        url=read_string(reader),
+        success=read_boolean(reader),
+        method=read_string(reader),
+        status=read_uint(reader)
+    )
+
+
+def decode_ios_network_call_from(buf: memoryview, pos: int) -> Tuple[IOSNetworkCall, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    length, pos = read_uint_from(buf, pos)
+    duration, pos = read_uint_from(buf, pos)
+    headers, pos = read_string_from(buf, pos)
+    body, pos = read_string_from(buf, pos)
+    url, pos = read_string_from(buf, pos)
+    success, pos = read_boolean_from(buf, pos)
+    method, pos = read_string_from(buf, pos)
+    status, pos = read_uint_from(buf, pos)
+    return IOSNetworkCall(
+        timestamp=timestamp,
+        length=length,
+        duration=duration,
+        headers=headers,
+        body=body,
+        url=url,
+        success=success,
+        method=method,
+        status=status
+    ), pos
+
+
+def decode_ios_performance_aggregated(reader: io.BytesIO) -> IOSPerformanceAggregated:
+    return IOSPerformanceAggregated(
+        timestamp_start=read_uint(reader),
+        timestamp_end=read_uint(reader),
+        min_fps=read_uint(reader),
+        avg_fps=read_uint(reader),
+        max_fps=read_uint(reader),
+        min_cpu=read_uint(reader),
+        avg_cpu=read_uint(reader),
+        max_cpu=read_uint(reader),
+        min_memory=read_uint(reader),
+        avg_memory=read_uint(reader),
+        max_memory=read_uint(reader),
+        min_battery=read_uint(reader),
+        avg_battery=read_uint(reader),
+        max_battery=read_uint(reader)
+    )
+
+
+def decode_ios_performance_aggregated_from(buf: memoryview, pos: int) -> Tuple[IOSPerformanceAggregated, int]:
+    timestamp_start, pos = read_uint_from(buf, pos)
+    timestamp_end, pos = read_uint_from(buf, pos)
+    min_fps, pos = read_uint_from(buf, pos)
+    avg_fps, pos = read_uint_from(buf, pos)
+    max_fps, pos = read_uint_from(buf, pos)
+    min_cpu, pos = read_uint_from(buf, pos)
+    avg_cpu, pos = read_uint_from(buf, pos)
+    max_cpu, pos = read_uint_from(buf, pos)
+    min_memory, pos = read_uint_from(buf, pos)
+    avg_memory, pos = read_uint_from(buf, pos)
+    max_memory, pos = read_uint_from(buf, pos)
+    min_battery, pos = read_uint_from(buf, pos)
+    avg_battery, pos = read_uint_from(buf, pos)
+    max_battery, pos = read_uint_from(buf, pos)
+    return IOSPerformanceAggregated(
+        timestamp_start=timestamp_start,
+        timestamp_end=timestamp_end,
+        min_fps=min_fps,
+        avg_fps=avg_fps,
+        max_fps=max_fps,
+        min_cpu=min_cpu,
+        avg_cpu=avg_cpu,
+        max_cpu=max_cpu,
+        min_memory=min_memory,
+        avg_memory=avg_memory,
+        max_memory=max_memory,
+        min_battery=min_battery,
+        avg_battery=avg_battery,
+        max_battery=max_battery
+    ), pos
+
+
+def decode_ios_issue_event(reader: io.BytesIO) -> IOSIssueEvent:
+    return IOSIssueEvent(
+        timestamp=read_uint(reader),
+        type=read_string(reader),
+        context_string=read_string(reader),
+        context=read_string(reader),
+        payload=read_string(reader)
+    )
+
+
+def decode_ios_issue_event_from(buf: memoryview, pos: int) -> Tuple[IOSIssueEvent, int]:
+    timestamp, pos = read_uint_from(buf, pos)
+    type, pos = read_string_from(buf, pos)
+    context_string, pos = read_string_from(buf, pos)
+    context, pos = read_string_from(buf, pos)
+    payload, pos = read_string_from(buf, pos)
+    return IOSIssueEvent(
+        timestamp=timestamp,
+        type=type,
+        context_string=context_string,
+        context=context,
+        payload=payload
+    ), pos
+
+
+# Dispatch tables: message id -> decode function
+DECODERS: Dict[int, Callable[[io.BytesIO], Message]] = {
+    0: decode_timestamp,
+    1: decode_session_start,
+    3: decode_session_end_deprecated,
+    4: decode_set_page_location,
+    5: decode_set_viewport_size,
+    6: decode_set_viewport_scroll,
+    7: decode_create_document,
+    8: decode_create_element_node,
+    9: decode_create_text_node,
+    10: decode_move_node,
+    11: decode_remove_node,
+    12: decode_set_node_attribute,
+    13: decode_remove_node_attribute,
+    14: decode_set_node_data,
+    15: decode_set_css_data,
+    16: decode_set_node_scroll,
+    17: decode_set_input_target,
+    18: decode_set_input_value,
+    19: decode_set_input_checked,
+    20: decode_mouse_move,
+    21: decode_network_request,
+    22: decode_console_log,
+    23: decode_page_load_timing,
+    24: decode_page_render_timing,
+    25: decode_js_exception_deprecated,
+    26: decode_integration_event,
+    27: decode_custom_event,
+    28: decode_user_id,
+    29: decode_user_anonymous_id,
+    30: decode_metadata,
+    31: decode_page_event,
+    32: decode_input_event,
+    33: decode_click_event,
+    35: decode_resource_event,
+    37: decode_css_insert_rule,
+    38: decode_css_delete_rule,
+    39: decode_fetch,
+    40: decode_profiler,
+    41: decode_o_table,
+    42: decode_state_action,
+    44: decode_redux,
+    45: decode_vuex,
+    46: decode_mob_x,
+    47: decode_ng_rx,
+    48: decode_graph_ql,
+    49: decode_performance_track,
+    50: decode_string_dict,
+    51: decode_set_node_attribute_dict,
+    52: decode_dom_drop,
+    53: decode_resource_timing,
+    54: decode_connection_information,
+    55: decode_set_page_visibility,
+    56: decode_performance_track_aggr,
+    57: decode_load_font_face,
+    58: decode_set_node_focus,
+    59: decode_long_task,
+    60: decode_set_node_attribute_url_based,
+    61: decode_set_css_data_url_based,
+    62: decode_issue_event_deprecated,
+    63: decode_technical_info,
+    64: decode_custom_issue,
+    66: decode_asset_cache,
+    67: decode_css_insert_rule_url_based,
+    69: decode_mouse_click,
+    70: decode_create_i_frame_document,
+    71: decode_adopted_ss_replace_url_based,
+    72: decode_adopted_ss_replace,
+    73: decode_adopted_ss_insert_rule_url_based,
+    74: decode_adopted_ss_insert_rule,
+    75: decode_adopted_ss_delete_rule,
+    76: decode_adopted_ss_add_owner,
+    77: decode_adopted_ss_remove_owner,
+    78: decode_js_exception,
+    79: decode_zustand,
+    80: decode_batch_meta,
+    81: decode_batch_metadata,
+    82: decode_partitioned_message,
+    125: decode_issue_event,
+    126: decode_session_end,
+    127: decode_session_search,
+    107: decode_ios_batch_meta,
+    90: decode_ios_session_start,
+    91: decode_ios_session_end,
+    92: decode_ios_metadata,
+    93: decode_ios_custom_event,
+    94: decode_ios_user_id,
+    95: decode_ios_user_anonymous_id,
+    96: decode_ios_screen_changes,
+    97: decode_ios_crash,
+    98: decode_ios_screen_enter,
+    99: decode_ios_screen_leave,
+    100: decode_ios_click_event,
+    101: decode_ios_input_event,
+    102: decode_ios_performance_event,
+    103: decode_ios_log,
+    104: decode_ios_internal_error,
+    105: decode_ios_network_call,
+    110: decode_ios_performance_aggregated,
+    111: decode_ios_issue_event,
+}
+
+DECODERS_FROM: Dict[int, Callable[[memoryview, int], Tuple[Message, int]]] = {
+    0: decode_timestamp_from,
+    1: decode_session_start_from,
+    3: decode_session_end_deprecated_from,
+    4: decode_set_page_location_from,
+    5: decode_set_viewport_size_from,
+    6: decode_set_viewport_scroll_from,
+    7: decode_create_document_from,
+    8: decode_create_element_node_from,
+    9: decode_create_text_node_from,
+    10: decode_move_node_from,
+    11: decode_remove_node_from,
+    12: decode_set_node_attribute_from,
+    13: decode_remove_node_attribute_from,
+    14: decode_set_node_data_from,
+    15: decode_set_css_data_from,
+    16: decode_set_node_scroll_from,
+    17: decode_set_input_target_from,
+    18: decode_set_input_value_from,
+    19: decode_set_input_checked_from,
+    20: decode_mouse_move_from,
+    21: decode_network_request_from,
+    22: decode_console_log_from,
+    23: decode_page_load_timing_from,
+    24: decode_page_render_timing_from,
+    25: decode_js_exception_deprecated_from,
+    26: decode_integration_event_from,
+    27: decode_custom_event_from,
+    28: decode_user_id_from,
+    29: decode_user_anonymous_id_from,
+    30: decode_metadata_from,
+    31: decode_page_event_from,
+    32: decode_input_event_from,
+    33: decode_click_event_from,
+    35: decode_resource_event_from,
+    37: decode_css_insert_rule_from,
+    38: decode_css_delete_rule_from,
+    39: decode_fetch_from,
+    40: decode_profiler_from,
+    41: decode_o_table_from,
+    42: decode_state_action_from,
+    44: decode_redux_from,
+    45: decode_vuex_from,
+    46: decode_mob_x_from,
+    47: decode_ng_rx_from,
+    48: decode_graph_ql_from,
+    49: decode_performance_track_from,
+    50: decode_string_dict_from,
+    51: decode_set_node_attribute_dict_from,
+    52: decode_dom_drop_from,
+    53: decode_resource_timing_from,
+    54: decode_connection_information_from,
+    55: decode_set_page_visibility_from,
+    56: decode_performance_track_aggr_from,
+    57: decode_load_font_face_from,
+    58: decode_set_node_focus_from,
+    59: decode_long_task_from,
+    60: decode_set_node_attribute_url_based_from,
+    61: decode_set_css_data_url_based_from,
+    62: decode_issue_event_deprecated_from,
+    63: decode_technical_info_from,
+    64: decode_custom_issue_from,
+    66: decode_asset_cache_from,
+    67: decode_css_insert_rule_url_based_from,
+    69: decode_mouse_click_from,
+    70: decode_create_i_frame_document_from,
+    71: decode_adopted_ss_replace_url_based_from,
+    72: decode_adopted_ss_replace_from,
+    73: decode_adopted_ss_insert_rule_url_based_from,
+    74: decode_adopted_ss_insert_rule_from,
+    75: decode_adopted_ss_delete_rule_from,
+    76: decode_adopted_ss_add_owner_from,
+    77: decode_adopted_ss_remove_owner_from,
+    78: decode_js_exception_from,
+    79: decode_zustand_from,
+    80: decode_batch_meta_from,
+    81: decode_batch_metadata_from,
+    82: decode_partitioned_message_from,
+    125: decode_issue_event_from,
+    126: decode_session_end_from,
+    127: decode_session_search_from,
+    107: decode_ios_batch_meta_from,
+    90: decode_ios_session_start_from,
+    91: decode_ios_session_end_from,
+    92: decode_ios_metadata_from,
+    93: decode_ios_custom_event_from,
+    94: decode_ios_user_id_from,
+    95: decode_ios_user_anonymous_id_from,
+    96: decode_ios_screen_changes_from,
+    97: decode_ios_crash_from,
+    98: decode_ios_screen_enter_from,
+    99: decode_ios_screen_leave_from,
+    100: decode_ios_click_event_from,
+    101: decode_ios_input_event_from,
+    102: decode_ios_performance_event_from,
+    103: decode_ios_log_from,
+    104: decode_ios_internal_error_from,
+    105: decode_ios_network_call_from,
+    110: decode_ios_performance_aggregated_from,
+    111: decode_ios_issue_event_from,
+}
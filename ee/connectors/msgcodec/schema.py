@@ -0,0 +1,105 @@
+# Auto-generated, do not edit
+
+# message id -> (message name, ((attribute, type), ...)), as defined in mobs/messages.rb
+# types: int, uint, boolean, string, data
+message_schemas = {
+    0: ('Timestamp', (('timestamp', 'uint'),)),
+    1: ('SessionStart', (('timestamp', 'uint'), ('project_id', 'uint'), ('tracker_version', 'string'), ('rev_id', 'string'), ('user_uuid', 'string'), ('user_agent', 'string'), ('user_os', 'string'), ('user_os_version', 'string'), ('user_browser', 'string'), ('user_browser_version', 'string'), ('user_device', 'string'), ('user_device_type', 'string'), ('user_device_memory_size', 'uint'), ('user_device_heap_size', 'uint'), ('user_country', 'string'), ('user_id', 'string'))),
+    3: ('SessionEndDeprecated', (('timestamp', 'uint'),)),
+    4: ('SetPageLocation', (('url', 'string'), ('referrer', 'string'), ('navigation_start', 'uint'))),
+    5: ('SetViewportSize', (('width', 'uint'), ('height', 'uint'))),
+    6: ('SetViewportScroll', (('x', 'int'), ('y', 'int'))),
+    7: ('CreateDocument', ()),
+    8: ('CreateElementNode', (('id', 'uint'), ('parent_id', 'uint'), ('index', 'uint'), ('tag', 'string'), ('svg', 'boolean'))),
+    9: ('CreateTextNode', (('id', 'uint'), ('parent_id', 'uint'), ('index', 'uint'))),
+    10: ('MoveNode', (('id', 'uint'), ('parent_id', 'uint'), ('index', 'uint'))),
+    11: ('RemoveNode', (('id', 'uint'),)),
+    12: ('SetNodeAttribute', (('id', 'uint'), ('name', 'string'), ('value', 'string'))),
+    13: ('RemoveNodeAttribute', (('id', 'uint'), ('name', 'string'))),
+    14: ('SetNodeData', (('id', 'uint'), ('data', 'string'))),
+    15: ('SetCSSData', (('id', 'uint'), ('data', 'string'))),
+    16: ('SetNodeScroll', (('id', 'uint'), ('x', 'int'), ('y', 'int'))),
+    17: ('SetInputTarget', (('id', 'uint'), ('label', 'string'))),
+    18: ('SetInputValue', (('id', 'uint'), ('value', 'string'), ('mask', 'int'))),
+    19: ('SetInputChecked', (('id', 'uint'), ('checked', 'boolean'))),
+    20: ('MouseMove', (('x', 'uint'), ('y', 'uint'))),
+    21: ('NetworkRequest', (('type', 'string'), ('method', 'string'), ('url', 'string'), ('request', 'string'), ('response', 'string'), ('status', 'uint'), ('timestamp', 'uint'), ('duration', 'uint'))),
+    22: ('ConsoleLog', (('level', 'string'), ('value', 'string'))),
+    23: ('PageLoadTiming', (('request_start', 'uint'), ('response_start', 'uint'), ('response_end', 'uint'), ('dom_content_loaded_event_start', 'uint'), ('dom_content_loaded_event_end', 'uint'), ('load_event_start', 'uint'), ('load_event_end', 'uint'), ('first_paint', 'uint'), ('first_contentful_paint', 'uint'))),
+    24: ('PageRenderTiming', (('speed_index', 'uint'), ('visually_complete', 'uint'), ('time_to_interactive', 'uint'))),
+    25: ('JSExceptionDeprecated', (('name', 'string'), ('message', 'string'), ('payload', 'string'))),
+    26: ('IntegrationEvent', (('timestamp', 'uint'), ('source', 'string'), ('name', 'string'), ('message', 'string'), ('payload', 'string'))),
+    27: ('CustomEvent', (('name', 'string'), ('payload', 'string'))),
+    28: ('UserID', (('id', 'string'),)),
+    29: ('UserAnonymousID', (('id', 'string'),)),
+    30: ('Metadata', (('key', 'string'), ('value', 'string'))),
+    31: ('PageEvent', (('message_id', 'uint'), ('timestamp', 'uint'), ('url', 'string'), ('referrer', 'string'), ('loaded', 'boolean'), ('request_start', 'uint'), ('response_start', 'uint'), ('response_end', 'uint'), ('dom_content_loaded_event_start', 'uint'), ('dom_content_loaded_event_end', 'uint'), ('load_event_start', 'uint'), ('load_event_end', 'uint'), ('first_paint', 'uint'), ('first_contentful_paint', 'uint'), ('speed_index', 'uint'), ('visually_complete', 'uint'), ('time_to_interactive', 'uint'))),
+    32: ('InputEvent', (('message_id', 'uint'), ('timestamp', 'uint'), ('value', 'string'), ('value_masked', 'boolean'), ('label', 'string'))),
+    33: ('ClickEvent', (('message_id', 'uint'), ('timestamp', 'uint'), ('hesitation_time', 'uint'), ('label', 'string'), ('selector', 'string'))),
+    35: ('ResourceEvent', (('message_id', 'uint'), ('timestamp', 'uint'), ('duration', 'uint'), ('ttfb', 'uint'), ('header_size', 'uint'), ('encoded_body_size', 'uint'), ('decoded_body_size', 'uint'), ('url', 'string'), ('type', 'string'), ('success', 'boolean'), ('method', 'string'), ('status', 'uint'))),
+    37: ('CSSInsertRule', (('id', 'uint'), ('rule', 'string'), ('index', 'uint'))),
+    38: ('CSSDeleteRule', (('id', 'uint'), ('index', 'uint'))),
+    39: ('Fetch', (('method', 'string'), ('url', 'string'), ('request', 'string'), ('response', 'string'), ('status', 'uint'), ('timestamp', 'uint'), ('duration', 'uint'))),
+    40: ('Profiler', (('name', 'string'), ('duration', 'uint'), ('args', 'string'), ('result', 'string'))),
+    41: ('OTable', (('key', 'string'), ('value', 'string'))),
+    42: ('StateAction', (('type', 'string'),)),
+    44: ('Redux', (('action', 'string'), ('state', 'string'), ('duration', 'uint'))),
+    45: ('Vuex', (('mutation', 'string'), ('state', 'string'))),
+    46: ('MobX', (('type', 'string'), ('payload', 'string'))),
+    47: ('NgRx', (('action', 'string'), ('state', 'string'), ('duration', 'uint'))),
+    48: ('GraphQL', (('operation_kind', 'string'), ('operation_name', 'string'), ('variables', 'string'), ('response', 'string'))),
+    49: ('PerformanceTrack', (('frames', 'int'), ('ticks', 'int'), ('total_js_heap_size', 'uint'), ('used_js_heap_size', 'uint'))),
+    50: ('StringDict', (('key', 'uint'), ('value', 'string'))),
+    51: ('SetNodeAttributeDict', (('id', 'uint'), ('name_key', 'uint'), ('value_key', 'uint'))),
+    52: ('DOMDrop', (('timestamp', 'uint'),)),
+    53: ('ResourceTiming', (('timestamp', 'uint'), ('duration', 'uint'), ('ttfb', 'uint'), ('header_size', 'uint'), ('encoded_body_size', 'uint'), ('decoded_body_size', 'uint'), ('url', 'string'), ('initiator', 'string'))),
+    54: ('ConnectionInformation', (('downlink', 'uint'), ('type', 'string'))),
+    55: ('SetPageVisibility', (('hidden', 'boolean'),)),
+    56: ('PerformanceTrackAggr', (('timestamp_start', 'uint'), ('timestamp_end', 'uint'), ('min_fps', 'uint'), ('avg_fps', 'uint'), ('max_fps', 'uint'), ('min_cpu', 'uint'), ('avg_cpu', 'uint'), ('max_cpu', 'uint'), ('min_total_js_heap_size', 'uint'), ('avg_total_js_heap_size', 'uint'), ('max_total_js_heap_size', 'uint'), ('min_used_js_heap_size', 'uint'), ('avg_used_js_heap_size', 'uint'), ('max_used_js_heap_size', 'uint'))),
+    57: ('LoadFontFace', (('parent_id', 'uint'), ('family', 'string'), ('source', 'string'), ('descriptors', 'string'))),
+    58: ('SetNodeFocus', (('id', 'int'),)),
+    59: ('LongTask', (('timestamp', 'uint'), ('duration', 'uint'), ('context', 'uint'), ('container_type', 'uint'), ('container_src', 'string'), ('container_id', 'string'), ('container_name', 'string'))),
+    60: ('SetNodeAttributeURLBased', (('id', 'uint'), ('name', 'string'), ('value', 'string'), ('base_url', 'string'))),
+    61: ('SetCSSDataURLBased', (('id', 'uint'), ('data', 'string'), ('base_url', 'string'))),
+    62: ('IssueEventDeprecated', (('message_id', 'uint'), ('timestamp', 'uint'), ('type', 'string'), ('context_string', 'string'), ('context', 'string'), ('payload', 'string'))),
+    63: ('TechnicalInfo', (('type', 'string'), ('value', 'string'))),
+    64: ('CustomIssue', (('name', 'string'), ('payload', 'string'))),
+    66: ('AssetCache', (('url', 'string'),)),
+    67: ('CSSInsertRuleURLBased', (('id', 'uint'), ('rule', 'string'), ('index', 'uint'), ('base_url', 'string'))),
+    69: ('MouseClick', (('id', 'uint'), ('hesitation_time', 'uint'), ('label', 'string'), ('selector', 'string'))),
+    70: ('CreateIFrameDocument', (('frame_id', 'uint'), ('id', 'uint'))),
+    71: ('AdoptedSSReplaceURLBased', (('sheet_id', 'uint'), ('text', 'string'), ('base_url', 'string'))),
+    72: ('AdoptedSSReplace', (('sheet_id', 'uint'), ('text', 'string'))),
+    73: ('AdoptedSSInsertRuleURLBased', (('sheet_id', 'uint'), ('rule', 'string'), ('index', 'uint'), ('base_url', 'string'))),
+    74: ('AdoptedSSInsertRule', (('sheet_id', 'uint'), ('rule', 'string'), ('index', 'uint'))),
+    75: ('AdoptedSSDeleteRule', (('sheet_id', 'uint'), ('index', 'uint'))),
+    76: ('AdoptedSSAddOwner', (('sheet_id', 'uint'), ('id', 'uint'))),
+    77: ('AdoptedSSRemoveOwner', (('sheet_id', 'uint'), ('id', 'uint'))),
+    78: ('JSException', (('name', 'string'), ('message', 'string'), ('payload', 'string'), ('metadata', 'string'))),
+    79: ('Zustand', (('mutation', 'string'), ('state', 'string'))),
+    80: ('BatchMeta', (('page_no', 'uint'), ('first_index', 'uint'), ('timestamp', 'int'))),
+    81: ('BatchMetadata', (('version', 'uint'), ('page_no', 'uint'), ('first_index', 'uint'), ('timestamp', 'int'), ('location', 'string'))),
+    82: ('PartitionedMessage', (('part_no', 'uint'), ('part_total', 'uint'))),
+    125: ('IssueEvent', (('message_id', 'uint'), ('timestamp', 'uint'), ('type', 'string'), ('context_string', 'string'), ('context', 'string'), ('payload', 'string'), ('url', 'string'))),
+    126: ('SessionEnd', (('timestamp', 'uint'), ('encryption_key', 'string'))),
+    127: ('SessionSearch', (('timestamp', 'uint'), ('partition', 'uint'))),
+    107: ('IOSBatchMeta', (('timestamp', 'uint'), ('length', 'uint'), ('first_index', 'uint'))),
+    90: ('IOSSessionStart', (('timestamp', 'uint'), ('project_id', 'uint'), ('tracker_version', 'string'), ('rev_id', 'string'), ('user_uuid', 'string'), ('user_os', 'string'), ('user_os_version', 'string'), ('user_device', 'string'), ('user_device_type', 'string'), ('user_country', 'string'))),
+    91: ('IOSSessionEnd', (('timestamp', 'uint'),)),
+    92: ('IOSMetadata', (('timestamp', 'uint'), ('length', 'uint'), ('key', 'string'), ('value', 'string'))),
+    93: ('IOSCustomEvent', (('timestamp', 'uint'), ('length', 'uint'), ('name', 'string'), ('payload', 'string'))),
+    94: ('IOSUserID', (('timestamp', 'uint'), ('length', 'uint'), ('value', 'string'))),
+    95: ('IOSUserAnonymousID', (('timestamp', 'uint'), ('length', 'uint'), ('value', 'string'))),
+    96: ('IOSScreenChanges', (('timestamp', 'uint'), ('length', 'uint'), ('x', 'uint'), ('y', 'uint'), ('width', 'uint'), ('height', 'uint'))),
+    97: ('IOSCrash', (('timestamp', 'uint'), ('length', 'uint'), ('name', 'string'), ('reason', 'string'), ('stacktrace', 'string'))),
+    98: ('IOSScreenEnter', (('timestamp', 'uint'), ('length', 'uint'), ('title', 'string'), ('view_name', 'string'))),
+    99: ('IOSScreenLeave', (('timestamp', 'uint'), ('length', 'uint'), ('title', 'string'), ('view_name', 'string'))),
+    100: ('IOSClickEvent', (('timestamp', 'uint'), ('length', 'uint'), ('label', 'string'), ('x', 'uint'), ('y', 'uint'))),
+    101: ('IOSInputEvent', (('timestamp', 'uint'), ('length', 'uint'), ('value', 'string'), ('value_masked', 'boolean'), ('label', 'string'))),
+    102: ('IOSPerformanceEvent', (('timestamp', 'uint'), ('length', 'uint'), ('name', 'string'), ('value', 'uint'))),
+    103: ('IOSLog', (('timestamp', 'uint'), ('length', 'uint'), ('severity', 'string'), ('content', 'string'))),
+    104: ('IOSInternalError', (('timestamp', 'uint'), ('length', 'uint'), ('content', 'string'))),
+    105: ('IOSNetworkCall', (('timestamp', 'uint'), ('length', 'uint'), ('duration', 'uint'), ('headers', 'string'), ('body', 'string'), ('url', 'string'), ('success', 'boolean'), ('method', 'string'), ('status', 'uint'))),
+    110: ('IOSPerformanceAggregated', (('timestamp_start', 'uint'), ('timestamp_end', 'uint'), ('min_fps', 'uint'), ('avg_fps', 'uint'), ('max_fps', 'uint'), ('min_cpu', 'uint'), ('avg_cpu', 'uint'), ('max_cpu', 'uint'), ('min_memory', 'uint'), ('avg_memory', 'uint'), ('max_memory', 'uint'), ('min_battery', 'uint'), ('avg_battery', 'uint'), ('max_battery', 'uint'))),
+    111: ('IOSIssueEvent', (('timestamp', 'uint'), ('type', 'string'), ('context_string', 'string'), ('context', 'string'), ('payload', 'string'))),
+}
@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from db.models import Session
+import metrics
+
+
+class SessionCache:
+    """
+    Session rows being built by the consumer, keyed by session id.
+    Entries are kept in last-activity order, so that sessions which never sent a SessionEnd
+    can be evicted once they have been idle for `ttl` seconds, or, least recently active first,
+    when more than `max_size` sessions are live.
+    Stats: `size` (live sessions), `evicted_ttl` and `evicted_size` (sessions evicted so far),
+    every eviction is also counted by the connector_sessions_evicted_total metric.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._last_activity = dict()
+        self.evicted_ttl = 0
+        self.evicted_size = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: int) -> Optional[Session]:
+        return self._sessions.get(session_id)
+
+    def put(self, session_id: int, session: Session, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        self._last_activity[session_id] = now
+
+    def pop(self, session_id: int) -> Optional[Session]:
+        self._last_activity.pop(session_id, None)
+        return self._sessions.pop(session_id, None)
+
+    def discard(self, session_id: int, session: Session) -> None:
+        """
+        Removes the entry of a flushed session, unless it has been evicted since
+        and the session id now holds a new session
+        """
+        if self._sessions.get(session_id) is session:
+            self.pop(session_id)
+
+    def evict(self, now: Optional[float] = None) -> List[Session]:
+        """
+        Removes the idle sessions and the least recently active ones above max_size,
+        and returns them to be inserted as partial rows
+        """
+        if now is None:
+            now = time.time()
+        evicted = list()
+        sessions, last_activity = self._sessions, self._last_activity
+        deadline = now - self.ttl
+        while sessions:
+            session_id = next(iter(sessions))
+            if last_activity[session_id] < deadline:
+                self.evicted_ttl += 1
+                metrics.sessions_evicted.labels('ttl').inc()
+            elif len(sessions) > self.max_size:
+                self.evicted_size += 1
+                metrics.sessions_evicted.labels('size').inc()
+            else:
+                break
+            del last_activity[session_id]
+            evicted.append(sessions.pop(session_id))
+        return evicted
+
+    def stats(self) -> dict:
+        return {'size': self.size, 'evicted_ttl': self.evicted_ttl, 'evicted_size': self.evicted_size}
@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# the connector modules read their settings when imported
+os.environ.setdefault('DATABASE_NAME', 'pg')
+os.environ.setdefault('sessions_table', 'connector_user_sessions')
+os.environ.setdefault('events_table_name', 'connector_events')
+os.environ.setdefault('events_detailed_table_name', 'connector_events_detailed')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,20 @@
+import io
+
+from msgcodec.codec import Codec
+
+
+def test_read_boolean_from_matches_read_boolean_at_eof():
+    buf = b'\x01\x00'
+    for pos in range(len(buf) + 2):
+        reader = io.BytesIO(buf)
+        reader.seek(pos)
+        value, end = Codec.read_boolean_from(memoryview(buf), pos)
+        assert value == Codec.read_boolean(reader)
+        assert end == reader.tell()
+
+
+def test_read_boolean_from_truncated_buffer():
+    buf = memoryview(b'\x01')
+    assert Codec.read_boolean_from(buf, 0) == (True, 1)
+    assert Codec.read_boolean_from(buf, 1) == (False, 1)
+    assert Codec.read_boolean_from(memoryview(b''), 0) == (False, 0)
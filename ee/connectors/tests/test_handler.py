@@ -0,0 +1,23 @@
+from db.models import Base
+from handler import handle_session
+from msgcodec.messages import IssueEvent, PartitionedMessage
+
+
+def issue(type):
+    return IssueEvent(message_id=1, timestamp=1_700_000_000_000, type=type, context_string='', context='', payload='', url='')
+
+
+def test_issue_event_counts():
+    # the first issue of a session also counts as its first input, as it always has
+    session = handle_session(None, issue('crash'))
+    assert (session.issues_count, session.inputs_count) == (1, 1)
+
+    session = handle_session(session, issue('dead_click'))
+    assert (session.issues_count, session.inputs_count) == (2, 1)
+
+
+def test_session_updates_are_session_columns():
+    columns = set(Base.metadata.tables['connector_user_sessions'].columns.keys())
+    assert {'issues_count', 'inputs_count'} <= columns
+    # partition bookkeeping is per message, not per session
+    assert handle_session(None, PartitionedMessage(part_no=1, part_total=2)) is None
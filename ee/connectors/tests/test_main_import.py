@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+CONNECTORS = Path(__file__).resolve().parent.parent
+
+# importing main must not connect to anything (the warehouse connections are libpq ones)
+NO_NETWORK = """
+import socket
+import psycopg2
+opened = []
+def connect(*args, **kwargs):
+    opened.append((args, kwargs))
+    raise OSError("no connection in tests")
+socket.socket.connect = connect
+socket.create_connection = connect
+psycopg2.connect = connect
+import main
+assert not opened, f"connections opened while importing main: {opened}"
+"""
+
+
+def env_example(name):
+    env = dict()
+    for line in (CONNECTORS / 'deploy' / 'env-files' / name).read_text().splitlines():
+        key, sep, value = line.partition('=')
+        if sep:
+            env[key] = value.strip("'")
+    return env
+
+
+def main_env(level, events_mode):
+    return {**env_example('pg.env.example'), 'DATABASE_NAME': 'pg', 'level': level, 'events_mode': events_mode}
+
+
+@pytest.mark.parametrize('level,events_mode', [('normal', 'wide'), ('detailed', 'wide'), ('detailed', 'tables')])
+def test_main_imports(level, events_mode):
+    # main.py reads its settings when imported, each combination gets its own interpreter
+    pytest.importorskip('kafka')
+    result = subprocess.run([sys.executable, '-c', NO_NETWORK], cwd=CONNECTORS,
+                            env={**os.environ, **main_env(level, events_mode)}, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def uint(x):
+    out = bytearray()
+    while x >= 0x80:
+        out.append((x & 0x7f) | 0x80)
+        x >>= 7
+    out.append(x)
+    return bytes(out)
+
+
+def string(s):
+    return uint(len(s.encode())) + s.encode()
+
+
+@pytest.fixture
+def main(monkeypatch):
+    pytest.importorskip('kafka')
+    for key, value in main_env('normal', 'wide').items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.syspath_prepend(str(CONNECTORS))
+    import main
+    return main
+
+
+def test_main_decodes_records(main):
+    from msgcodec.messages import ConsoleLog, SessionEnd
+    from msgcodec.msgcodec import MessageCodec
+    from handler import handle_normal_message, handle_session
+
+    codec = MessageCodec()
+    message = main.decode_message(codec, uint(ConsoleLog.__id__) + string('error') + string('boom'))
+    assert isinstance(message, ConsoleLog)
+    assert (message.level, message.value) == ('error', 'boom')
+    assert handle_normal_message(message)['consolelog_value'] == 'boom'
+
+    message = main.decode_message(codec, uint(SessionEnd.__id__) + uint(1_700_000_000_000) + string('key'))
+    assert isinstance(message, SessionEnd)
+    assert handle_session(None, message).session_end_timestamp == 1_700_000_000_000
@@ -0,0 +1,45 @@
+from db.models import Session
+import metrics
+from session_cache import SessionCache
+
+
+def new_session(session_id):
+    session = Session()
+    session.sessionid = session_id
+    return session
+
+
+def evicted_total(reason):
+    return metrics.sessions_evicted.labels(reason)._value.get()
+
+
+def test_evictions_are_counted():
+    cache = SessionCache(max_size=1, ttl=10)
+    ttl, size = evicted_total('ttl'), evicted_total('size')
+    cache.put(1, new_session(1), now=0)
+    cache.put(2, new_session(2), now=5)
+    cache.put(3, new_session(3), now=6)
+
+    assert [s.sessionid for s in cache.evict(now=12)] == [1, 2]
+    assert (evicted_total('ttl') - ttl, evicted_total('size') - size) == (1, 1)
+    # a counter: the next evictions add up, whatever the cache stats
+    assert [s.sessionid for s in cache.evict(now=20)] == [3]
+    assert evicted_total('ttl') - ttl == 2
+
+
+def test_flush_keeps_session_recreated_after_eviction():
+    cache = SessionCache(max_size=10, ttl=10)
+    evicted = new_session(1)
+    cache.put(1, evicted, now=0)
+    sessions_batch = cache.evict(now=20)
+    assert sessions_batch == [evicted]
+
+    # more messages of the session arrive before the partial row is flushed
+    recreated = new_session(1)
+    cache.put(1, recreated, now=21)
+    for s in sessions_batch:
+        cache.discard(s.sessionid, s)
+    assert cache.get(1) is recreated
+
+    cache.discard(1, recreated)
+    assert cache.get(1) is None and len(cache) == 0
@@ -0,0 +1,78 @@
+import io
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from db.models import sessions_table_name
+from db.staging import ParquetStager
+
+BUCKET = 'connector-staging'
+
+
+@pytest.fixture
+def s3():
+    # S3-compatible stand-in for a MinIO container, reached through endpoint_url like MinIO
+    boto3 = pytest.importorskip('boto3')
+    server = pytest.importorskip('moto.server')
+    moto = server.ThreadedMotoServer(ip_address='127.0.0.1', port=0, verbose=False)
+    moto.start()
+    host, port = moto.get_host_and_port()
+    endpoint_url = f'http://{host}:{port}'
+    client = boto3.client('s3', endpoint_url=endpoint_url, aws_access_key_id='minio',
+                          aws_secret_access_key='minio123', region_name='us-east-1')
+    client.create_bucket(Bucket=BUCKET)
+    yield endpoint_url, client
+    moto.stop()
+
+
+@pytest.fixture
+def stager(s3, tmp_path):
+    endpoint_url, _ = s3
+    return ParquetStager(tmp_path, bucket=BUCKET, prefix='/staging/', endpoint_url=endpoint_url,
+                         aws_access_key_id='minio', aws_secret_access_key='minio123', region_name='us-east-1')
+
+
+def sessions_df():
+    return pd.DataFrame({'user_os': ['Linux', None], 'sessionid': [1, 2],
+                         'user_device_heap_size': pd.array([3, None], dtype='Int64')})
+
+
+def read_object(client, url):
+    key = url[len(f's3://{BUCKET}/'):]
+    return pq.read_table(io.BytesIO(client.get_object(Bucket=BUCKET, Key=key)['Body'].read()))
+
+
+def test_upload_url_and_cleanup(s3, stager):
+    _, client = s3
+    path = stager.write(sessions_df(), sessions_table_name)
+    url = stager.upload(path)
+    assert url == f's3://{BUCKET}/staging/{path.name}'
+    assert read_object(client, url).to_pandas()['sessionid'].tolist() == [1, 2]
+
+    stager.remove(path)
+    assert not path.exists()
+    assert client.list_objects_v2(Bucket=BUCKET).get('KeyCount', 0) == 0
+
+
+def test_redshift_copy_stages_the_table_columns_in_order(s3, stager, monkeypatch):
+    from db.loaders import redshift_loader
+    from db.models import Base
+
+    _, client = s3
+    monkeypatch.setenv('aws_access_key_id', 'minio')
+    monkeypatch.setenv('aws_secret_access_key', 'minio123')
+    monkeypatch.setattr(redshift_loader, 'stager', stager, raising=False)
+    staged = []
+
+    class Redshift:
+        @staticmethod
+        def exec_commit(query):
+            # COPY ... FROM '<url>' ...: the staged file is still there while Redshift reads it
+            staged.append(read_object(client, query.split("'")[1]))
+
+    redshift_loader.staged_insert_df(Redshift, sessions_df(), sessions_table_name)
+    table_columns = [column.name for column in Base.metadata.tables[sessions_table_name].columns]
+    assert staged[0].column_names == table_columns
+    assert staged[0].to_pandas()['user_os'].tolist() == ['Linux', None]
+    assert client.list_objects_v2(Bucket=BUCKET).get('KeyCount', 0) == 0
@@ -1,77 +1,29 @@
 from decouple import config
-from confluent_kafka import Consumer
+from confluent_kafka import Consumer, TopicPartition
 from datetime import datetime
+from functools import partial
 import os as _os
-import queue
-import requests
 import json
+import time
 
-
-from time import time, sleep
+from dedup import DedupWindow, message_key
+from ingest import QuickwitIngestClient
+import metrics
+from serializer import write_ndjson
 
 
 #decryption = config('encrypted', cast=bool)
 decryption = False
 MessageCodec = None
-max_retry=3
-Fetch, FetchEvent, PageEvent, GraphQ = None, None, None, None
+Fetch, PageEvent, GraphQL = None, None, None
 if decryption:
     from msgcodec.msgcodec import MessageCodec
-    from msgcodec.messages import Fetch, FetchEvent, PageEvent, GraphQL
+    from msgcodec.messages import Fetch, PageEvent, GraphQL
     print("Enabled decryption mode")
 
-def _quickwit_ingest(index, data_list, retry=0):
-    try:
-        res = requests.post(f'http://localhost:7280/api/v1/{index}/ingest', data=__jsonify_data(data_list, index))
-    except requests.exceptions.ConnectionError as e:
-        retry += 1
-        assert retry <= max_retry, f'[ENDPOINT CONNECTION FAIL] Failed to connect to endpoint http://localhost:7280/api/v1/{index}/ingest\n{e}\n'
-        sleep(5*retry)
-        print(f"[ENDPOINT ERROR] Failed to connect to endpoint http://localhost:7280/api/v1/{index}/ingest, retrying in {5*retry} seconds..\n")
-        return _quickwit_ingest(index, data_list, retry=retry)
-    return res
-
-def __jsonify_data(data_list, msg_type):
-    res = list()
-    i = 0
-    for data in data_list:
-        if msg_type == 'fetchevent':
-            try:
-                _tmp = data['request']
-                if _tmp != '':
-                    data['request'] = json.loads(_tmp)
-                else:
-                    data['request'] = {}
-                _tmp = data['response']
-                if _tmp != '':
-                    data['response'] = json.loads(_tmp)
-                    if data['response']['body'][:1] == '{' or data['response']['body'][:2] == '[{':
-                        data['response']['body'] = json.loads(data['response']['body'])
-                else:
-                    data['response'] = {}
-            except Exception as e:
-                print(f'Error {e}\tWhile decoding fetchevent\nEvent: {data}\n')
-        elif msg_type == 'graphql':
-            try:
-                _tmp = data['variables']
-                if _tmp != '':
-                    data['variables'] = json.loads(_tmp)
-                else:
-                    data['variables'] = {}
-                _tmp = data['response']
-                if _tmp != '':
-                    data['response'] = json.loads(_tmp)
-                else:
-                    data['response'] = {}
-            except Exception as e:
-                print(f'Error {e}\tWhile decoding graphql\nEvent: {data}\n')
-        i += 1
-        res.append(json.dumps(data))
-    return '\n'.join(res)
-
 def message_type(message):
     if decryption:
-        if isinstance(message, FetchEvent) or isinstance(Fetch):
+        if isinstance(message, Fetch):
             return 'fetchevent'
         elif isinstance(message, PageEvent):
             return 'pageevent'
@@ -99,6 +51,8 @@ class KafkaFilter():
         fetchevent_maxsize = config('fetch_maxsize', default=100, cast=int)
         graphql_maxsize = config('graphql_maxsize', default=100, cast=int)
         pageevent_maxsize = config('pageevent_maxsize', default=100, cast=int)
+        # request / response bodies longer than this are truncated and sent as text
+        max_field_size = config('max_field_size', default=1_000_000, cast=int)
 
         if decryption:
             self.codec = MessageCodec()
@@ -119,71 +73,90 @@ class KafkaFilter():
                 "enable.auto.commit": False
             })
         self.consumer.subscribe([topic])
-        self.queues = {'fetchevent': queue.Queue(fetchevent_maxsize),
-                'graphql': queue.Queue(graphql_maxsize),
-                'pageevent': queue.Queue(pageevent_maxsize)
-                }
-
-    def add_to_queue(self, message):
+        self.ingest = QuickwitIngestClient(config('quickwit_url', default='http://localhost:7280'),
+                                           serialize=partial(write_ndjson, max_field_size=max_field_size),
+                                           max_docs={'fetchevent': fetchevent_maxsize,
+                                                     'graphql': graphql_maxsize,
+                                                     'pageevent': pageevent_maxsize},
+                                           max_bytes=config('ingest_max_bytes', default=5_000_000, cast=int),
+                                           max_age=config('ingest_max_age', default=5, cast=float),
+                                           max_in_flight=config('ingest_in_flight', default=4, cast=int),
+                                           # gzip bodies need a Quickwit version decoding Content-Encoding on /ingest
+                                           compress=config('ingest_gzip', default=False, cast=bool),
+                                           dead_letter_dir=config('ingest_dead_letter_dir',
+                                                                  default='/tmp/quickwit_dead_letter'))
+        # messages already sent, to drop Kafka redeliveries
+        self.dedup = DedupWindow(max_size=config('dedup_max_size', default=1_000_000, cast=int),
+                                 ttl=config('dedup_ttl', default=3600, cast=float))
+        self.stats_interval = config('stats_interval', default=60, cast=float)
+        self.stats_printed_at = 0
+        # next offset to read of every partition, and the last committed ones
+        self.polled = dict()
+        self.committed = dict()
+
+    def add_to_queue(self, message, size=0, partition=None, offset=None, rank=0):
         associated_queue = message_type(message)
         if associated_queue == 'default':
             return
-        if self.queues[associated_queue].full():
-            self.flush_to_quickwit()
-        self.queues[associated_queue].put(message)
-
-    def flush_to_quickwit(self):
-        for queue_name, _queue in self.queues.items():
-            _list = list()
-            unix_timestamp = int(datetime.now().timestamp())
-            while not _queue.empty():
-                msg = _queue.get()
-                if decryption:
-                    value = msg.__dict__
-                else:
-                    value = dict(msg)
-                value['insertion_timestamp'] = unix_timestamp
-                if queue_name == 'fetchevent' and 'message_id' not in value.keys():
-                    value['message_id'] = 0
-                _list.append(value)
-            if len(_list) > 0:
-                _quickwit_ingest(queue_name, _list)
-        self.consumer.commit()
+        if decryption:
+            value = message.to_dict()
+        else:
+            value = dict(message)
+        metrics.messages_decoded.labels(associated_queue).inc()
+        if self.dedup.seen(message_key(associated_queue, value, (partition, offset, rank))):
+            metrics.duplicates.labels(associated_queue).inc()
+            return
+        value['insertion_timestamp'] = int(datetime.now().timestamp())
+        if associated_queue == 'fetchevent' and 'message_id' not in value.keys():
+            value['message_id'] = 0
+        self.ingest.add(associated_queue, value, size=size, partition=partition, offset=offset)
+
+    def commit(self):
+        # only the offsets of the messages whose documents were all acknowledged by quickwit
+        offsets = [TopicPartition(topic, partition, offset)
+                   for (topic, partition), offset in self.ingest.committable(self.polled).items()
+                   if offset > self.committed.get((topic, partition), -1)]
+        if offsets:
+            self.consumer.commit(offsets=offsets, asynchronous=False)
+            for tp in offsets:
+                self.committed[(tp.topic, tp.partition)] = tp.offset
+
+    def print_stats(self, now):
+        if now - self.stats_printed_at >= self.stats_interval:
+            print(f'[DEDUP] {self.dedup.stats()}')
+            self.stats_printed_at = now
 
     def run(self):
-        _tmp_previous = None
-        repeated = False
+        metrics.serve()
         while True:
+            self.ingest.flush_due()
+            self.commit()
+            self.print_stats(time.time())
             msg = self.consumer.poll(1.0)
             if msg is None:
                 continue
             if msg.error():
                 print(f'[Consumer error] {msg.error()}')
+                metrics.errors.labels('consumer', msg.error().name()).inc()
                 continue
+            _, high = self.consumer.get_watermark_offsets(TopicPartition(msg.topic(), msg.partition()), cached=True)
+            metrics.observe_lag(msg.topic(), msg.partition(), msg.offset(), high)
+            start = time.perf_counter()
             value = json.loads(msg.value().decode('utf-8'))
             if decryption:
                 messages = self.codec.decode_detailed(value)
             else:
                 messages = [value]
+            metrics.decode_seconds.observe(time.perf_counter() - start)
 
-            if _tmp_previous is None:
-                _tmp_previous = messages
-                if type(messages)==list:
-                    for message in messages:
-                        self.add_to_queue(message)
-                else:
-                    self.add_to_queue(messages)
-            elif _tmp_previous != messages:
-                if type(messages)==list:
-                    for message in messages:
-                        self.add_to_queue(message)
-                else:
-                    self.add_to_queue(messages)
-                _tmp_previous = messages
-                repeated = False
-            elif not repeated:
-                repeated = True
-
+            partition = (msg.topic(), msg.partition())
+            if type(messages) == list:
+                size = len(msg.value()) // max(len(messages), 1)
+                for rank, message in enumerate(messages):
+                    self.add_to_queue(message, size, partition, msg.offset(), rank)
+            else:
+                self.add_to_queue(messages, len(msg.value()), partition, msg.offset())
+            self.polled[partition] = msg.offset() + 1
 
 if __name__ == '__main__':
     layer = KafkaFilter()
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class DedupWindow:
+    """
+    Keys of the documents sent during the last `ttl` seconds, at most `max_size` of them,
+    used to drop the messages Kafka delivers again (after a rebalance or a failed commit).
+    Keys are kept in insertion order, so expired ones are removed from the front in O(1).
+    Counters: `duplicates` (messages suppressed), `expired` and `evicted` (keys dropped by age / by size).
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._seen = OrderedDict()
+        self.duplicates = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def seen(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """
+        Returns True if `key` was already seen within the window, otherwise remembers it
+        """
+        if now is None:
+            now = time.time()
+        self._expire(now)
+        if key in self._seen:
+            self.duplicates += 1
+            return True
+        self._seen[key] = now
+        if len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+            self.evicted += 1
+        return False
+
+    def _expire(self, now: float) -> None:
+        seen = self._seen
+        deadline = now - self.ttl
+        while seen:
+            key, added_at = next(iter(seen.items()))
+            if added_at >= deadline:
+                break
+            del seen[key]
+            self.expired += 1
+
+    def stats(self) -> dict:
+        return {'size': len(self._seen), 'duplicates': self.duplicates,
+                'expired': self.expired, 'evicted': self.evicted}
+
+
+def message_key(index: str, value: dict, position: tuple) -> tuple:
+    """
+    Identity of a message: its session and message id / timestamp when it carries them,
+    otherwise its Kafka position ((topic, partition), offset, rank in the Kafka message),
+    which still matches the redeliveries of the same record
+    """
+    message_id, timestamp = value.get('message_id'), value.get('timestamp')
+    if value.get('session_id') is not None and (message_id or timestamp is not None):
+        return index, value['session_id'], message_id, timestamp
+    return (index,) + position
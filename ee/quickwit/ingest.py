@@ -0,0 +1,172 @@
+import gzip
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+
+class IngestRejectedError(Exception):
+    """
+    Quickwit refused the documents (4xx other than 429): resending them would not help
+    """
+
+
+class _Buffer:
+    __slots__ = ('docs', 'size', 'started_at', 'offsets')
+
+    def __init__(self, now):
+        self.docs = list()
+        self.size = 0
+        self.started_at = now
+        # lowest Kafka offset of the buffered documents, per partition
+        self.offsets = dict()
+
+
+class QuickwitIngestClient:
+    """
+    Buffers documents per index and sends them to the Quickwit ingest API.
+    `serialize(docs, index, out)` writes the NDJSON body of a request into the binary file `out`.
+    Each index is flushed on its own, once it holds `max_docs[index]` documents, about `max_bytes` bytes,
+    or once its first document is `max_age` seconds old. Up to `max_in_flight` requests are sent
+    concurrently over a keep-alive connection pool, with gzip bodies if `compress`.
+    Failing requests are retried from the sending thread; a request still failing after `retries` attempts
+    is raised by the next call to `flush_due` or `committable`, its documents are never acknowledged.
+    Documents rejected by Quickwit (4xx other than 429) would be rejected again: they are written to
+    `dead_letter_dir` as NDJSON files and counted, and their offsets are committed.
+    """
+
+    def __init__(self, url, serialize, max_docs=None, max_bytes=0, max_age=5.0, max_in_flight=4,
+                 compress=False, retries=3, retry_delay=5.0, dead_letter_dir=''):
+        self.url = url.rstrip('/')
+        self.serialize = serialize
+        self.max_docs = max_docs or dict()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.max_in_flight = max_in_flight
+        self.compress = compress
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.dead_letter_dir = dead_letter_dir
+        if dead_letter_dir:
+            os.makedirs(dead_letter_dir, exist_ok=True)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='quickwit-ingest')
+        self._buffers = dict()
+        self._in_flight = list()
+
+    def add(self, index, doc, size=0, partition=None, offset=None):
+        buffer = self._buffers.get(index)
+        if buffer is None:
+            buffer = self._buffers[index] = _Buffer(time.time())
+        buffer.docs.append(doc)
+        buffer.size += size
+        if partition is not None:
+            buffer.offsets.setdefault(partition, offset)
+        if len(buffer.docs) >= self.max_docs.get(index, 100) or (self.max_bytes and buffer.size >= self.max_bytes):
+            self.flush(index)
+
+    def flush(self, index):
+        buffer = self._buffers.pop(index, None)
+        if buffer is None or not buffer.docs:
+            return
+        while len(self._in_flight) >= self.max_in_flight:
+            wait([future for future, _ in self._in_flight], return_when=FIRST_COMPLETED)
+            self._reap()
+        self._in_flight.append((self._executor.submit(self._ingest, index, buffer.docs), buffer.offsets))
+
+    def flush_due(self, now=None):
+        if now is None:
+            now = time.time()
+        for index in [index for index, buffer in self._buffers.items() if now - buffer.started_at >= self.max_age]:
+            self.flush(index)
+        self._reap()
+
+    def flush_all(self):
+        for index in list(self._buffers):
+            self.flush(index)
+        wait([future for future, _ in self._in_flight])
+        self._reap()
+
+    def committable(self, polled: dict) -> dict:
+        """
+        Given the next offset polled of every partition, returns the offsets that can be committed:
+        below the lowest offset of the documents still buffered or in flight
+        """
+        self._reap()
+        pending = dict()
+        for offsets in chain((b.offsets for b in self._buffers.values()), (o for _, o in self._in_flight)):
+            for partition, offset in offsets.items():
+                if offset < pending.get(partition, offset + 1):
+                    pending[partition] = offset
+        return {partition: pending.get(partition, offset) for partition, offset in polled.items()}
+
+    def _reap(self):
+        in_flight = list()
+        for future, offsets in self._in_flight:
+            if not future.done():
+                in_flight.append((future, offsets))
+            elif future.exception() is not None:
+                raise RuntimeError("Quickwit ingest failed") from future.exception()
+        self._in_flight = in_flight
+
+    def _ingest(self, index, docs):
+        start = time.perf_counter()
+        try:
+            res = self._send(index, docs)
+        except IngestRejectedError as e:
+            metrics.count_error('ingest', e)
+            metrics.docs_rejected.labels(index).inc(len(docs))
+            print(f'[INGEST ERROR] {e}, dead-lettered to {self._dead_letter(index, docs)}')
+            return None
+        except Exception as e:
+            metrics.count_error('ingest', e)
+            raise
+        metrics.flush_seconds.labels(index).observe(time.perf_counter() - start)
+        metrics.docs_written.labels(index).inc(len(docs))
+        return res
+
+    def _dead_letter(self, index, docs):
+        if not self.dead_letter_dir:
+            return None
+        path = os.path.join(self.dead_letter_dir, f'{time.time_ns():020d}-{index}.ndjson')
+        with open(path + '.tmp', 'wb') as out:
+            self.serialize(docs, index, out)
+        os.replace(path + '.tmp', path)
+        return path
+
+    def _send(self, index, docs):
+        # the documents are serialized straight into the (compressed) request body
+        buffer = io.BytesIO()
+        headers = {'Content-Type': 'application/x-ndjson'}
+        if self.compress:
+            with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=5) as out:
+                self.serialize(docs, index, out)
+            headers['Content-Encoding'] = 'gzip'
+        else:
+            self.serialize(docs, index, buffer)
+        body = buffer.getvalue()
+        endpoint = f'{self.url}/api/v1/{index}/ingest'
+        for attempt in range(1, self.retries + 1):
+            try:
+                res = self.session.post(endpoint, data=body, headers=headers)
+                if res.ok:
+                    return res
+                if res.status_code < 500 and res.status_code != 429:
+                    raise IngestRejectedError(f'{endpoint} rejected {len(docs)} documents: {res.status_code} {res.text}')
+                print(f'[ENDPOINT ERROR] {endpoint} answered {res.status_code}, attempt {attempt}/{self.retries}')
+                metrics.errors.labels('ingest', f'HTTP {res.status_code}').inc()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                metrics.count_error('ingest', e)
+                print(f'[ENDPOINT ERROR] Failed to connect to endpoint {endpoint}, attempt {attempt}/{self.retries}\n{e}')
+            if attempt < self.retries:
+                time.sleep(self.retry_delay * attempt)
+        raise ConnectionError(f'[ENDPOINT CONNECTION FAIL] {endpoint} failed {self.retries} times')
@@ -0,0 +1,33 @@
+from decouple import config
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+# port of the Prometheus endpoint, 0 disables it
+METRICS_PORT = config('metrics_port', default=0, cast=int)
+
+messages_decoded = Counter('quickwit_messages_decoded_total', 'Messages decoded, per index', ['index'])
+duplicates = Counter('quickwit_duplicates_total', 'Messages dropped as Kafka redeliveries, per index', ['index'])
+decode_seconds = Histogram('quickwit_decode_seconds', 'Decoding time of a Kafka message',
+                           buckets=(.0001, .00025, .0005, .001, .0025, .005, .01, .025, .05, .1, .25, 1))
+flush_seconds = Histogram('quickwit_flush_seconds', 'Time of an ingest request (retries included), per index',
+                          ['index'], buckets=(.01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60))
+docs_written = Counter('quickwit_docs_written_total', 'Documents accepted by Quickwit, per index', ['index'])
+docs_rejected = Counter('quickwit_docs_rejected_total', 'Documents rejected by Quickwit and dead-lettered, per index',
+                        ['index'])
+errors = Counter('quickwit_errors_total', 'Errors, per stage and exception class', ['stage', 'error'])
+consumer_lag = Gauge('quickwit_consumer_lag', 'Messages left after the last one read, per partition',
+                     ['topic', 'partition'])
+
+
+def serve():
+    if METRICS_PORT:
+        start_http_server(METRICS_PORT)
+
+
+def count_error(stage: str, e: BaseException) -> None:
+    errors.labels(stage, type(e).__name__).inc()
+
+
+def observe_lag(topic, partition, offset: int, high: int) -> None:
+    # high: the partition high watermark, negative when not known yet
+    if high is not None and high >= 0:
+        consumer_lag.labels(topic, str(partition)).set(max(high - offset - 1, 0))
@@ -1,27 +1,29 @@
-"""
-Representations of Kafka messages
-"""
+# Auto-generated, do not edit
+
 from abc import ABC
+from collections import namedtuple
 
 
 class Message(ABC):
-    pass
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
 
-class Timestamp(Message):
+class Timestamp(namedtuple('Timestamp', ['timestamp']), Message):
+    __slots__ = ()
     __id__ = 0
 
-    def __init__(self, timestamp):
-        self.timestamp = timestamp
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class SessionStart(Message):
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_agent', 'user_os', 'user_os_version', 'user_browser', 'user_browser_version', 'user_device', 'user_device_type', 'user_device_memory_size', 'user_device_heap_size', 'user_country', 'user_id')
     __id__ = 1
 
-    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid,
-                 user_agent, user_os, user_os_version, user_browser, user_browser_version,
-                 user_device, user_device_type, user_device_memory_size, user_device_heap_size,
-                 user_country):
+    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_agent, user_os, user_os_version, user_browser, user_browser_version, user_device, user_device_type, user_device_memory_size, user_device_heap_size, user_country, user_id):
         self.timestamp = timestamp
         self.project_id = project_id
         self.tracker_version = tracker_version
@@ -37,24 +39,19 @@ class SessionStart(Message):
         self.user_device_memory_size = user_device_memory_size
         self.user_device_heap_size = user_device_heap_size
         self.user_country = user_country
+        self.user_id = user_id
 
 
-class SessionDisconnect(Message):
-    __id__ = 2
-
-    def __init__(self, timestamp):
-        self.timestamp = timestamp
-
-
-class SessionEnd(Message):
+class SessionEndDeprecated(Message):
+    __slots__ = ('timestamp',)
     __id__ = 3
-    __name__ = 'SessionEnd'
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
 
 
 class SetPageLocation(Message):
+    __slots__ = ('url', 'referrer', 'navigation_start')
     __id__ = 4
 
     def __init__(self, url, referrer, navigation_start):
@@ -64,6 +61,7 @@ class SetPageLocation(Message):
 
 
 class SetViewportSize(Message):
+    __slots__ = ('width', 'height')
     __id__ = 5
 
     def __init__(self, width, height):
@@ -72,6 +70,7 @@ class SetViewportSize(Message):
 
 
 class SetViewportScroll(Message):
+    __slots__ = ('x', 'y')
     __id__ = 6
 
     def __init__(self, x, y):
@@ -80,21 +79,27 @@ class SetViewportScroll(Message):
 
 
 class CreateDocument(Message):
+    __slots__ = ()
     __id__ = 7
 
+    def __init__(self, ):
+        pass
+
 
 class CreateElementNode(Message):
+    __slots__ = ('id', 'parent_id', 'index', 'tag', 'svg')
     __id__ = 8
 
     def __init__(self, id, parent_id, index, tag, svg):
         self.id = id
-        self.parent_id = parent_id,
+        self.parent_id = parent_id
         self.index = index
         self.tag = tag
         self.svg = svg
 
 
 class CreateTextNode(Message):
+    __slots__ = ('id', 'parent_id', 'index')
     __id__ = 9
 
     def __init__(self, id, parent_id, index):
@@ -104,6 +109,7 @@ class CreateTextNode(Message):
 
 
 class MoveNode(Message):
+    __slots__ = ('id', 'parent_id', 'index')
     __id__ = 10
 
     def __init__(self, id, parent_id, index):
@@ -113,6 +119,7 @@ class MoveNode(Message):
 
 
 class RemoveNode(Message):
+    __slots__ = ('id',)
     __id__ = 11
 
     def __init__(self, id):
@@ -120,73 +127,82 @@ class RemoveNode(Message):
 
 
 class SetNodeAttribute(Message):
+    __slots__ = ('id', 'name', 'value')
     __id__ = 12
 
-    def __init__(self, id, name: str, value: str):
+    def __init__(self, id, name, value):
         self.id = id
         self.name = name
         self.value = value
 
 
 class RemoveNodeAttribute(Message):
+    __slots__ = ('id', 'name')
     __id__ = 13
 
-    def __init__(self, id, name: str):
+    def __init__(self, id, name):
         self.id = id
         self.name = name
 
 
 class SetNodeData(Message):
+    __slots__ = ('id', 'data')
     __id__ = 14
 
-    def __init__(self, id, data: str):
+    def __init__(self, id, data):
         self.id = id
         self.data = data
 
 
 class SetCSSData(Message):
+    __slots__ = ('id', 'data')
     __id__ = 15
 
-    def __init__(self, id, data: str):
+    def __init__(self, id, data):
         self.id = id
         self.data = data
 
 
 class SetNodeScroll(Message):
+    __slots__ = ('id', 'x', 'y')
     __id__ = 16
 
-    def __init__(self, id, x: int, y: int):
+    def __init__(self, id, x, y):
         self.id = id
         self.x = x
         self.y = y
 
 
 class SetInputTarget(Message):
+    __slots__ = ('id', 'label')
     __id__ = 17
 
-    def __init__(self, id, label: str):
+    def __init__(self, id, label):
         self.id = id
         self.label = label
 
 
 class SetInputValue(Message):
+    __slots__ = ('id', 'value', 'mask')
     __id__ = 18
 
-    def __init__(self, id, value: str, mask: int):
+    def __init__(self, id, value, mask):
         self.id = id
         self.value = value
         self.mask = mask
 
 
 class SetInputChecked(Message):
+    __slots__ = ('id', 'checked')
     __id__ = 19
 
-    def __init__(self, id, checked: bool):
+    def __init__(self, id, checked):
         self.id = id
         self.checked = checked
 
 
 class MouseMove(Message):
+    __slots__ = ('x', 'y')
     __id__ = 20
 
     def __init__(self, x, y):
@@ -194,29 +210,35 @@ class MouseMove(Message):
         self.y = y
 
 
-class MouseClickDepricated(Message):
+class NetworkRequest(Message):
+    __slots__ = ('type', 'method', 'url', 'request', 'response', 'status', 'timestamp', 'duration')
     __id__ = 21
 
-    def __init__(self, id, hesitation_time, label: str):
-        self.id = id
-        self.hesitation_time = hesitation_time
-        self.label = label
+    def __init__(self, type, method, url, request, response, status, timestamp, duration):
+        self.type = type
+        self.method = method
+        self.url = url
+        self.request = request
+        self.response = response
+        self.status = status
+        self.timestamp = timestamp
+        self.duration = duration
 
 
 class ConsoleLog(Message):
+    __slots__ = ('level', 'value')
     __id__ = 22
 
-    def __init__(self, level: str, value: str):
+    def __init__(self, level, value):
         self.level = level
         self.value = value
 
 
 class PageLoadTiming(Message):
+    __slots__ = ('request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint')
     __id__ = 23
 
-    def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start,
-                 dom_content_loaded_event_end, load_event_start, load_event_end,
-                 first_paint, first_contentful_paint):
+    def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint):
         self.request_start = request_start
         self.response_start = response_start
         self.response_end = response_end
@@ -229,6 +251,7 @@ class PageLoadTiming(Message):
 
 
 class PageRenderTiming(Message):
+    __slots__ = ('speed_index', 'visually_complete', 'time_to_interactive')
     __id__ = 24
 
     def __init__(self, speed_index, visually_complete, time_to_interactive):
@@ -236,20 +259,22 @@ class PageRenderTiming(Message):
         self.visually_complete = visually_complete
         self.time_to_interactive = time_to_interactive
 
-class JSException(Message):
+
+class JSExceptionDeprecated(Message):
+    __slots__ = ('name', 'message', 'payload')
     __id__ = 25
 
-    def __init__(self, name: str, message: str, payload: str):
+    def __init__(self, name, message, payload):
         self.name = name
         self.message = message
         self.payload = payload
 
 
-class RawErrorEvent(Message):
+class IntegrationEvent(Message):
+    __slots__ = ('timestamp', 'source', 'name', 'message', 'payload')
     __id__ = 26
 
-    def __init__(self, timestamp, source: str, name: str, message: str,
-                 payload: str):
+    def __init__(self, timestamp, source, name, message, payload):
         self.timestamp = timestamp
         self.source = source
         self.name = name
@@ -257,78 +282,53 @@ class RawErrorEvent(Message):
         self.payload = payload
 
 
-class RawCustomEvent(Message):
+class CustomEvent(Message):
+    __slots__ = ('name', 'payload')
     __id__ = 27
 
-    def __init__(self, name: str, payload: str):
+    def __init__(self, name, payload):
         self.name = name
         self.payload = payload
 
 
 class UserID(Message):
+    __slots__ = ('id',)
     __id__ = 28
 
-    def __init__(self, id: str):
+    def __init__(self, id):
         self.id = id
 
 
 class UserAnonymousID(Message):
+    __slots__ = ('id',)
     __id__ = 29
 
-    def __init__(self, id: str):
+    def __init__(self, id):
         self.id = id
 
 
 class Metadata(Message):
+    __slots__ = ('key', 'value')
     __id__ = 30
 
-    def __init__(self, key: str, value: str):
+    def __init__(self, key, value):
         self.key = key
         self.value = value
 
 
-class PerformanceTrack(Message):
-    __id__ = 49
-
-    def __init__(self, frames: int, ticks: int, total_js_heap_size,
-                 used_js_heap_size):
-        self.frames = frames
-        self.ticks = ticks
-        self.total_js_heap_size = total_js_heap_size
-        self.used_js_heap_size = used_js_heap_size
-
-
-class PageEvent(Message):
+class PageEvent(namedtuple('PageEvent', ['message_id', 'timestamp', 'url', 'referrer', 'loaded', 'request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint', 'speed_index', 'visually_complete', 'time_to_interactive']), Message):
+    __slots__ = ()
     __id__ = 31
 
-    def __init__(self, message_id, timestamp, url: str, referrer: str,
-                 loaded: bool, request_start, response_start, response_end,
-                 dom_content_loaded_event_start, dom_content_loaded_event_end,
-                 load_event_start, load_event_end, first_paint, first_contentful_paint,
-                 speed_index, visually_complete, time_to_interactive):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.url = url
-        self.referrer = referrer
-        self.loaded = loaded
-        self.request_start = request_start
-        self.response_start = response_start
-        self.response_end = response_end
-        self.dom_content_loaded_event_start = dom_content_loaded_event_start
-        self.dom_content_loaded_event_end = dom_content_loaded_event_end
-        self.load_event_start = load_event_start
-        self.load_event_end = load_event_end
-        self.first_paint = first_paint
-        self.first_contentful_paint = first_contentful_paint
-        self.speed_index = speed_index
-        self.visually_complete = visually_complete
-        self.time_to_interactive = time_to_interactive
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class InputEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'value', 'value_masked', 'label')
     __id__ = 32
 
-    def __init__(self, message_id, timestamp, value: str, value_masked: bool, label: str):
+    def __init__(self, message_id, timestamp, value, value_masked, label):
         self.message_id = message_id
         self.timestamp = timestamp
         self.value = value
@@ -337,33 +337,22 @@ class InputEvent(Message):
 
 
 class ClickEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'hesitation_time', 'label', 'selector')
     __id__ = 33
 
-    def __init__(self, message_id, timestamp, hesitation_time, label: str):
+    def __init__(self, message_id, timestamp, hesitation_time, label, selector):
         self.message_id = message_id
         self.timestamp = timestamp
         self.hesitation_time = hesitation_time
         self.label = label
-
-
-class ErrorEvent(Message):
-    __id__ = 34
-
-    def __init__(self, message_id, timestamp, source: str, name: str, message: str,
-                 payload: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.source = source
-        self.name = name
-        self.message = message
-        self.payload = payload
+        self.selector = selector
 
 
 class ResourceEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'type', 'success', 'method', 'status')
     __id__ = 35
 
-    def __init__(self, message_id, timestamp, duration, ttfb, header_size, encoded_body_size,
-                 decoded_body_size, url: str, type: str, success: bool, method: str, status):
+    def __init__(self, message_id, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, type, success, method, status):
         self.message_id = message_id
         self.timestamp = timestamp
         self.duration = duration
@@ -378,26 +367,18 @@ class ResourceEvent(Message):
         self.status = status
 
 
-class CustomEvent(Message):
-    __id__ = 36
-
-    def __init__(self, message_id, timestamp, name: str, payload: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.name = name
-        self.payload = payload
-
-
 class CSSInsertRule(Message):
+    __slots__ = ('id', 'rule', 'index')
     __id__ = 37
 
-    def __init__(self, id, rule: str, index):
+    def __init__(self, id, rule, index):
         self.id = id
         self.rule = rule
         self.index = index
 
 
 class CSSDeleteRule(Message):
+    __slots__ = ('id', 'index')
     __id__ = 38
 
     def __init__(self, id, index):
@@ -406,10 +387,10 @@ class CSSDeleteRule(Message):
 
 
 class Fetch(Message):
+    __slots__ = ('method', 'url', 'request', 'response', 'status', 'timestamp', 'duration')
     __id__ = 39
 
-    def __init__(self, method: str, url: str, request: str, response: str, status,
-                 timestamp, duration):
+    def __init__(self, method, url, request, response, status, timestamp, duration):
         self.method = method
         self.url = url
         self.request = request
@@ -420,9 +401,10 @@ class Fetch(Message):
 
 
 class Profiler(Message):
+    __slots__ = ('name', 'duration', 'args', 'result')
     __id__ = 40
 
-    def __init__(self, name: str, duration, args: str, result: str):
+    def __init__(self, name, duration, args, result):
         self.name = name
         self.duration = duration
         self.args = args
@@ -430,68 +412,65 @@ class Profiler(Message):
 
 
 class OTable(Message):
+    __slots__ = ('key', 'value')
     __id__ = 41
 
-    def __init__(self, key: str, value: str):
+    def __init__(self, key, value):
         self.key = key
         self.value = value
 
 
 class StateAction(Message):
+    __slots__ = ('type',)
     __id__ = 42
 
-    def __init__(self, type: str):
-        self.type = type
-
-
-class StateActionEvent(Message):
-    __id__ = 43
-
-    def __init__(self, message_id, timestamp, type: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
+    def __init__(self, type):
         self.type = type
 
 
 class Redux(Message):
+    __slots__ = ('action', 'state', 'duration')
     __id__ = 44
 
-    def __init__(self, action: str, state: str, duration):
+    def __init__(self, action, state, duration):
         self.action = action
         self.state = state
         self.duration = duration
 
 
 class Vuex(Message):
+    __slots__ = ('mutation', 'state')
     __id__ = 45
 
-    def __init__(self, mutation: str, state: str):
+    def __init__(self, mutation, state):
         self.mutation = mutation
         self.state = state
 
 
 class MobX(Message):
+    __slots__ = ('type', 'payload')
     __id__ = 46
 
-    def __init__(self, type: str, payload: str):
+    def __init__(self, type, payload):
         self.type = type
         self.payload = payload
 
 
 class NgRx(Message):
+    __slots__ = ('action', 'state', 'duration')
     __id__ = 47
 
-    def __init__(self, action: str, state: str, duration):
+    def __init__(self, action, state, duration):
         self.action = action
         self.state = state
         self.duration = duration
 
 
 class GraphQL(Message):
+    __slots__ = ('operation_kind', 'operation_name', 'variables', 'response')
     __id__ = 48
 
-    def __init__(self, operation_kind: str, operation_name: str,
-                 variables: str, response: str):
+    def __init__(self, operation_kind, operation_name, variables, response):
         self.operation_kind = operation_kind
         self.operation_name = operation_name
         self.variables = variables
@@ -499,41 +478,37 @@ class GraphQL(Message):
 
 
 class PerformanceTrack(Message):
+    __slots__ = ('frames', 'ticks', 'total_js_heap_size', 'used_js_heap_size')
     __id__ = 49
 
-    def __init__(self, frames: int, ticks: int,
-                 total_js_heap_size, used_js_heap_size):
+    def __init__(self, frames, ticks, total_js_heap_size, used_js_heap_size):
         self.frames = frames
         self.ticks = ticks
         self.total_js_heap_size = total_js_heap_size
         self.used_js_heap_size = used_js_heap_size
 
 
-class GraphQLEvent(Message):
+class StringDict(Message):
+    __slots__ = ('key', 'value')
     __id__ = 50
 
-    def __init__(self, message_id, timestamp, name: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.name = name
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
 
 
-class FetchEvent(Message):
+class SetNodeAttributeDict(Message):
+    __slots__ = ('id', 'name_key', 'value_key')
     __id__ = 51
 
-    def __init__(self, message_id, timestamp, method: str, url, request, response: str,
-                  status, duration):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.method = method
-        self.url = url
-        self.request = request
-        self.response = response
-        self.status = status
-        self.duration = duration
+    def __init__(self, id, name_key, value_key):
+        self.id = id
+        self.name_key = name_key
+        self.value_key = value_key
 
 
-class DomDrop(Message):
+class DOMDrop(Message):
+    __slots__ = ('timestamp',)
     __id__ = 52
 
     def __init__(self, timestamp):
@@ -541,10 +516,10 @@ class DomDrop(Message):
 
 
 class ResourceTiming(Message):
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator')
     __id__ = 53
 
-    def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size,
-                 decoded_body_size, url, initiator):
+    def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator):
         self.timestamp = timestamp
         self.duration = duration
         self.ttfb = ttfb
@@ -556,29 +531,27 @@ class ResourceTiming(Message):
 
 
 class ConnectionInformation(Message):
+    __slots__ = ('downlink', 'type')
     __id__ = 54
 
-    def __init__(self, downlink, type: str):
+    def __init__(self, downlink, type):
         self.downlink = downlink
         self.type = type
 
 
 class SetPageVisibility(Message):
+    __slots__ = ('hidden',)
     __id__ = 55
 
-    def __init__(self, hidden: bool):
+    def __init__(self, hidden):
         self.hidden = hidden
 
 
 class PerformanceTrackAggr(Message):
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_total_js_heap_size', 'avg_total_js_heap_size', 'max_total_js_heap_size', 'min_used_js_heap_size', 'avg_used_js_heap_size', 'max_used_js_heap_size')
     __id__ = 56
 
-    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps,
-                 max_fps, min_cpu, avg_cpu, max_cpu,
-                 min_total_js_heap_size, avg_total_js_heap_size,
-                 max_total_js_heap_size, min_used_js_heap_size,
-                 avg_used_js_heap_size, max_used_js_heap_size
-                 ):
+    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_total_js_heap_size, avg_total_js_heap_size, max_total_js_heap_size, min_used_js_heap_size, avg_used_js_heap_size, max_used_js_heap_size):
         self.timestamp_start = timestamp_start
         self.timestamp_end = timestamp_end
         self.min_fps = min_fps
@@ -595,11 +568,30 @@ class PerformanceTrackAggr(Message):
         self.max_used_js_heap_size = max_used_js_heap_size
 
 
+class LoadFontFace(Message):
+    __slots__ = ('parent_id', 'family', 'source', 'descriptors')
+    __id__ = 57
+
+    def __init__(self, parent_id, family, source, descriptors):
+        self.parent_id = parent_id
+        self.family = family
+        self.source = source
+        self.descriptors = descriptors
+
+
+class SetNodeFocus(Message):
+    __slots__ = ('id',)
+    __id__ = 58
+
+    def __init__(self, id):
+        self.id = id
+
+
 class LongTask(Message):
+    __slots__ = ('timestamp', 'duration', 'context', 'container_type', 'container_src', 'container_id', 'container_name')
     __id__ = 59
 
-    def __init__(self, timestamp, duration, context, container_type, container_src: str,
-                 container_id: str, container_name: str):
+    def __init__(self, timestamp, duration, context, container_type, container_src, container_id, container_name):
         self.timestamp = timestamp
         self.duration = duration
         self.context = context
@@ -609,30 +601,32 @@ class LongTask(Message):
         self.container_name = container_name
 
 
-class SetNodeURLBasedAttribute(Message):
+class SetNodeAttributeURLBased(Message):
+    __slots__ = ('id', 'name', 'value', 'base_url')
     __id__ = 60
 
-    def __init__(self, id, name: str, value: str, base_url: str):
+    def __init__(self, id, name, value, base_url):
         self.id = id
         self.name = name
         self.value = value
         self.base_url = base_url
 
 
-class SetStyleData(Message):
+class SetCSSDataURLBased(Message):
+    __slots__ = ('id', 'data', 'base_url')
     __id__ = 61
 
-    def __init__(self, id, data: str, base_url: str):
+    def __init__(self, id, data, base_url):
         self.id = id
         self.data = data
         self.base_url = base_url
 
 
-class IssueEvent(Message):
+class IssueEventDeprecated(Message):
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload')
     __id__ = 62
 
-    def __init__(self, message_id, timestamp, type: str, context_string: str,
-                 context: str, payload: str):
+    def __init__(self, message_id, timestamp, type, context_string, context, payload):
         self.message_id = message_id
         self.timestamp = timestamp
         self.type = type
@@ -642,26 +636,25 @@ class IssueEvent(Message):
 
 
 class TechnicalInfo(Message):
+    __slots__ = ('type', 'value')
     __id__ = 63
 
-    def __init__(self, type: str, value: str):
+    def __init__(self, type, value):
         self.type = type
         self.value = value
 
 
 class CustomIssue(Message):
+    __slots__ = ('name', 'payload')
     __id__ = 64
 
-    def __init__(self, name: str, payload: str):
+    def __init__(self, name, payload):
         self.name = name
         self.payload = payload
 
 
-class PageClose(Message):
-    __id__ = 65
-
-
 class AssetCache(Message):
+    __slots__ = ('url',)
     __id__ = 66
 
     def __init__(self, url):
@@ -669,6 +662,7 @@ class AssetCache(Message):
 
 
 class CSSInsertRuleURLBased(Message):
+    __slots__ = ('id', 'rule', 'index', 'base_url')
     __id__ = 67
 
     def __init__(self, id, rule, index, base_url):
@@ -678,17 +672,16 @@ class CSSInsertRuleURLBased(Message):
         self.base_url = base_url
 
 
-class MouseClick(Message):
+class MouseClick(namedtuple('MouseClick', ['id', 'hesitation_time', 'label', 'selector']), Message):
+    __slots__ = ()
     __id__ = 69
 
-    def __init__(self, id, hesitation_time, label: str, selector):
-        self.id = id
-        self.hesitation_time = hesitation_time
-        self.label = label
-        self.selector = selector
+    def to_dict(self) -> dict:
+        return self._asdict()
 
 
 class CreateIFrameDocument(Message):
+    __slots__ = ('frame_id', 'id')
     __id__ = 70
 
     def __init__(self, frame_id, id):
@@ -696,7 +689,95 @@ class CreateIFrameDocument(Message):
         self.id = id
 
 
+class AdoptedSSReplaceURLBased(Message):
+    __slots__ = ('sheet_id', 'text', 'base_url')
+    __id__ = 71
+
+    def __init__(self, sheet_id, text, base_url):
+        self.sheet_id = sheet_id
+        self.text = text
+        self.base_url = base_url
+
+
+class AdoptedSSReplace(Message):
+    __slots__ = ('sheet_id', 'text')
+    __id__ = 72
+
+    def __init__(self, sheet_id, text):
+        self.sheet_id = sheet_id
+        self.text = text
+
+
+class AdoptedSSInsertRuleURLBased(Message):
+    __slots__ = ('sheet_id', 'rule', 'index', 'base_url')
+    __id__ = 73
+
+    def __init__(self, sheet_id, rule, index, base_url):
+        self.sheet_id = sheet_id
+        self.rule = rule
+        self.index = index
+        self.base_url = base_url
+
+
+class AdoptedSSInsertRule(Message):
+    __slots__ = ('sheet_id', 'rule', 'index')
+    __id__ = 74
+
+    def __init__(self, sheet_id, rule, index):
+        self.sheet_id = sheet_id
+        self.rule = rule
+        self.index = index
+
+
+class AdoptedSSDeleteRule(Message):
+    __slots__ = ('sheet_id', 'index')
+    __id__ = 75
+
+    def __init__(self, sheet_id, index):
+        self.sheet_id = sheet_id
+        self.index = index
+
+
+class AdoptedSSAddOwner(Message):
+    __slots__ = ('sheet_id', 'id')
+    __id__ = 76
+
+    def __init__(self, sheet_id, id):
+        self.sheet_id = sheet_id
+        self.id = id
+
+
+class AdoptedSSRemoveOwner(Message):
+    __slots__ = ('sheet_id', 'id')
+    __id__ = 77
+
+    def __init__(self, sheet_id, id):
+        self.sheet_id = sheet_id
+        self.id = id
+
+
+class JSException(Message):
+    __slots__ = ('name', 'message', 'payload', 'metadata')
+    __id__ = 78
+
+    def __init__(self, name, message, payload, metadata):
+        self.name = name
+        self.message = message
+        self.payload = payload
+        self.metadata = metadata
+
+
+class Zustand(Message):
+    __slots__ = ('mutation', 'state')
+    __id__ = 79
+
+    def __init__(self, mutation, state):
+        self.mutation = mutation
+        self.state = state
+
+
 class BatchMeta(Message):
+    __slots__ = ('page_no', 'first_index', 'timestamp')
     __id__ = 80
 
     def __init__(self, page_no, first_index, timestamp):
@@ -704,12 +785,75 @@ class BatchMeta(Message):
         self.first_index = first_index
         self.timestamp = timestamp
 
+
+class BatchMetadata(Message):
+    __slots__ = ('version', 'page_no', 'first_index', 'timestamp', 'location')
+    __id__ = 81
+
+    def __init__(self, version, page_no, first_index, timestamp, location):
+        self.version = version
+        self.page_no = page_no
+        self.first_index = first_index
+        self.timestamp = timestamp
+        self.location = location
+
+
+class PartitionedMessage(Message):
+    __slots__ = ('part_no', 'part_total')
+    __id__ = 82
+
+    def __init__(self, part_no, part_total):
+        self.part_no = part_no
+        self.part_total = part_total
+
+
+class IssueEvent(Message):
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload', 'url')
+    __id__ = 125
+
+    def __init__(self, message_id, timestamp, type, context_string, context, payload, url):
+        self.message_id = message_id
+        self.timestamp = timestamp
+        self.type = type
+        self.context_string = context_string
+        self.context = context
+        self.payload = payload
+        self.url = url
+
+
+class SessionEnd(Message):
+    __slots__ = ('timestamp', 'encryption_key')
+    __id__ = 126
+
+    def __init__(self, timestamp, encryption_key):
+        self.timestamp = timestamp
+        self.encryption_key = encryption_key
+
+
+class SessionSearch(Message):
+    __slots__ = ('timestamp', 'partition')
+    __id__ = 127
+
+    def __init__(self, timestamp, partition):
+        self.timestamp = timestamp
+        self.partition = partition
+
+
+class IOSBatchMeta(Message):
+    __slots__ = ('timestamp', 'length', 'first_index')
+    __id__ = 107
+
+    def __init__(self, timestamp, length, first_index):
+        self.timestamp = timestamp
+        self.length = length
+        self.first_index = first_index
+
+
 class IOSSessionStart(Message):
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_os', 'user_os_version', 'user_device', 'user_device_type', 'user_country')
     __id__ = 90
 
-    def __init__(self, timestamp, project_id, tracker_version: str,
-                 rev_id: str, user_uuid: str, user_os: str, user_os_version: str,
-                 user_device: str, user_device_type: str, user_country: str):
+    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_os, user_os_version, user_device, user_device_type, user_country):
         self.timestamp = timestamp
         self.project_id = project_id
         self.tracker_version = tracker_version
@@ -723,6 +867,7 @@ class IOSSessionStart(Message):
 
 
 class IOSSessionEnd(Message):
+    __slots__ = ('timestamp',)
     __id__ = 91
 
     def __init__(self, timestamp):
@@ -730,9 +875,10 @@ class IOSSessionEnd(Message):
 
 
 class IOSMetadata(Message):
+    __slots__ = ('timestamp', 'length', 'key', 'value')
     __id__ = 92
 
-    def __init__(self, timestamp, length, key: str, value: str):
+    def __init__(self, timestamp, length, key, value):
         self.timestamp = timestamp
         self.length = length
         self.key = key
@@ -740,9 +886,10 @@ class IOSMetadata(Message):
 
 
 class IOSCustomEvent(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'payload')
     __id__ = 93
 
-    def __init__(self, timestamp, length, name: str, payload: str):
+    def __init__(self, timestamp, length, name, payload):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -750,24 +897,27 @@ class IOSCustomEvent(Message):
 
 
 class IOSUserID(Message):
+    __slots__ = ('timestamp', 'length', 'value')
     __id__ = 94
 
-    def __init__(self, timestamp, length, value: str):
+    def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
         self.length = length
         self.value = value
 
 
 class IOSUserAnonymousID(Message):
+    __slots__ = ('timestamp', 'length', 'value')
     __id__ = 95
 
-    def __init__(self, timestamp, length, value: str):
+    def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
         self.length = length
         self.value = value
 
 
 class IOSScreenChanges(Message):
+    __slots__ = ('timestamp', 'length', 'x', 'y', 'width', 'height')
     __id__ = 96
 
     def __init__(self, timestamp, length, x, y, width, height):
@@ -780,9 +930,10 @@ class IOSScreenChanges(Message):
 
 
 class IOSCrash(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'reason', 'stacktrace')
     __id__ = 97
 
-    def __init__(self, timestamp, length, name: str, reason: str, stacktrace):
+    def __init__(self, timestamp, length, name, reason, stacktrace):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -791,6 +942,7 @@ class IOSCrash(Message):
 
 
 class IOSScreenEnter(Message):
+    __slots__ = ('timestamp', 'length', 'title', 'view_name')
     __id__ = 98
 
     def __init__(self, timestamp, length, title, view_name):
@@ -801,9 +953,10 @@ class IOSScreenEnter(Message):
 
 
 class IOSScreenLeave(Message):
+    __slots__ = ('timestamp', 'length', 'title', 'view_name')
     __id__ = 99
 
-    def __init__(self, timestamp, length, title: str, view_name: str):
+    def __init__(self, timestamp, length, title, view_name):
         self.timestamp = timestamp
         self.length = length
         self.title = title
@@ -811,6 +964,7 @@ class IOSScreenLeave(Message):
 
 
 class IOSClickEvent(Message):
+    __slots__ = ('timestamp', 'length', 'label', 'x', 'y')
     __id__ = 100
 
     def __init__(self, timestamp, length, label, x, y):
@@ -822,19 +976,22 @@ class IOSClickEvent(Message):
 
 
 class IOSInputEvent(Message):
+    __slots__ = ('timestamp', 'length', 'value', 'value_masked', 'label')
     __id__ = 101
 
-    def __init__(self, timestamp, length, value: str, value_masked: bool, label: str):
+    def __init__(self, timestamp, length, value, value_masked, label):
         self.timestamp = timestamp
         self.length = length
+        self.value = value
         self.value_masked = value_masked
         self.label = label
 
 
 class IOSPerformanceEvent(Message):
+    __slots__ = ('timestamp', 'length', 'name', 'value')
     __id__ = 102
 
-    def __init__(self, timestamp, length, name: str, value):
+    def __init__(self, timestamp, length, name, value):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -842,9 +999,10 @@ class IOSPerformanceEvent(Message):
 
 
 class IOSLog(Message):
+    __slots__ = ('timestamp', 'length', 'severity', 'content')
     __id__ = 103
 
-    def __init__(self, timestamp, length, severity: str, content: str):
+    def __init__(self, timestamp, length, severity, content):
         self.timestamp = timestamp
         self.length = length
         self.severity = severity
@@ -852,18 +1010,20 @@ class IOSLog(Message):
 
 
 class IOSInternalError(Message):
+    __slots__ = ('timestamp', 'length', 'content')
     __id__ = 104
 
-    def __init__(self, timestamp, length, content: str):
+    def __init__(self, timestamp, length, content):
         self.timestamp = timestamp
         self.length = length
         self.content = content
 
 
 class IOSNetworkCall(Message):
+    __slots__ = ('timestamp', 'length', 'duration', 'headers', 'body', 'url', 'success', 'method', 'status')
     __id__ = 105
 
-    def __init__(self, timestamp, length, duration, headers, body, url, success: bool, method: str, status):
+    def __init__(self, timestamp, length, duration, headers, body, url, success, method, status):
         self.timestamp = timestamp
         self.length = length
         self.duration = duration
@@ -875,23 +1035,11 @@ class IOSNetworkCall(Message):
         self.status = status
 
 
-class IOSBatchMeta(Message):
-    __id__ = 107
-
-    def __init__(self, timestamp, length, first_index):
-        self.timestamp = timestamp
-        self.length = length
-        self.first_index = first_index
-
-
 class IOSPerformanceAggregated(Message):
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_memory', 'avg_memory', 'max_memory', 'min_battery', 'avg_battery', 'max_battery')
     __id__ = 110
 
-    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps,
-                 max_fps, min_cpu, avg_cpu, max_cpu,
-                 min_memory, avg_memory, max_memory,
-                 min_battery, avg_battery, max_battery
-                 ):
+    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_memory, avg_memory, max_memory, min_battery, avg_battery, max_battery):
         self.timestamp_start = timestamp_start
         self.timestamp_end = timestamp_end
         self.min_fps = min_fps
@@ -909,11 +1057,13 @@ class IOSPerformanceAggregated(Message):
 
 
 class IOSIssueEvent(Message):
+    __slots__ = ('timestamp', 'type', 'context_string', 'context', 'payload')
     __id__ = 111
 
-    def __init__(self, timestamp, type: str, context_string: str, context: str, payload: str):
+    def __init__(self, timestamp, type, context_string, context, payload):
         self.timestamp = timestamp
         self.type = type
         self.context_string = context_string
         self.context = context
         self.payload = payload
+
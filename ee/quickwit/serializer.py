@@ -0,0 +1,87 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(s):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def dumps(obj) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson.JSONEncodeError: integers above 64 bits, non str keys...
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_field(value):
+    # request, response and variables are sent as JSON strings, '' when empty
+    if not isinstance(value, str):
+        return value
+    if value == '':
+        return {}
+    return loads(value)
+
+
+def _json_body(container: dict, max_field_size: int):
+    body = container.get('body')
+    if not isinstance(body, str):
+        return
+    if len(body) > max_field_size:
+        container['body'] = body[:max_field_size]
+        return
+    # only bodies looking like a JSON object or array are parsed
+    stripped = body.strip()
+    if stripped[:1] in ('{', '[') and stripped[-1:] in ('}', ']'):
+        try:
+            container['body'] = loads(stripped)
+        except ValueError:
+            pass
+
+
+def fetch_document(data: dict, max_field_size: int) -> dict:
+    doc = dict(data)
+    try:
+        doc['request'] = _json_field(doc['request'])
+        doc['response'] = _json_field(doc['response'])
+    except (KeyError, ValueError) as e:
+        print(f'Error {e}\tWhile decoding fetchevent\nEvent: {data}\n')
+        return doc
+    for field in ('request', 'response'):
+        if isinstance(doc[field], dict):
+            _json_body(doc[field], max_field_size)
+    return doc
+
+
+def graphql_document(data: dict, max_field_size: int) -> dict:
+    doc = dict(data)
+    try:
+        doc['variables'] = _json_field(doc['variables'])
+        doc['response'] = _json_field(doc['response'])
+    except (KeyError, ValueError) as e:
+        print(f'Error {e}\tWhile decoding graphql\nEvent: {data}\n')
+    return doc
+
+
+def write_ndjson(docs, index, out, max_field_size=1_000_000):
+    """
+    Writes the documents of an index as NDJSON into the binary file `out` (the request body buffer),
+    one document at a time. The JSON string fields of the fetch and graphql events are sent parsed,
+    request / response bodies above `max_field_size` characters are truncated and left unparsed.
+    The documents are not modified, a failed request can be serialized again.
+    """
+    for data in docs:
+        if index == 'fetchevent':
+            data = fetch_document(data, max_field_size)
+        elif index == 'graphql':
+            data = graphql_document(data, max_field_size)
+        out.write(dumps(data))
+        out.write(b'\n')
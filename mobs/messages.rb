@@ -1,6 +1,6 @@
 # OpenReplay messages definition
 
-message 0, 'Timestamp' do
+message 0, 'Timestamp', :compact => true do
   uint 'Timestamp'
 end
 message 1, 'SessionStart', :tracker => false, :replayer => false do
@@ -161,7 +161,7 @@ message 30, 'Metadata', :replayer => false do
   string 'Key'
   string 'Value'
 end
-message 31, 'PageEvent', :tracker => false, :replayer => false do
+message 31, 'PageEvent', :tracker => false, :replayer => false, :compact => true do
   uint 'MessageID'
   uint 'Timestamp'
   string 'URL'
@@ -390,7 +390,7 @@ message 67, 'CSSInsertRuleURLBased' do
   string 'BaseURL'
 end
 ## 68
-message 69, 'MouseClick' do
+message 69, 'MouseClick', :compact => true do
   uint 'ID'
   uint 'HesitationTime'
   string 'Label'
@@ -84,14 +84,16 @@ end
 $context = :web
 
 class Message
-  attr_reader :id, :name, :tracker, :replayer, :swift, :seq_index, :attributes, :context
-  def initialize(name:, id:, tracker: $context == :web, replayer: $context == :web, swift: $context == :ios, seq_index: false, &block)
+  attr_reader :id, :name, :tracker, :replayer, :swift, :seq_index, :compact, :attributes, :context
+  def initialize(name:, id:, tracker: $context == :web, replayer: $context == :web, swift: $context == :ios, seq_index: false, compact: false, &block)
     @id = id
     @name = name
     @tracker = tracker
     @replayer = replayer
     @swift = swift
     @seq_index = seq_index
+    # python connectors: generate a tuple based record instead of a __slots__ class
+    @compact = compact
     @context = $context
     @attributes = []
     # opts.each { |key, value| send "#{key}=", value }
@@ -104,7 +106,7 @@ class Message
         name: name,
         type: type,
       )
-      @attributes << Attribute.new(opts)
+      @attributes << Attribute.new(**opts)
     end
   end
 end
@@ -117,7 +119,7 @@ def message(id, name, opts = {}, &block)
   $ids << id
   opts[:id] = id
   opts[:name] = name
-  msg = Message.new(opts, &block)
+  msg = Message.new(**opts, &block)
   $messages << msg
 end
 